@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Compare the aiohttp and HTTP/2 transports of ArubaAPIClient.
+
+Starts a local TLS stub in a separate process that speaks HTTP/2
+(selected via ALPN) and HTTP/1.1, answers device status requests after a
+fixed delay, and counts the connections each backend opens. Requires ``httpx[http2]`` and
+``cryptography``.
+    
+    python scripts/benchmark_transports.py --requests 500 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import json
+import multiprocessing
+import os
+import ssl
+import statistics
+import sys
+import tempfile
+import time
+from functools import partial
+
+import aiohttp
+import h2.config
+import h2.connection
+import h2.events
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from api_client import ArubaAPIClient
+from transport import HTTP2Transport
+
+BODY = json.dumps({"status": "up", "uptime": 86400}).encode()
+
+def write_certificate(directory):
+    """Write a self-signed certificate for 127.0.0.1, returning (cert, key) paths."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ))
+    return cert_path, key_path
+
+class Stub:
+    """HTTP/2 + HTTP/1.1 server answering every request with BODY after ``latency`` seconds."""
+    
+    def __init__(self, latency, connections):
+        self.latency = latency
+        self.connections = connections
+    
+    async def handle(self, reader, writer):
+        with self.connections.get_lock():
+            self.connections.value += 1
+        protocol = writer.get_extra_info("ssl_object").selected_alpn_protocol()
+        try:
+            if protocol == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_http11(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _serve_http11(self, reader, writer):
+        while True:
+            await reader.readuntil(b"\r\n\r\n")
+            await asyncio.sleep(self.latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(BODY), BODY)
+            )
+            await writer.drain()
+    
+    async def _serve_h2(self, reader, writer):
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        
+        async def respond(stream_id):
+            await asyncio.sleep(self.latency)
+            conn.send_headers(stream_id, [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(BODY)))
+            ])
+            conn.send_data(stream_id, BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+        
+        tasks = set()
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            writer.write(conn.data_to_send())
+        for task in tasks:
+            task.cancel()
+
+def run_stub(latency, connections, cert_path, key_path, ports):
+    """Serve the stub until the process is terminated."""
+    server_ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_ssl.load_cert_chain(cert_path, key_path)
+    server_ssl.set_alpn_protocols(["h2", "http/1.1"])
+    
+    async def serve():
+        stub = Stub(latency, connections)
+        server = await asyncio.start_server(stub.handle, "127.0.0.1", 0, ssl=server_ssl)
+        ports.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+    
+    asyncio.run(serve())
+
+async def run_backend(name, connections, base_url, client_ssl, args):
+    connections.value = 0
+    options = {"requests_per_second": 1_000_000, "max_connections": args.max_connections}
+    if name == "aiohttp":
+        options["connector"] = aiohttp.TCPConnector(ssl=client_ssl, limit=args.max_connections)
+    else:
+        options["transport"] = partial(HTTP2Transport, verify=client_ssl)
+    
+    latencies = []
+    
+    async def one(i):
+        started = time.perf_counter()
+        await client.get_device_status(f"AP-{i}")
+        latencies.append(time.perf_counter() - started)
+    
+    async with ArubaAPIClient(base_url, "benchmark_key_123", **options) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - started
+    if name == "aiohttp":
+        await options["connector"].close()
+    
+    latencies.sort()
+    return {
+        "backend": name,
+        "seconds": elapsed,
+        "requests_per_second": args.requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "connections": connections.value
+    }
+
+async def main(args):
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = write_certificate(directory)
+        client_ssl = ssl.create_default_context(cafile=cert_path)
+        
+        connections = multiprocessing.Value("i", 0)
+        ports = multiprocessing.Queue()
+        stub = multiprocessing.Process(
+            target=run_stub,
+            args=(args.latency, connections, cert_path, key_path, ports),
+            daemon=True
+        )
+        stub.start()
+        base_url = f"https://127.0.0.1:{ports.get(timeout=10)}"
+        
+        results = []
+        try:
+            for name in ("aiohttp", "http2"):
+                results.append(await run_backend(name, connections, base_url, client_ssl, args))
+        finally:
+            stub.terminate()
+            stub.join()
+    
+    print(f"{args.requests} concurrent requests, {args.latency * 1000:.0f} ms server latency, "
+          f"max_connections={args.max_connections}")
+    print(f"{'backend':<10}{'seconds':>10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'conns':>8}")
+    for r in results:
+        print(f"{r['backend']:<10}{r['seconds']:>10.3f}{r['requests_per_second']:>10.0f}"
+              f"{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['connections']:>8}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500, help="Concurrent requests per backend")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency in seconds")
+    parser.add_argument("--max-connections", type=int, default=10, help="Client connection limit")
+    asyncio.run(main(parser.parse_args()))
@@ -3,21 +3,127 @@ Enhanced API client for HPE Aruba services with improved security and error hand
 """
 
 import asyncio
+import hashlib
 import logging
+import os
 import re
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin, urlparse, urlencode
+import time
+from typing import Dict, Any, Optional, List, Iterable, AsyncIterator, Tuple, Union, Mapping, NamedTuple, Callable, Awaitable, Coroutine, TypeVar
+from fnmatch import fnmatchcase
+from urllib.parse import urljoin, urlparse, urlencode, parse_qsl
 import aiohttp
 
+try:
+    from .rate_limiter import AdaptiveRateLimiter, retry_after_from_headers
+    from .response_cache import ResponseCache
+    from .singleflight import SingleFlight
+    from .retry import RetryPolicy, RetryBudget, IDEMPOTENT_METHODS
+    from .pagination import Paginator
+    from .codec import JSONCodec, get_default_codec
+    from .metrics import ClientMetrics, normalize_endpoint
+    from .tracing import RequestTracer
+    from .circuit_breaker import CircuitBreaker, is_failure
+    from .scheduler import PriorityScheduler, CRITICAL, INTERACTIVE, BULK
+    from .hedging import Hedger
+    from .batching import MicroBatcher
+    from .streaming import JSONArrayStream
+    from .auth import TokenProvider
+    from .content_encoding import accept_encoding, compress_body, encoded_size
+    from .deadline import detached as deadline_detached, remaining as deadline_remaining
+except ImportError:  # loaded as a top-level module (e.g. by the test suite)
+    from rate_limiter import AdaptiveRateLimiter, retry_after_from_headers
+    from response_cache import ResponseCache
+    from singleflight import SingleFlight
+    from retry import RetryPolicy, RetryBudget, IDEMPOTENT_METHODS
+    from pagination import Paginator
+    from codec import JSONCodec, get_default_codec
+    from metrics import ClientMetrics, normalize_endpoint
+    from tracing import RequestTracer
+    from circuit_breaker import CircuitBreaker, is_failure
+    from scheduler import PriorityScheduler, CRITICAL, INTERACTIVE, BULK
+    from hedging import Hedger
+    from batching import MicroBatcher
+    from streaming import JSONArrayStream
+    from auth import TokenProvider
+    from content_encoding import accept_encoding, compress_body, encoded_size
+    from deadline import detached as deadline_detached, remaining as deadline_remaining
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 class ValidationError(Exception):
     """Raised when input validation fails"""
     pass
 
 class APIError(Exception):
     """Raised when API requests fail"""
-    pass
+    
+    def __init__(
+        self,
+        message: str = "",
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+class CircuitOpenError(APIError):
+    """Raised without contacting the API while an endpoint's circuit is open"""
+    
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"Circuit open for {endpoint}, retry in {retry_after:.1f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+class DeadlineExceeded(APIError):
+    """Raised when a request cannot finish before the caller's deadline"""
+    
+    def __init__(self, endpoint: str):
+        super().__init__(f"Deadline exceeded for {endpoint}")
+        self.endpoint = endpoint
+
+class _Response(NamedTuple):
+    """Status, headers and parsed body of a completed request"""
+    status: int
+    headers: Mapping[str, str]
+    data: Any
+
+class _FileBody:
+    """Request body streamed from a file, reopened for every attempt"""
+    
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None
+    ):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.size = os.path.getsize(path)
+    
+    async def stream(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_event_loop()
+        sent = 0
+        with open(self.path, 'rb') as f:
+            while True:
+                chunk = await loop.run_in_executor(None, f.read, self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+                sent += len(chunk)
+                if self.progress is not None:
+                    self.progress(sent, self.size)
+
+def _parse_content_range(value: str) -> Tuple[int, Optional[int]]:
+    """Start offset and total size from a Content-Range header."""
+    match = re.match(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)', value.strip())
+    if not match:
+        return 0, None
+    start, total = match.groups()
+    return int(start or 0), None if total == '*' else int(total)
 
 class ArubaAPIClient:
     """
@@ -26,7 +132,17 @@ class ArubaAPIClient:
     Features:
     - HTTPS enforcement
     - Input validation
-    - Rate limiting
+    - Rate limiting (serialized, or concurrent with a token bucket)
+    - Optional GET response caching with conditional revalidation
+    - Optional coalescing of identical in-flight GET requests
+    - Retries with jittered exponential backoff under a retry budget
+    - Per-endpoint request metrics (Prometheus text or snapshot dict)
+    - Optional connection-phase tracing (DNS, connect, TTFB)
+    - Optional per-endpoint circuit breaking during upstream outages
+    - Priority admission: security actions preempt bulk polling
+    - Optional hedging of slow GETs to cut tail latency
+    - Optional micro-batching of isolate/quarantine calls into bulk requests
+    - Streaming of large list responses item by item
     - Secure error handling
     - Thread safety
     """
@@ -37,27 +153,190 @@ class ArubaAPIClient:
     # Device ID validation pattern
     DEVICE_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,50}$')
     
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30):
+    # Route templates of per-device endpoints (patterns), first match wins;
+    # device IDs without digits are not recognized by normalize_endpoint
+    ROUTE_TEMPLATES = {
+        "/api/v2/devices/*/status": "/api/v2/devices/{id}/status"
+    }
+    
+    # Priority classes of endpoints (patterns), first match wins
+    DEFAULT_PRIORITIES = {
+        "/api/v2/devices/isolate": CRITICAL,
+        "/api/v2/devices/quarantine": CRITICAL
+    }
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_connections: int = 10,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Mapping[str, RetryPolicy]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        codec: Optional[JSONCodec] = None,
+        metrics: Optional[ClientMetrics] = None,
+        tracer: Optional[RequestTracer] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        priorities: Optional[Mapping[str, str]] = None,
+        priority_weights: Optional[Mapping[str, int]] = None,
+        hedger: Optional[Hedger] = None,
+        batch_window: Optional[float] = None,
+        max_batch_size: int = 50,
+        token_provider: Optional[TokenProvider] = None,
+        compress_requests_above: Optional[int] = None,
+        transport: Optional[Callable[..., Any]] = None,
+        cache_namespace: Optional[str] = None
+    ):
         """
         Initialize the API client.
         
+        By default requests are serialized behind a lock with a fixed
+        ``rate_limit_delay`` between them. Passing ``requests_per_second``
+        enables concurrent mode: requests overlap up to ``max_connections``
+        and are admitted by a token bucket sized to the tenant quota, whose
+        pacing then follows the rate-limit headers Central returns.
+        
+        In both modes requests are admitted by priority class: ``critical``
+        requests (isolate and quarantine by default) take the next free
+        slot ahead of everything else, while ``interactive`` (the default)
+        and ``bulk`` requests share the rest by weight.
+        
         Args:
             base_url: Base URL for the API (must use HTTPS)
-            api_key: API authentication key
+            api_key: API authentication key (not used with token_provider)
             timeout: Request timeout in seconds
+            requests_per_second: Tenant request quota; enables concurrent mode
+            burst: Token bucket capacity (defaults to requests_per_second)
+            max_connections: Connection pool size
+            cache: Response cache for GET requests, in memory or on disk
+                (SQLiteResponseCache); disabled when None
+            coalesce_requests: Share one upstream call between identical
+                concurrent GETs
+            retry_policy: Default retry policy
+            retry_policies: Retry policies per endpoint pattern
+                (e.g. ``/api/v2/devices/*/status``), first match wins
+            retry_budget: Retry budget, can be shared between clients
+            connector: Shared connector (e.g. from ClientRegistry); the
+                client does not close it and max_connections is ignored
+            codec: JSON codec (defaults to the fastest installed library)
+            metrics: Metrics registry, can be shared between clients
+            tracer: Records DNS/connect/TTFB timings of every request
+            circuit_breaker: Fails requests to an endpoint fast while its
+                circuit is open (disabled when None)
+            priorities: Priority classes per endpoint pattern, checked
+                before DEFAULT_PRIORITIES
+            priority_weights: Admission weights of the interactive and
+                bulk classes
+            hedger: Hedges slow GETs (requires concurrent mode)
+            batch_window: Seconds to collect isolate/quarantine calls into
+                one bulk request (disabled when None)
+            max_batch_size: Maximum devices per bulk request
+            token_provider: Supplies expiring access tokens; a request
+                rejected with 401 is replayed once with a refreshed token
+            compress_requests_above: Gzip request bodies larger than this
+                many bytes (disabled when None, and after the server
+                rejects a compressed body with 415)
+            transport: Session factory called with ``headers``, ``timeout``
+                and ``max_connections`` (e.g. HTTP2Transport); defaults to
+                an aiohttp session
+            cache_namespace: Separates this client's cache entries from
+                those of other tenants sharing the cache; defaults to a
+                digest of api_key and is required with a token_provider
             
         Raises:
-            ValueError: If base_url doesn't use HTTPS or api_key is invalid
+            ValueError: If base_url doesn't use HTTPS, api_key is invalid,
+                hedging is requested in serialized mode, a connector or
+                tracer is combined with a custom transport or a cache is
+                used with a token_provider but without cache_namespace
         """
         self._validate_base_url(base_url)
-        self._validate_api_key(api_key)
+        if token_provider is None:
+            self._validate_api_key(api_key)
         
         self.base_url = base_url.rstrip('/')
         self._api_key = api_key
+        self.token_provider = token_provider
+        self.compress_requests_above = compress_requests_above
+        
+        if transport is not None and (connector is not None or tracer is not None):
+            raise ValueError("connector and tracer require the aiohttp transport")
+        self._transport = transport
         self.timeout = timeout
         self.session: Optional[aiohttp.ClientSession] = None
         self._lock = asyncio.Lock()
         self.rate_limit_delay = 0.1
+        
+        if not isinstance(max_connections, int) or max_connections < 1:
+            raise ValueError("max_connections must be a positive integer")
+        self.max_connections = max_connections
+        
+        self._rate_limiter: Optional[AdaptiveRateLimiter] = None
+        if requests_per_second is not None:
+            self._rate_limiter = AdaptiveRateLimiter(requests_per_second, burst)
+        
+        if cache_namespace is None and api_key is not None and token_provider is None:
+            # Never the key itself: cache files are shared between processes
+            cache_namespace = hashlib.sha256(api_key.encode()).hexdigest()
+        if cache is not None and cache_namespace is None:
+            raise ValueError("cache_namespace is required to cache responses with a token_provider")
+        self.cache = cache
+        self._cache_namespace = cache_namespace
+        self._singleflight: Optional[SingleFlight] = SingleFlight() if coalesce_requests else None
+        
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_policies = dict(retry_policies or {})
+        self.retry_budget = retry_budget or RetryBudget()
+        self._connector = connector
+        self.codec = codec or get_default_codec()
+        self.metrics = metrics or ClientMetrics()
+        self.tracer = tracer
+        self.circuit_breaker = circuit_breaker
+        
+        self.priorities = dict(priorities or {})
+        for priority in self.priorities.values():
+            if priority not in (CRITICAL, INTERACTIVE, BULK):
+                raise ValueError(f"Invalid priority: {priority}")
+        if self._rate_limiter is not None:
+            self._scheduler = PriorityScheduler(
+                self._rate_limiter.acquire, self._rate_limiter.refund, priority_weights
+            )
+        else:
+            # Serialized mode: the admission is the lock, held for the request
+            self._scheduler = PriorityScheduler(
+                self._lock.acquire, self._lock.release, priority_weights
+            )
+        
+        if hedger is not None and self._rate_limiter is None:
+            raise ValueError("Hedging requires concurrent mode (requests_per_second)")
+        self.hedger = hedger
+        
+        self._action_batcher: Optional[MicroBatcher] = None
+        if batch_window is not None:
+            self._action_batcher = MicroBatcher(
+                self._send_device_actions, max_batch_size, batch_window
+            )
+    
+    @property
+    def concurrent(self) -> bool:
+        """Whether requests are admitted concurrently by the token bucket."""
+        return self._rate_limiter is not None
+    
+    def rate_limit_status(self) -> Optional[Dict[str, Any]]:
+        """
+        Current rate-limit view learned from response headers.
+        
+        Returns:
+            Limiter snapshot, or None in serialized mode
+        """
+        if self._rate_limiter is None:
+            return None
+        return self._rate_limiter.status()
     
     def _validate_base_url(self, base_url: str) -> None:
         """Validate base URL format and security."""
@@ -122,19 +401,36 @@ class ArubaAPIClient:
     
     async def __aenter__(self):
         """Async context manager entry."""
+        headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': 'HPE-Aruba-Automation/1.0',
+            'Accept-Encoding': accept_encoding()
+        }
+        if self.token_provider is None:
+            headers['Authorization'] = f'Bearer {self._api_key}'
+        
+        if self._transport is not None:
+            self.session = self._transport(
+                headers=headers, timeout=self.timeout, max_connections=self.max_connections
+            )
+            return self
+        
         self.session = aiohttp.ClientSession(
-            headers={
-                'Authorization': f'Bearer {self._api_key}',
-                'Content-Type': 'application/json',
-                'User-Agent': 'HPE-Aruba-Automation/1.0'
-            },
+            headers=headers,
             timeout=aiohttp.ClientTimeout(total=self.timeout),
-            connector=aiohttp.TCPConnector(limit=10)  # Connection pooling
+            # Connection pooling: a shared connector outlives this client
+            connector=self._connector or aiohttp.TCPConnector(limit=self.max_connections),
+            connector_owner=self._connector is None,
+            trace_configs=[self.tracer.trace_config()] if self.tracer else None
         )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        if self._action_batcher is not None:
+            await self._action_batcher.flush()
+        if self.token_provider is not None:
+            await self.token_provider.close()
         if self.session:
             await self.session.close()
     
@@ -167,7 +463,11 @@ class ArubaAPIClient:
         method: str, 
         endpoint: str, 
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, str]] = None
+        params: Optional[Dict[str, str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+        raw: bool = False,
+        priority: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request with comprehensive error handling.
@@ -177,9 +477,15 @@ class ArubaAPIClient:
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
+            retry_policy: Retry policy overriding the endpoint's policy
+            idempotent: Whether the request is safe to repeat (defaults
+                to True for GET, HEAD, OPTIONS, PUT and DELETE)
+            raw: Return the response body as undecoded bytes (bypasses
+                the response cache)
+            priority: Priority class overriding the endpoint's class
             
         Returns:
-            JSON response data
+            JSON response data, or bytes when ``raw`` is set
             
         Raises:
             APIError: If request fails
@@ -192,51 +498,488 @@ class ArubaAPIClient:
             encoded_params = urlencode(params)
             url = f"{url}?{encoded_params}"
         
-        async with self._lock:
+        policy = retry_policy or self._retry_policy_for(endpoint)
+        if priority is None:
+            priority = self._priority_for(endpoint)
+        elif priority not in (CRITICAL, INTERACTIVE, BULK):
+            raise ValidationError(f"Invalid priority: {priority}")
+        
+        if method == 'GET' and data is None:
+            if self._singleflight is not None:
+                key = self._request_key(method, url)
+                return await self._shared(endpoint, self._singleflight.do(
+                    f"raw {key}" if raw else key,
+                    lambda: self._get(url, endpoint, policy, raw, priority)
+                ))
+            return await self._get(url, endpoint, policy, raw, priority)
+        
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        
+        response = await self._dispatch(
+            method, url, endpoint, data, policy=policy, idempotent=idempotent, raw=raw,
+            priority=priority
+        )
+        return response.data
+    
+    def _retry_policy_for(self, endpoint: str) -> RetryPolicy:
+        """Resolve the retry policy configured for an endpoint."""
+        path = endpoint.split('?', 1)[0]
+        for pattern, policy in self.retry_policies.items():
+            if fnmatchcase(path, pattern):
+                return policy
+        return self.retry_policy
+    
+    def _route_template(self, endpoint: str) -> str:
+        """Route template of an endpoint, grouping paths that differ only by device."""
+        path = endpoint.split('?', 1)[0]
+        for pattern, template in self.ROUTE_TEMPLATES.items():
+            if fnmatchcase(path, pattern):
+                return template
+        return normalize_endpoint(path)
+    
+    def _priority_for(self, endpoint: str) -> str:
+        """Resolve the priority class configured for an endpoint."""
+        path = endpoint.split('?', 1)[0]
+        for rules in (self.priorities, self.DEFAULT_PRIORITIES):
+            for pattern, priority in rules.items():
+                if fnmatchcase(path, pattern):
+                    return priority
+        return INTERACTIVE
+    
+    def priority_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Admission statistics per priority class.
+        
+        Returns:
+            Queued requests, admissions and worst admission wait per class
+        """
+        return self._scheduler.stats()
+    
+    async def _get(
+        self,
+        url: str,
+        endpoint: str,
+        policy: RetryPolicy,
+        raw: bool = False,
+        priority: str = INTERACTIVE
+    ) -> Any:
+        """Perform a GET, through the response cache when one applies."""
+        if not raw and self.cache is not None and self.cache.ttl_for(endpoint) > 0:
+            return await self._cached_get(url, endpoint, policy, priority)
+        
+        response = await self._dispatch('GET', url, endpoint, policy=policy, raw=raw, priority=priority)
+        return response.data
+    
+    @staticmethod
+    def _request_key(method: str, url: str) -> str:
+        """Normalize a request into a cache key (query parameters sorted)."""
+        parsed = urlparse(url)
+        query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+        return f"{method} {parsed.scheme}://{parsed.netloc}{parsed.path}?{query}"
+    
+    async def _cached_get(
+        self,
+        url: str,
+        endpoint: str,
+        policy: RetryPolicy,
+        priority: str = INTERACTIVE
+    ) -> Any:
+        """
+        Serve a GET from the response cache, revalidating stale entries.
+        
+        Args:
+            url: Complete request URL
+            endpoint: API endpoint path used for TTL lookup
+            policy: Retry policy for the upstream request
+            priority: Priority class of the upstream request
+            
+        Returns:
+            JSON response data
+        """
+        key = f"{self._cache_namespace} {self._request_key('GET', url)}"
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.is_fresh():
+            return entry.data
+        
+        validators = entry.validators() if entry is not None else None
+        response = await self._dispatch(
+            'GET', url, endpoint, headers=validators, policy=policy, priority=priority
+        )
+        
+        if response.status == 304 and entry is not None:
+            self.cache.revalidated(key, endpoint, response.headers)
+            return entry.data
+        
+        self.cache.store(key, endpoint, response.data, response.headers)
+        return response.data
+    
+    async def _dispatch(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        policy: Optional[RetryPolicy] = None,
+        idempotent: bool = True,
+        raw: bool = False,
+        priority: str = INTERACTIVE,
+        consume: Optional[Callable[[aiohttp.ClientResponse], Awaitable[None]]] = None
+    ) -> _Response:
+        """
+        Send a request under the rate limiter, retrying per the retry policy.
+        
+        Retries are limited by ``policy.max_attempts`` and by the client's
+        retry budget. After a 429 the wait is at least the server's advice;
+        in concurrent mode the limiter pauses admission for every caller.
+        With a circuit breaker, each attempt must be admitted by the
+        endpoint's circuit and its outcome is recorded there. With a
+        hedger, slow GET attempts race a second copy of the request. With
+        a token provider, a 401 refreshes the token (once for all requests
+        that failed on it) and the request is replayed without counting as
+        a retry. Inside a ``deadline()`` block, attempts are cancelled when
+        the budget runs out and no backoff outlasting it is started.
+        
+        Args:
+            method: Validated HTTP method
+            url: Complete request URL
+            endpoint: API endpoint (used for logging)
+            data: Request body data
+            headers: Extra request headers
+            policy: Retry policy (defaults to the client policy)
+            idempotent: Whether the request is safe to repeat
+            raw: Keep the response body as bytes
+            priority: Priority class used for admission
+            consume: Reads a successful response's body instead of the
+                client (the returned data is then None)
+            
+        Returns:
+            Completed response
+            
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            DeadlineExceeded: If the deadline passes first
+            APIError: If request fails
+        """
+        policy = policy or self.retry_policy
+        self.retry_budget.record_request()
+        route = self._route_template(endpoint)
+        circuit = self.circuit_breaker.circuit_for(route) if self.circuit_breaker else None
+        
+        token: Optional[str] = None
+        replayed = False
+        attempt = 0
+        while True:
+            attempt += 1
+            if circuit is not None and not circuit.allow():
+                raise CircuitOpenError(circuit.name, circuit.retry_after())
+            
+            try:
+                # Built per attempt: callers may update their headers between attempts
+                attempt_headers = headers
+                if self.token_provider is not None:
+                    token = await self.token_provider.get_token()
+                    attempt_headers = {**(headers or {}), 'Authorization': f'Bearer {token}'}
+                
+                if self.hedger is not None and method == 'GET' and consume is None:
+                    pending = self.hedger.run(route, lambda: self._attempt(
+                        method, url, endpoint, data, attempt_headers, raw, priority
+                    ))
+                else:
+                    pending = self._attempt(
+                        method, url, endpoint, data, attempt_headers, raw, priority, consume
+                    )
+                response = await self._within_deadline(endpoint, pending)
+            except DeadlineExceeded:
+                if circuit is not None:
+                    circuit.release()
+                raise
+            except APIError as e:
+                if circuit is not None:
+                    if is_failure(e.status_code):
+                        circuit.record_failure()
+                    else:
+                        circuit.record_success()
+                
+                if e.status_code == 401 and self.token_provider is not None and not replayed:
+                    # Every request that failed on this token shares one refresh
+                    await self.token_provider.refresh(stale=token)
+                    replayed = True
+                    attempt -= 1
+                    continue
+                
+                retry_after = 0.0
+                if e.status_code == 429:
+                    if self._rate_limiter is not None:
+                        # The limiter delays every caller's next admission
+                        self._rate_limiter.on_rate_limited(e.headers)
+                    else:
+                        retry_after = retry_after_from_headers(e.headers)
+                
+                if attempt >= policy.max_attempts or not policy.is_retryable(
+                    e.status_code, e.__cause__, idempotent
+                ):
+                    raise
+                
+                if not self.retry_budget.try_spend():
+                    logger.warning("Retry budget exhausted", extra={
+                        "endpoint": endpoint,
+                        "method": method,
+                        "attempt": attempt
+                    })
+                    raise
+                
+                delay = max(policy.backoff(attempt), retry_after)
+                budget = deadline_remaining()
+                if budget is not None and delay >= budget:
+                    raise DeadlineExceeded(endpoint) from e
+                
+                self.metrics.record_retry(method, route)
+                logger.warning("Retrying request in %.2fs", delay, extra={
+                    "endpoint": endpoint,
+                    "method": method,
+                    "attempt": attempt,
+                    "status_code": e.status_code
+                })
+                await asyncio.sleep(delay)
+            except BaseException:
+                if circuit is not None:
+                    circuit.release()
+                raise
+            else:
+                if circuit is not None:
+                    circuit.record_success()
+                return response
+    
+    async def _shared(self, endpoint: str, operation: Coroutine[Any, Any, T]) -> T:
+        """
+        Await work shared with other callers under this caller's deadline only.
+        
+        The operation starts outside any deadline, so the work it joins or
+        starts (a coalesced request, a batch) runs to completion for the
+        other callers; only this caller's wait is cut short.
+        """
+        with deadline_detached():
+            waiter = asyncio.ensure_future(operation)
+        return await self._within_deadline(endpoint, waiter)
+    
+    async def _within_deadline(self, endpoint: str, pending: Awaitable[T]) -> T:
+        """Await an attempt, cancelling it when the current deadline passes."""
+        budget = deadline_remaining()
+        if budget is None:
+            return await pending
+        
+        if budget <= 0:
+            if asyncio.isfuture(pending):
+                pending.cancel()
+            else:
+                pending.close()
+            raise DeadlineExceeded(endpoint)
+        
+        try:
+            return await asyncio.wait_for(pending, budget)
+        except asyncio.TimeoutError:
+            # Request timeouts surface as APIError, so this is the deadline
+            raise DeadlineExceeded(endpoint) from None
+    
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        priority: str = INTERACTIVE,
+        consume: Optional[Callable[[aiohttp.ClientResponse], Awaitable[None]]] = None
+    ) -> _Response:
+        """Make one attempt, admitted by priority through the lock or the rate limiter."""
+        if self._rate_limiter is None:
+            waited = time.monotonic()
+            await self._scheduler.acquire(priority)  # holds self._lock
             try:
                 await asyncio.sleep(self.rate_limit_delay)
+                self.metrics.record_rate_limit_wait(time.monotonic() - waited)
+                return await self._measured_send(method, url, endpoint, data, headers, raw, consume)
+            finally:
+                self._lock.release()
+        
+        self.metrics.record_rate_limit_wait(await self._scheduler.acquire(priority))
+        return await self._measured_send(method, url, endpoint, data, headers, raw, consume)
+    
+    async def _measured_send(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        consume: Optional[Callable[[aiohttp.ClientResponse], Awaitable[None]]] = None
+    ) -> _Response:
+        """Send a request and record its outcome and latency."""
+        status_code = None
+        cancelled = False
+        self.metrics.request_started()
+        started = time.monotonic()
+        try:
+            response = await self._send_request(method, url, endpoint, data, headers, raw, consume)
+            status_code = response.status
+            return response
+        except APIError as e:
+            status_code = e.status_code
+            raise
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if cancelled:
+                # Abandoned (e.g. a losing hedge) rather than failed
+                self.metrics.request_cancelled()
+            else:
+                self.metrics.request_finished(
+                    method, self._route_template(endpoint), status_code, time.monotonic() - started
+                )
+    
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        consume: Optional[Callable[[aiohttp.ClientResponse], Awaitable[None]]] = None
+    ) -> _Response:
+        """
+        Send a single HTTP request and map the response.
+        
+        Args:
+            method: Validated HTTP method
+            url: Complete request URL
+            endpoint: API endpoint (used for logging)
+            data: Request body data
+            headers: Extra request headers
+            raw: Keep the response body as bytes
+            consume: Reads a successful response's body instead
+            
+        Returns:
+            Completed response
+            
+        Raises:
+            APIError: If request fails
+        """
+        try:
+            if isinstance(data, _FileBody):
+                body = data.stream()
+            else:
+                body = self.codec.dumps(data) if data is not None else None
+            compressed = None
+            if (
+                isinstance(body, bytes)
+                and self.compress_requests_above is not None
+                and len(body) > self.compress_requests_above
+            ):
+                compressed = compress_body(body)
+            send_headers = headers
+            if compressed is not None:
+                send_headers = {**(headers or {}), 'Content-Encoding': 'gzip'}
+            
+            options: Dict[str, Any] = {}
+            if self.tracer is not None:
+                options["trace_request_ctx"] = {"endpoint": self._route_template(endpoint)}
+            if consume is not None:
+                # A streamed body may take longer than the total timeout;
+                # bound the wait for each read instead
+                options["timeout"] = aiohttp.ClientTimeout(total=None, sock_read=self.timeout)
+            
+            async with self.session.request(
+                method, url, data=compressed or body, headers=send_headers, **options
+            ) as response:
+                if compressed is not None:
+                    if response.status == 415:
+                        # The server does not accept compressed bodies
+                        logger.warning("Request compression rejected, disabling it", extra={
+                            "endpoint": endpoint
+                        })
+                        self.compress_requests_above = None
+                        return await self._send_request(method, url, endpoint, data, headers, raw, consume)
+                    self.metrics.record_compression("request", len(compressed), len(body))
                 
-                async with self.session.request(method, url, json=data) as response:
-                    # Handle rate limiting
-                    if response.status == 429:
-                        retry_after = int(response.headers.get('Retry-After', 60))
-                        logger.warning(f"Rate limited, retrying after {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        return await self._make_request(method, endpoint, data, params)
-                    
-                    # Parse response
+                # Handle rate limiting
+                if response.status == 429:
+                    logger.warning("Rate limited", extra={
+                        "endpoint": endpoint,
+                        "method": method
+                    })
+                    raise APIError(
+                        f"{self._format_error_message(429)} (Status: 429)",
+                        status_code=429,
+                        headers=response.headers
+                    )
+                
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update_from_headers(response.headers)
+                
+                if response.status == 304:
+                    return _Response(response.status, response.headers, None)
+                
+                if consume is not None and response.status < 400:
+                    await consume(response)
+                    self._record_response_compression(response, getattr(response.content, "total_bytes", None))
+                    return _Response(response.status, response.headers, None)
+                
+                # Parse response
+                payload = await response.read()
+                self._record_response_compression(response, len(payload))
+                if raw:
+                    response_data = payload
+                elif not payload.strip():
+                    response_data = None
+                else:
                     try:
-                        response_data = await response.json()
-                    except aiohttp.ContentTypeError:
+                        response_data = self.codec.loads(payload)
+                    except ValueError:
                         response_data = {"error": "Invalid JSON response"}
+                
+                # Handle errors
+                if response.status >= 400:
+                    error_msg = self._format_error_message(response.status)
                     
-                    # Handle errors
-                    if response.status >= 400:
-                        error_msg = self._format_error_message(response.status)
-                        
-                        logger.error("API request failed", extra={
-                            "status_code": response.status,
-                            "endpoint": endpoint,
-                            "method": method,
-                            "error_type": "api_error"
-                        })
-                        
-                        raise APIError(f"{error_msg} (Status: {response.status})")
-                    
-                    return response_data
+                    logger.error("API request failed", extra={
+                        "status_code": response.status,
+                        "endpoint": endpoint,
+                        "method": method,
+                        "error_type": "api_error"
+                    })
                     
-            except aiohttp.ClientError as e:
-                logger.error("Network connection failed", extra={
-                    "endpoint": endpoint,
-                    "error_type": type(e).__name__
-                })
-                raise APIError("Network connection failed")
-            except asyncio.TimeoutError:
-                logger.error("Request timeout", extra={
-                    "endpoint": endpoint,
-                    "timeout": self.timeout
-                })
-                raise APIError("Request timeout")
+                    raise APIError(
+                        f"{error_msg} (Status: {response.status})",
+                        status_code=response.status,
+                        headers=response.headers
+                    )
+                
+                return _Response(response.status, response.headers, response_data)
+                
+        except aiohttp.ClientError as e:
+            logger.error("Network connection failed", extra={
+                "endpoint": endpoint,
+                "error_type": type(e).__name__
+            })
+            raise APIError("Network connection failed") from e
+        except asyncio.TimeoutError as e:
+            logger.error("Request timeout", extra={
+                "endpoint": endpoint,
+                "timeout": self.timeout
+            })
+            raise APIError("Request timeout") from e
+    
+    def _record_response_compression(self, response: aiohttp.ClientResponse, decoded: Optional[int]) -> None:
+        """Report the size of a content-encoded response body before and after decoding."""
+        encoded = encoded_size(response)
+        if encoded is not None and decoded is not None:
+            self.metrics.record_compression("response", encoded, decoded)
     
     def _format_error_message(self, status_code: int) -> str:
         """Format user-friendly error message based on status code."""
@@ -268,6 +1011,64 @@ class ArubaAPIClient:
         self.validate_device_id(device_id)
         return await self._make_request('GET', f'/api/v2/devices/{device_id}/status')
     
+    async def iter_device_statuses(
+        self,
+        device_ids: Iterable[str],
+        concurrency: int = 10
+    ) -> AsyncIterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+        """
+        Fetch status for many devices with bounded concurrency.
+        
+        Results are yielded in completion order as they arrive, so callers
+        can start processing before the whole fleet has been polled. A
+        failing device yields its exception (``ValidationError`` or
+        ``APIError``) instead of aborting the batch. ``device_ids`` is
+        consumed lazily, and at most ``concurrency`` results are buffered
+        ahead of the caller. Requests run in the ``bulk`` priority class.
+        
+        Args:
+            device_ids: Device identifiers to query
+            concurrency: Maximum number of requests in flight
+            
+        Yields:
+            Tuples of (device_id, status data or exception)
+            
+        Raises:
+            ValidationError: If concurrency is invalid
+        """
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValidationError("concurrency must be a positive integer")
+        
+        pending = iter(device_ids)
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        finished = object()
+        
+        async def worker() -> None:
+            for device_id in pending:
+                try:
+                    self.validate_device_id(device_id)
+                    result = await self._make_request(
+                        'GET', f'/api/v2/devices/{device_id}/status', priority=BULK
+                    )
+                except Exception as e:
+                    result = e
+                await results.put((device_id, result))
+            await results.put(finished)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            active = len(workers)
+            while active:
+                item = await results.get()
+                if item is finished:
+                    active -= 1
+                    continue
+                yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
     async def isolate_device(
         self, 
         device_id: str, 
@@ -276,6 +1077,9 @@ class ArubaAPIClient:
         """
         Isolate a device for security purposes.
         
+        With ``batch_window`` set, the call joins a bulk ``mass_isolate``
+        request and returns this device's entry of its ``details``.
+        
         Args:
             device_id: Device to isolate
             rollback_timer: Automatic rollback time in seconds (max 86400)
@@ -289,6 +1093,12 @@ class ArubaAPIClient:
             if not isinstance(rollback_timer, int) or not (0 <= rollback_timer <= 86400):
                 raise ValidationError("rollback_timer must be between 0 and 86400 seconds")
         
+        if self._action_batcher is not None:
+            return await self._shared(
+                '/api/v2/devices/isolate',
+                self._action_batcher.submit(("isolate", rollback_timer), device_id)
+            )
+        
         data = {
             "device_id": device_id,
             "action": "isolate",
@@ -305,6 +1115,9 @@ class ArubaAPIClient:
         """
         Quarantine a device.
         
+        With ``batch_window`` set, the call joins a bulk ``mass_quarantine``
+        request and returns this device's entry of its ``details``.
+        
         Args:
             device_id: Device to quarantine
             reason: Reason for quarantine
@@ -317,6 +1130,12 @@ class ArubaAPIClient:
         if reason and len(reason) > 200:
             raise ValidationError("Reason too long (max 200 characters)")
         
+        if self._action_batcher is not None:
+            return await self._shared(
+                '/api/v2/devices/quarantine',
+                self._action_batcher.submit(("quarantine", reason), device_id)
+            )
+        
         data = {
             "device_id": device_id,
             "action": "quarantine",
@@ -325,6 +1144,40 @@ class ArubaAPIClient:
         
         return await self._make_request('POST', '/api/v2/devices/quarantine', data)
     
+    async def _send_device_actions(
+        self,
+        key: Tuple[str, Any],
+        device_ids: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Send batched isolate or quarantine calls as one bulk request.
+        
+        Args:
+            key: Action (``isolate`` or ``quarantine``) and its option
+                (rollback timer or reason)
+            device_ids: Devices to act on
+            
+        Returns:
+            Each device's entry from the response's ``details``, or an
+            APIError for devices the response does not mention
+        """
+        action, option = key
+        data = {"device_ids": device_ids, "action": f"mass_{action}"}
+        data["rollback_timer" if action == "isolate" else "reason"] = option
+        
+        response = await self._make_request('POST', f'/api/v2/devices/{action}', data)
+        
+        details = response.get("details") if isinstance(response, dict) else None
+        outcomes = {
+            detail["device_id"]: detail
+            for detail in details or []
+            if isinstance(detail, dict) and "device_id" in detail
+        }
+        return {
+            device_id: outcomes.get(device_id) or APIError(f"No {action} result for device in bulk response")
+            for device_id in device_ids
+        }
+    
     async def get_threats(
         self, 
         limit: int = 100, 
@@ -346,9 +1199,330 @@ class ArubaAPIClient:
         params = {"limit": str(limit)}
         
         if severity:
-            valid_severities = {"low", "medium", "high", "critical"}
-            if severity.lower() not in valid_severities:
-                raise ValidationError(f"Invalid severity: {severity}")
-            params["severity"] = severity.lower()
+            params["severity"] = self._validate_severity(severity)
+        
+        return await self._make_request('GET', '/api/v2/security/threats', params=params)
+    
+    def _validate_severity(self, severity: str) -> str:
+        """Validate and normalize a threat severity filter."""
+        valid_severities = {"low", "medium", "high", "critical"}
+        if severity.lower() not in valid_severities:
+            raise ValidationError(f"Invalid severity: {severity}")
+        return severity.lower()
+    
+    def paginate(
+        self,
+        endpoint: str,
+        items_key: str,
+        page_size: int = 100,
+        params: Optional[Dict[str, str]] = None,
+        priority: Optional[str] = None,
+        **options: Any
+    ) -> Paginator:
+        """
+        Iterate over every item of a paginated list endpoint.
+        
+        Args:
+            endpoint: API endpoint
+            items_key: Response key holding each page's items
+            page_size: Items requested per page
+            params: Extra query parameters sent with every page
+            priority: Priority class of the page requests
+            **options: Further Paginator options (style, max_items,
+                stop_when, cursor_param, next_cursor_key, ...)
+            
+        Returns:
+            Async iterator over the items
+        """
+        async def fetch_page(page_params: Dict[str, str]) -> Dict[str, Any]:
+            return await self._make_request('GET', endpoint, params=page_params, priority=priority)
+        
+        return Paginator(fetch_page, items_key, page_size=page_size, params=params, **options)
+    
+    async def stream_items(
+        self,
+        endpoint: str,
+        items_path: str,
+        params: Optional[Dict[str, str]] = None,
+        priority: Optional[str] = None,
+        chunk_size: int = 64 * 1024,
+        max_buffered: int = 100
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the items of a large list response as they arrive.
+        
+        The body is parsed incrementally from the socket and the items of
+        the array at ``items_path`` are yielded one by one, so memory stays
+        flat however large the response is. At most ``max_buffered``
+        parsed items wait for the caller. The request is retried like any
+        GET until the first item has been yielded; a failure after that
+        raises ``APIError`` instead of yielding duplicates. Responses are
+        not cached, coalesced or hedged.
+        
+        Streaming requires concurrent mode: in serialized mode the request
+        would hold the client's only slot until the caller finished the
+        loop, so any request made from inside the loop could never run.
+        
+        Args:
+            endpoint: API endpoint
+            items_path: Dotted key path of the items array (e.g.
+                ``devices`` or ``data.items``)
+            params: Query parameters
+            priority: Priority class overriding the endpoint's class
+            chunk_size: Bytes read from the socket at a time
+            max_buffered: Parsed items buffered ahead of the caller
+            
+        Yields:
+            Items of the array
+            
+        Raises:
+            ValidationError: In serialized mode or if max_buffered is invalid
+            APIError: If the request fails or the body is malformed
+        """
+        if self._rate_limiter is None:
+            raise ValidationError("stream_items requires concurrent mode (requests_per_second)")
+        
+        if not isinstance(max_buffered, int) or max_buffered < 1:
+            raise ValidationError("max_buffered must be a positive integer")
+        
+        url = self._construct_url(endpoint)
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        if priority is None:
+            priority = self._priority_for(endpoint)
+        
+        items: asyncio.Queue = asyncio.Queue(maxsize=max_buffered)
+        finished = object()
+        delivered = 0
+        
+        async def consume(response: aiohttp.ClientResponse) -> None:
+            nonlocal delivered
+            parser = JSONArrayStream(items_path)
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    for item in parser.feed(chunk):
+                        await items.put(item)
+                        delivered += 1
+                for item in parser.close():
+                    await items.put(item)
+                    delivered += 1
+            except ValueError:
+                raise APIError("Invalid JSON response", status_code=response.status) from None
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if not delivered:
+                    raise  # nothing yielded yet, safe to retry
+                logger.error("Stream interrupted", extra={"endpoint": endpoint, "items": delivered})
+                raise APIError(f"Stream interrupted after {delivered} items") from None
+            
+            if not parser.found:
+                # Otherwise indistinguishable from an empty list
+                raise APIError(f"No array at '{items_path}' in response", status_code=response.status)
+        
+        async def produce() -> None:
+            cancelled = False
+            try:
+                await self._dispatch(
+                    'GET', url, endpoint, policy=self._retry_policy_for(endpoint),
+                    priority=priority, consume=consume
+                )
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                # A cancelled producer has no reader left; the queue may be full
+                if not cancelled:
+                    await items.put(finished)
+        
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await items.get()
+                if item is finished:
+                    break
+                yield item
+            await producer
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+    
+    async def download_to(
+        self,
+        endpoint: str,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+        priority: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = 256 * 1024,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None
+    ) -> int:
+        """
+        Download a response body straight to a file.
+        
+        The body is written chunk by chunk to ``<path>.part``, which is
+        renamed to ``path`` when complete, so memory use does not depend
+        on the artifact size. With ``resume``, an existing ``.part`` file
+        (e.g. from an interrupted run) is continued with a Range request;
+        retries after a broken transfer resume the same way. A server
+        ignoring the range sends the whole body, which then replaces the
+        partial file.
+        
+        Args:
+            endpoint: API endpoint
+            path: Destination file
+            params: Query parameters
+            priority: Priority class overriding the endpoint's class
+            resume: Continue a partial download
+            chunk_size: Bytes read and written at a time
+            progress: Called with (bytes written, total size or None)
+            
+        Returns:
+            Size of the downloaded file
+            
+        Raises:
+            APIError: If the download fails
+        """
+        url = self._construct_url(endpoint)
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        if priority is None:
+            priority = self._priority_for(endpoint)
+        
+        part_path = f"{path}.part"
+        if not resume and os.path.exists(part_path):
+            os.remove(part_path)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        
+        # Ranges refer to the encoded body; ask for it unencoded
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+        
+        loop = asyncio.get_event_loop()
+        
+        async def consume(response: aiohttp.ClientResponse) -> None:
+            start, total = 0, None
+            if response.status == 206:
+                start, total = _parse_content_range(response.headers.get('Content-Range', ''))
+            elif response.headers.get('Content-Length', '').isdigit():
+                total = int(response.headers['Content-Length'])
+            
+            with open(part_path, 'r+b' if os.path.exists(part_path) else 'wb') as f:
+                f.truncate(start)
+                f.seek(start)
+                written = start
+                try:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        await loop.run_in_executor(None, f.write, chunk)
+                        written += len(chunk)
+                        if progress is not None:
+                            progress(written, total)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    # The retry continues where this attempt stopped
+                    if resume and written:
+                        headers['Range'] = f'bytes={written}-'
+                    raise
+        
+        try:
+            await self._dispatch(
+                'GET', url, endpoint, headers=headers, policy=self._retry_policy_for(endpoint),
+                priority=priority, consume=consume
+            )
+        except APIError as e:
+            # 416: the partial file is already complete
+            if e.status_code != 416 or 'Range' not in headers:
+                raise
+            _, total = _parse_content_range(e.headers.get('Content-Range', ''))
+            if total != os.path.getsize(part_path):
+                raise
+        
+        os.replace(part_path, path)
+        return os.path.getsize(path)
+    
+    async def upload_from(
+        self,
+        endpoint: str,
+        path: str,
+        method: str = 'POST',
+        params: Optional[Dict[str, str]] = None,
+        content_type: str = 'application/octet-stream',
+        priority: Optional[str] = None,
+        chunk_size: int = 256 * 1024,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None
+    ) -> Any:
+        """
+        Upload a file as the request body without reading it into memory.
+        
+        The file is sent in chunks with its size as Content-Length.
+        Retries (PUT, or a POST rejected with 429) resend it from the start.
+        
+        Args:
+            endpoint: API endpoint
+            path: File to upload
+            method: HTTP method (POST or PUT)
+            params: Query parameters
+            content_type: Content-Type of the body
+            priority: Priority class overriding the endpoint's class
+            chunk_size: Bytes read and sent at a time
+            progress: Called with (bytes sent, file size)
+            
+        Returns:
+            JSON response data
+            
+        Raises:
+            ValidationError: If the method does not take a body
+            APIError: If the upload fails
+        """
+        method = self.validate_http_method(method)
+        if method not in ('POST', 'PUT', 'PATCH'):
+            raise ValidationError(f"Cannot upload with {method}")
+        
+        url = self._construct_url(endpoint)
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        if priority is None:
+            priority = self._priority_for(endpoint)
+        
+        body = _FileBody(path, chunk_size, progress)
+        response = await self._dispatch(
+            method, url, endpoint, body,
+            headers={'Content-Type': content_type, 'Content-Length': str(body.size)},
+            policy=self._retry_policy_for(endpoint),
+            idempotent=method in IDEMPOTENT_METHODS,
+            priority=priority
+        )
+        return response.data
+    
+    def iter_threats(
+        self,
+        severity: Optional[str] = None,
+        page_size: int = 1000,
+        max_items: Optional[int] = None,
+        stop_when: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Paginator:
+        """
+        Iterate over all threats, page by page.
+        
+        Args:
+            severity: Filter by severity level
+            page_size: Threats requested per page (max 1000)
+            max_items: Stop after this many threats
+            stop_when: Predicate that ends iteration at the first matching threat
+            
+        Returns:
+            Async iterator over threat records
+        """
+        if not isinstance(page_size, int) or not (1 <= page_size <= 1000):
+            raise ValidationError("page_size must be between 1 and 1000")
+        
+        params = {}
+        if severity:
+            params["severity"] = self._validate_severity(severity)
         
-        return await self._make_request('GET', '/api/v2/security/threats', params=params)
\ No newline at end of file
+        return self.paginate(
+            '/api/v2/security/threats',
+            'threats',
+            page_size=page_size,
+            params=params,
+            max_items=max_items,
+            stop_when=stop_when
+        )
\ No newline at end of file
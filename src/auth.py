@@ -0,0 +1,279 @@
+"""
+Access-token providers for the HPE Aruba API client.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+class TokenRefreshError(Exception):
+    """Raised when a new access token cannot be obtained"""
+    pass
+
+@dataclass(frozen=True)
+class AccessToken:
+    """An access token and when it expires (epoch seconds, so it can be shared between processes)."""
+    access_token: str
+    expires_at: float
+    refresh_token: Optional[str] = None
+    obtained_at: float = 0.0
+    
+    def remaining(self) -> float:
+        """Seconds until expiry."""
+        return self.expires_at - time.time()
+    
+    def refresh_due_in(self, margin: float) -> float:
+        """
+        Seconds until a proactive refresh is due.
+        
+        The refresh happens ``margin`` seconds before expiry, or halfway
+        through the lifetime for tokens shorter than twice the margin.
+        """
+        lifetime = self.expires_at - self.obtained_at
+        return self.remaining() - min(margin, max(lifetime, 0.0) / 2)
+
+class FileTokenStore:
+    """
+    Persists a token as JSON so other processes can reuse it.
+    
+    Writes are atomic (temporary file and rename), and the file is only
+    readable by its owner.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def load(self) -> Optional[AccessToken]:
+        """Read the stored token, or None if there is no usable one."""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return AccessToken(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+    
+    def save(self, token: AccessToken) -> None:
+        """Store a token, replacing the previous one."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token-")
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(asdict(token), f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+class TokenProvider:
+    """Supplies the bearer token for API requests."""
+    
+    async def get_token(self) -> str:
+        """Current access token."""
+        raise NotImplementedError
+    
+    async def refresh(self, stale: Optional[str] = None) -> str:
+        """
+        Replace a token the API rejected.
+        
+        Args:
+            stale: The rejected token; nothing is refreshed if the current
+                token is already a different, valid one
+                
+        Returns:
+            Access token to use from now on
+        """
+        raise NotImplementedError
+    
+    async def close(self) -> None:
+        """Stop background work."""
+
+class StaticTokenProvider(TokenProvider):
+    """A fixed API key that is never refreshed."""
+    
+    def __init__(self, api_key: str):
+        self._api_key = api_key
+    
+    async def get_token(self) -> str:
+        return self._api_key
+    
+    async def refresh(self, stale: Optional[str] = None) -> str:
+        return self._api_key
+
+class OAuthTokenProvider(TokenProvider):
+    """
+    OAuth access token that is renewed before it expires.
+    
+    A background task refreshes the token ``refresh_margin`` seconds
+    before expiry, so requests normally never see an expired token. All
+    refreshes are single-flight: concurrent callers (e.g. many requests
+    failing with 401 at once) share one refresh. With a store, refreshed
+    tokens are persisted, and a still-valid token found in the store
+    (written by another process) is adopted instead of refreshing again.
+    """
+    
+    def __init__(
+        self,
+        refresh: Callable[[Optional[AccessToken]], Awaitable[AccessToken]],
+        token: Optional[AccessToken] = None,
+        store: Optional[FileTokenStore] = None,
+        refresh_margin: float = 300.0,
+        retry_interval: float = 30.0
+    ):
+        """
+        Initialize the provider.
+        
+        Args:
+            refresh: Coroutine obtaining a new token from the current one
+                (which carries the refresh token)
+            token: Initial token (otherwise loaded from the store, or
+                obtained on first use)
+            store: Persistence shared with other processes
+            refresh_margin: Seconds before expiry to refresh proactively
+            retry_interval: Seconds between background refresh attempts
+                after a failure
+        """
+        self._refresh = refresh
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self._token = token or (store.load() if store else None)
+        self._refreshing: Optional["asyncio.Task[AccessToken]"] = None
+        self._background: Optional["asyncio.Task[None]"] = None
+        self.refreshes = 0
+    
+    @property
+    def token(self) -> Optional[AccessToken]:
+        return self._token
+    
+    async def get_token(self) -> str:
+        token = self._token
+        if token is None or token.remaining() <= 0:
+            await self.refresh(token.access_token if token else None)
+        self._ensure_background()
+        return self._token.access_token
+    
+    async def refresh(self, stale: Optional[str] = None) -> str:
+        current = self._token
+        if current is not None and current.remaining() > 0 and current.access_token != stale:
+            return current.access_token
+        
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._do_refresh())
+            self._refreshing.add_done_callback(self._refresh_done)
+        
+        # Shielded so a cancelled caller does not abort the shared refresh
+        token = await asyncio.shield(self._refreshing)
+        return token.access_token
+    
+    def _refresh_done(self, task: "asyncio.Task[AccessToken]") -> None:
+        self._refreshing = None
+        if not task.cancelled():
+            task.exception()  # retrieved by the waiting callers
+    
+    async def _do_refresh(self) -> AccessToken:
+        current = self._token
+        
+        if self.store is not None:
+            stored = self.store.load()
+            if (
+                stored is not None
+                and (current is None or stored.access_token != current.access_token)
+                and stored.refresh_due_in(self.refresh_margin) > 0
+            ):
+                self._token = stored
+                return stored
+        
+        try:
+            token = await self._refresh(current)
+        except Exception as e:
+            logger.error("Token refresh failed", extra={"error_type": type(e).__name__})
+            raise
+        
+        self._token = token
+        self.refreshes += 1
+        if self.store is not None:
+            try:
+                self.store.save(token)
+            except OSError as e:
+                logger.warning("Could not persist token", extra={"error_type": type(e).__name__})
+        return token
+    
+    def _ensure_background(self) -> None:
+        if self._background is None or self._background.done():
+            self._background = asyncio.ensure_future(self._refresh_ahead())
+    
+    async def _refresh_ahead(self) -> None:
+        """Refresh shortly before each expiry until closed."""
+        while True:
+            token = self._token
+            delay = token.refresh_due_in(self.refresh_margin) if token else 0.0
+            await asyncio.sleep(max(delay, 0.0))
+            try:
+                await self.refresh(self._token.access_token if self._token else None)
+            except Exception:
+                await asyncio.sleep(self.retry_interval)
+    
+    async def close(self) -> None:
+        if self._background is not None:
+            self._background.cancel()
+            await asyncio.gather(self._background, return_exceptions=True)
+            self._background = None
+
+def central_token_refresher(
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    timeout: float = 30.0
+) -> Callable[[Optional[AccessToken]], Awaitable[AccessToken]]:
+    """
+    Build a refresh function for Aruba Central's OAuth token endpoint.
+    
+    Args:
+        token_url: Token endpoint (e.g. ``https://<cluster>/oauth2/token``)
+        client_id: API client ID
+        client_secret: API client secret
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Coroutine function for ``OAuthTokenProvider(refresh=...)``
+    """
+    async def refresh(current: Optional[AccessToken]) -> AccessToken:
+        if current is None or not current.refresh_token:
+            raise TokenRefreshError("No refresh token available")
+        
+        params = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "grant_type": "refresh_token",
+            "refresh_token": current.refresh_token
+        }
+        try:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+                async with session.post(token_url, params=params) as response:
+                    if response.status != 200:
+                        raise TokenRefreshError(f"Token refresh failed (Status: {response.status})")
+                    payload = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise TokenRefreshError("Token refresh failed") from e
+        
+        now = time.time()
+        return AccessToken(
+            access_token=payload["access_token"],
+            expires_at=now + float(payload.get("expires_in", 7200)),
+            refresh_token=payload.get("refresh_token", current.refresh_token),
+            obtained_at=now
+        )
+    
+    return refresh
@@ -0,0 +1,129 @@
+"""
+Micro-batching of per-item calls into bulk requests.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set
+
+class MicroBatcher:
+    """
+    Collects individual calls for a short window and sends them as one.
+    
+    Calls sharing a key (e.g. the action and its options) are grouped.
+    A group is sent when it reaches ``max_batch_size`` distinct items or
+    ``max_delay`` seconds after its first item arrived, whichever comes
+    first. Every caller gets its own item's outcome; duplicate items in a
+    group are sent once and share the outcome.
+    """
+    
+    def __init__(
+        self,
+        send_batch: Callable[[Hashable, List[str]], Awaitable[Dict[str, Any]]],
+        max_batch_size: int = 50,
+        max_delay: float = 0.02
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            send_batch: Coroutine sending one group; must return an outcome
+                for every item, where an exception instance is raised to
+                that item's callers
+            max_batch_size: Maximum distinct items per request
+            max_delay: Seconds a group waits for more items
+            
+        Raises:
+            ValueError: If the size or delay is invalid
+        """
+        if not isinstance(max_batch_size, int) or max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative")
+        
+        self._send_batch = send_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: Dict[Hashable, Dict[str, List["asyncio.Future[Any]"]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._in_flight: Set["asyncio.Task[None]"] = set()
+        self.calls = 0
+        self.batches = 0
+        self.items = 0
+    
+    async def submit(self, key: Hashable, item: str) -> Any:
+        """
+        Add an item to its group and wait for its outcome.
+        
+        Args:
+            key: Group key; items with equal keys share a request
+            item: Item identifier
+            
+        Returns:
+            The item's outcome from the bulk request
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Any]" = loop.create_future()
+        batch = self._pending.setdefault(key, {})
+        batch.setdefault(item, []).append(future)
+        self.calls += 1
+        
+        if len(batch) >= self.max_batch_size:
+            self._start(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_delay, self._start, key)
+        
+        return await future
+    
+    def _start(self, key: Hashable) -> None:
+        """Send a group now."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        
+        task = asyncio.ensure_future(self._send(key, batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+    
+    async def _send(self, key: Hashable, batch: Dict[str, List["asyncio.Future[Any]"]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            outcomes = await self._send_batch(key, list(batch))
+        except asyncio.CancelledError:
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as e:
+            outcomes = {item: e for item in batch}
+        
+        for item, futures in batch.items():
+            outcome = outcomes.get(item)
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+    
+    async def flush(self) -> None:
+        """Send every waiting group and wait for all bulk requests to finish."""
+        for key in list(self._pending):
+            self._start(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Calls, bulk requests and the average items per request."""
+        return {
+            "calls": self.calls,
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0
+        }
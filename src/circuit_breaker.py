@@ -0,0 +1,226 @@
+"""
+Per-endpoint circuit breakers for the HPE Aruba API client.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+try:
+    from .metrics import normalize_endpoint
+except ImportError:  # loaded as a top-level module (e.g. by the test suite)
+    from metrics import normalize_endpoint
+
+logger = logging.getLogger(__name__)
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+def is_failure(status_code: Optional[int]) -> bool:
+    """
+    Whether an outcome counts against the circuit.
+    
+    Server errors and transport failures (no status) do; client errors and
+    429s do not, since the upstream is healthy and rate limiting is handled
+    by the limiter.
+    """
+    return status_code is None or status_code >= 500
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """
+    When a circuit opens and how it recovers.
+    
+    A closed circuit opens once at least ``minimum_requests`` of the last
+    ``window`` outcomes are recorded and the share of failures among them
+    reaches ``failure_rate_threshold``. After ``cooldown`` seconds it lets
+    ``half_open_max_calls`` trial requests through; if they all succeed it
+    closes, and any failure opens it again.
+    """
+    failure_rate_threshold: float = 0.5
+    minimum_requests: int = 10
+    window: int = 20
+    cooldown: float = 30.0
+    half_open_max_calls: int = 1
+    
+    def __post_init__(self):
+        if not 0 < self.failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        
+        if not isinstance(self.window, int) or self.window < 1:
+            raise ValueError("window must be a positive integer")
+        
+        if not isinstance(self.minimum_requests, int) or not 1 <= self.minimum_requests <= self.window:
+            raise ValueError("minimum_requests must be between 1 and window")
+        
+        if self.cooldown < 0:
+            raise ValueError("cooldown must be non-negative")
+        
+        if not isinstance(self.half_open_max_calls, int) or self.half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be a positive integer")
+
+class Circuit:
+    """State of one circuit (closed, open or half-open)."""
+    
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.config = config
+        self._clock = clock
+        self._state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=config.window)
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self.times_opened = 0
+        self.rejected = 0
+    
+    @property
+    def state(self) -> str:
+        """Current state; an open circuit turns half-open after the cool-down."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.config.cooldown:
+            self._transition(HALF_OPEN)
+            self._trials = 0
+            self._trial_successes = 0
+        return self._state
+    
+    def retry_after(self) -> float:
+        """Seconds until an open circuit admits a trial request."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.config.cooldown - (self._clock() - self._opened_at))
+    
+    def allow(self) -> bool:
+        """
+        Admit a request, reserving a trial slot when half-open.
+        
+        Every admitted request must be followed by ``record_success()``,
+        ``record_failure()`` or ``release()``.
+        
+        Returns:
+            False if the request must fail fast
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        
+        if state == HALF_OPEN and self._trials < self.config.half_open_max_calls:
+            self._trials += 1
+            return True
+        
+        self.rejected += 1
+        return False
+    
+    def record_success(self) -> None:
+        if self._state == HALF_OPEN:
+            self._trial_successes += 1
+            if self._trial_successes >= self.config.half_open_max_calls:
+                self._outcomes.clear()
+                self._transition(CLOSED)
+            return
+        self._outcomes.append(True)
+    
+    def record_failure(self) -> None:
+        if self._state == HALF_OPEN:
+            self._open()
+            return
+        
+        self._outcomes.append(False)
+        if self._state == CLOSED and len(self._outcomes) >= self.config.minimum_requests:
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.config.failure_rate_threshold:
+                self._open()
+    
+    def release(self) -> None:
+        """Return a trial slot whose request ended without an outcome (e.g. cancelled)."""
+        if self._state == HALF_OPEN and self._trials > 0:
+            self._trials -= 1
+    
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self.times_opened += 1
+        self._transition(OPEN)
+    
+    def _transition(self, state: str) -> None:
+        if state != self._state:
+            logger.warning("Circuit %s", state, extra={
+                "endpoint": self.name,
+                "previous_state": self._state
+            })
+            self._state = state
+    
+    def stats(self) -> Dict[str, Any]:
+        failures = self._outcomes.count(False)
+        return {
+            "state": self.state,
+            "failure_rate": failures / len(self._outcomes) if self._outcomes else 0.0,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after()
+        }
+
+class CircuitBreaker:
+    """
+    Circuit breakers keyed by endpoint template.
+    
+    Endpoints are normalized (``/api/v2/devices/AP-1/status`` ->
+    ``/api/v2/devices/{id}/status``) so one failing route is isolated
+    without affecting the rest of the API. Callers that know the route
+    template should pass it, since identifiers without digits are not
+    recognized by normalization. After ``max_circuits`` distinct
+    templates further ones share a single ``other`` circuit, so the
+    number of circuits stays bounded.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_circuits: int = 200
+    ):
+        """
+        Initialize the breaker.
+        
+        Args:
+            config: Thresholds shared by every circuit
+            clock: Monotonic time source
+            max_circuits: Maximum distinct endpoint templates
+        """
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self.max_circuits = max_circuits
+        self._circuits: Dict[str, Circuit] = {}
+    
+    def circuit_for(self, endpoint: str) -> Circuit:
+        """
+        Get or create the circuit guarding an endpoint.
+        
+        Args:
+            endpoint: API endpoint path or route template
+            
+        Returns:
+            Circuit for the endpoint's template
+        """
+        template = normalize_endpoint(endpoint)
+        circuit = self._circuits.get(template)
+        if circuit is None:
+            if len(self._circuits) >= self.max_circuits:
+                template = "other"
+                circuit = self._circuits.get(template)
+                if circuit is not None:
+                    return circuit
+            circuit = self._circuits[template] = Circuit(template, self.config, self._clock)
+        return circuit
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-template circuit state."""
+        return {name: circuit.stats() for name, circuit in sorted(self._circuits.items())}
@@ -0,0 +1,98 @@
+"""
+JSON codecs for the HPE Aruba API client.
+"""
+
+import json
+from typing import Any, Optional
+
+# Optional fast JSON backends
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+class JSONCodec:
+    """JSON codec backed by the standard library."""
+    
+    name = "json"
+    
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+        
+        Args:
+            data: UTF-8 encoded JSON
+            
+        Returns:
+            Decoded object
+            
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        return json.loads(data)
+    
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as compact UTF-8 JSON.
+        
+        Args:
+            obj: Object to encode
+            
+        Returns:
+            Encoded JSON
+        """
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson."""
+    
+    name = "orjson"
+    
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+    
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+class UjsonCodec(JSONCodec):
+    """JSON codec backed by ujson."""
+    
+    name = "ujson"
+    
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("ujson is not installed")
+    
+    def loads(self, data: bytes) -> Any:
+        return ujson.loads(data)
+    
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+_default_codec: Optional[JSONCodec] = None
+
+def get_default_codec() -> JSONCodec:
+    """
+    Return the fastest installed codec (orjson, then ujson, then stdlib).
+    
+    Returns:
+        Shared codec instance
+    """
+    global _default_codec
+    if _default_codec is None:
+        if orjson is not None:
+            _default_codec = OrjsonCodec()
+        elif ujson is not None:
+            _default_codec = UjsonCodec()
+        else:
+            _default_codec = JSONCodec()
+    return _default_codec
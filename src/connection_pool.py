@@ -0,0 +1,195 @@
+"""
+Shared connection pools for HPE Aruba API clients.
+"""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+try:
+    from .api_client import ArubaAPIClient
+except ImportError:  # loaded as a top-level module (e.g. by the test suite)
+    from api_client import ArubaAPIClient
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Tuning for a shared TCP connector."""
+    limit: int = 100
+    limit_per_host: int = 20
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 300
+    keepalive_timeout: float = 30.0
+    enable_cleanup_closed: bool = True
+    
+    def __post_init__(self):
+        if not isinstance(self.limit, int) or self.limit < 0:
+            raise ValueError("limit must be a non-negative integer")
+        
+        if not isinstance(self.limit_per_host, int) or self.limit_per_host < 0:
+            raise ValueError("limit_per_host must be a non-negative integer")
+        
+        if self.keepalive_timeout < 0:
+            raise ValueError("keepalive_timeout must be non-negative")
+
+class ClientRegistry:
+    """
+    Process-wide registry of connection pools for ArubaAPIClient.
+    
+    Clients created through the registry for the same base URL and
+    credentials share one tuned ``TCPConnector``, so short-lived clients
+    (e.g. one per workflow run) reuse keep-alive connections instead of
+    paying TCP and TLS setup on every run. Connectors are owned by the
+    registry and stay open until ``close()``.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[PoolConfig] = None,
+        host_limits: Optional[Mapping[str, int]] = None
+    ):
+        """
+        Initialize the registry.
+        
+        Args:
+            config: Default connector tuning
+            host_limits: Per-host connection limits overriding
+                ``config.limit_per_host`` (keyed by host name)
+        """
+        self.config = config or PoolConfig()
+        self.host_limits = dict(host_limits or {})
+        self._connectors: Dict[Tuple[str, str], aiohttp.TCPConnector] = {}
+    
+    @staticmethod
+    def _pool_key(base_url: str, api_key: str) -> Tuple[str, str]:
+        """Key pools by origin and a digest of the credentials (never the key itself)."""
+        parsed = urlparse(base_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}".lower()
+        return origin, hashlib.sha256(api_key.encode()).hexdigest()
+    
+    def connector_for(self, base_url: str, api_key: str) -> aiohttp.TCPConnector:
+        """
+        Get or create the shared connector for a base URL and credentials.
+        
+        Must be called while an event loop is running.
+        
+        Args:
+            base_url: API base URL
+            api_key: API authentication key
+            
+        Returns:
+            Shared TCP connector
+        """
+        key = self._pool_key(base_url, api_key)
+        connector = self._connectors.get(key)
+        if connector is None or connector.closed:
+            host = urlparse(base_url).hostname or ""
+            connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.host_limits.get(host, self.config.limit_per_host),
+                use_dns_cache=self.config.use_dns_cache,
+                ttl_dns_cache=self.config.ttl_dns_cache,
+                keepalive_timeout=self.config.keepalive_timeout,
+                enable_cleanup_closed=self.config.enable_cleanup_closed
+            )
+            self._connectors[key] = connector
+        return connector
+    
+    def client(self, base_url: str, api_key: str, **kwargs: Any) -> ArubaAPIClient:
+        """
+        Create a client that uses the shared pool for its base URL and credentials.
+        
+        Args:
+            base_url: API base URL
+            api_key: API authentication key
+            **kwargs: Further ArubaAPIClient options
+            
+        Returns:
+            API client (use it as an async context manager as usual)
+        """
+        return ArubaAPIClient(
+            base_url,
+            api_key,
+            connector=self.connector_for(base_url, api_key),
+            **kwargs
+        )
+    
+    async def warm_up(
+        self,
+        base_url: str,
+        api_key: str,
+        connections: int = 4,
+        path: str = "/",
+        method: str = "OPTIONS"
+    ) -> int:
+        """
+        Open pooled connections ahead of the first real request.
+        
+        Issues ``connections`` concurrent lightweight requests so that the
+        pool holds that many established (TCP + TLS) keep-alive
+        connections. Response status is irrelevant; failures are logged
+        and skipped. OPTIONS is the default because aiohttp does not
+        return connections used for HEAD requests to the pool.
+        
+        Args:
+            base_url: API base URL
+            api_key: API authentication key
+            connections: Number of connections to establish
+            path: Path to request
+            method: HTTP method used for the probe requests
+            
+        Returns:
+            Number of connections successfully established
+        """
+        connector = self.connector_for(base_url, api_key)
+        url = base_url.rstrip('/') + '/' + path.lstrip('/')
+        
+        async with aiohttp.ClientSession(connector=connector, connector_owner=False) as session:
+            async def probe() -> bool:
+                try:
+                    async with session.request(method, url, allow_redirects=False) as response:
+                        await response.read()
+                    return True
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning("Connection warm-up failed", extra={
+                        "host": urlparse(base_url).hostname,
+                        "error_type": type(e).__name__
+                    })
+                    return False
+            
+            results = await asyncio.gather(*(probe() for _ in range(connections)))
+        
+        return sum(results)
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-origin pool limits (credentials are not included)."""
+        return {
+            f"{origin}#{digest[:8]}": {
+                "limit": connector.limit,
+                "limit_per_host": connector.limit_per_host,
+                "closed": connector.closed
+            }
+            for (origin, digest), connector in self._connectors.items()
+        }
+    
+    async def close(self) -> None:
+        """Close every shared connector."""
+        connectors = list(self._connectors.values())
+        self._connectors.clear()
+        for connector in connectors:
+            await connector.close()
+
+_default_registry: Optional[ClientRegistry] = None
+
+def get_registry() -> ClientRegistry:
+    """Return the process-wide default registry, creating it on first use."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ClientRegistry()
+    return _default_registry
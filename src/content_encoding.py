@@ -0,0 +1,58 @@
+"""
+HTTP content-encoding support for the HPE Aruba API client.
+"""
+
+import gzip
+from typing import Any, Optional
+
+# Brotli responses can only be decoded (by aiohttp) when one of these is installed
+try:
+    import brotlicffi as brotli
+except ImportError:
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+def accept_encoding() -> str:
+    """Value of the Accept-Encoding header for the installed decoders."""
+    encodings = ["gzip", "deflate"]
+    if brotli is not None:
+        encodings.append("br")
+    return ", ".join(encodings)
+
+def compress_body(body: bytes, level: int = 6) -> Optional[bytes]:
+    """
+    Gzip a request body.
+    
+    Args:
+        body: Encoded request body
+        level: Compression level (1-9)
+        
+    Returns:
+        Compressed body, or None if compression does not make it smaller
+    """
+    compressed = gzip.compress(body, compresslevel=level)
+    return compressed if len(compressed) < len(body) else None
+
+def encoded_size(response: Any) -> Optional[int]:
+    """
+    Bytes received on the wire for a content-encoded response body.
+    
+    Args:
+        response: Response whose body has been read
+        
+    Returns:
+        Encoded size, or None if the body was not encoded or its size is unknown
+    """
+    encoding = response.headers.get("Content-Encoding", "").strip().lower()
+    if encoding in ("", "identity"):
+        return None
+    
+    # Counted by aiohttp before decompression (recent versions only)
+    size = getattr(response.content, "total_raw_bytes", None)
+    if isinstance(size, int) and size > 0:
+        return size
+    
+    length = response.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else None
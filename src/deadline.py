@@ -0,0 +1,68 @@
+"""
+Deadlines for composite operations of the HPE Aruba API client.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Monotonic time by which the current operation must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("aruba_api_deadline", default=None)
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Limit everything inside the block to a time budget.
+    
+    Requests, retry backoff and rate-limiter waits started in the block
+    (including in tasks created there) only use the remaining budget;
+    when it runs out they are cancelled and ``DeadlineExceeded`` is
+    raised. Work shared with other callers (coalesced requests, batched
+    actions) keeps running; only this block's wait for it is bounded.
+    Nested deadlines can only shorten the budget.
+    
+    Args:
+        seconds: Time budget
+        
+    Yields:
+        The effective deadline (``time.monotonic()`` based)
+        
+    Raises:
+        ValueError: If seconds is negative
+    """
+    if seconds < 0:
+        raise ValueError("seconds must be non-negative")
+    
+    at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        at = min(at, outer)
+    
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+@contextmanager
+def detached() -> Iterator[None]:
+    """
+    Run the block without a deadline.
+    
+    Work shared between callers (coalesced requests, batched actions) is
+    started here so that it is not cut short by the deadline of whichever
+    caller happened to start it; each caller bounds its own wait instead.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None without one."""
+    at = _deadline.get()
+    if at is None:
+        return None
+    return at - time.monotonic()
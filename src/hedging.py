@@ -0,0 +1,183 @@
+"""
+Hedged requests for the HPE Aruba API client.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, TypeVar
+
+try:
+    from .metrics import normalize_endpoint
+    from .retry import RetryBudget
+except ImportError:  # loaded as a top-level module (e.g. by the test suite)
+    from metrics import normalize_endpoint
+    from retry import RetryBudget
+
+T = TypeVar("T")
+
+class Hedger:
+    """
+    Cuts tail latency by racing a second copy of slow requests.
+    
+    If a request has not completed after the ``percentile`` latency
+    recently observed for its endpoint template, an identical request is
+    sent and whichever succeeds first is used; the other is cancelled.
+    Hedges are paid from a budget that earns ``budget_ratio`` hedges per
+    request, so they add at most that share of extra load on the quota.
+    Only use it for idempotent requests. After ``max_endpoints`` distinct
+    templates further ones share an ``other`` latency window, so memory
+    stays bounded.
+    """
+    
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+        window: int = 200,
+        budget_ratio: float = 0.05,
+        max_endpoints: int = 200
+    ):
+        """
+        Initialize the hedger.
+        
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            initial_delay: Hedge delay until ``min_samples`` latencies are known
+            min_delay: Lower bound of the hedge delay in seconds
+            max_delay: Upper bound of the hedge delay in seconds
+            min_samples: Latencies needed before the percentile is used
+            window: Recent latencies kept per endpoint template
+            budget_ratio: Hedges allowed per request
+            max_endpoints: Maximum distinct endpoint templates tracked
+            
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        
+        if not 0 <= min_delay <= max_delay:
+            raise ValueError("delays must satisfy 0 <= min_delay <= max_delay")
+        
+        if not isinstance(window, int) or not 1 <= min_samples <= window:
+            raise ValueError("min_samples must be between 1 and window")
+        
+        if not 0 < budget_ratio <= 1:
+            raise ValueError("budget_ratio must be in (0, 1]")
+        
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_endpoints = max_endpoints
+        self.budget = RetryBudget(ratio=budget_ratio, min_per_second=0, max_tokens=10)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.skipped = 0
+    
+    def delay_for(self, endpoint: str) -> float:
+        """
+        Seconds to wait before hedging a request to an endpoint.
+        
+        Args:
+            endpoint: API endpoint path or route template
+            
+        Returns:
+            Hedge delay
+        """
+        samples = self._latencies.get(self._template(endpoint))
+        if samples is None or len(samples) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            ordered = sorted(samples)
+            delay = ordered[min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)]
+        return min(self.max_delay, max(self.min_delay, delay))
+    
+    def _template(self, endpoint: str) -> str:
+        """Latency window key, capped at ``max_endpoints`` distinct values."""
+        template = normalize_endpoint(endpoint)
+        if template not in self._latencies and len(self._latencies) >= self.max_endpoints:
+            return "other"
+        return template
+    
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Add a successful request's latency to its template's window."""
+        template = self._template(endpoint)
+        samples = self._latencies.get(template)
+        if samples is None:
+            samples = self._latencies[template] = deque(maxlen=self.window)
+        samples.append(seconds)
+    
+    async def run(self, endpoint: str, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an operation, hedging it if it is slow.
+        
+        Args:
+            endpoint: API endpoint path (selects the latency window)
+            operation: Coroutine function performing the request
+            
+        Returns:
+            Result of the first copy to succeed
+            
+        Raises:
+            Exception: The primary's error if every copy fails
+        """
+        self.requests += 1
+        self.budget.record_request()
+        
+        started = time.monotonic()
+        primary = asyncio.ensure_future(operation())
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.delay_for(endpoint))
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        
+        if primary in done or not self.budget.try_spend():
+            if primary not in done:
+                self.skipped += 1
+            result = await primary
+            self.record_latency(endpoint, time.monotonic() - started)
+            return result
+        
+        self.hedges += 1
+        hedge_started = time.monotonic()
+        hedge = asyncio.ensure_future(operation())
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                            self.record_latency(endpoint, time.monotonic() - hedge_started)
+                        else:
+                            self.record_latency(endpoint, time.monotonic() - started)
+                        return task.result()
+            return primary.result()  # both failed: raise the primary's error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hedge counts and win rate."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "skipped": self.skipped,
+            "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+            "win_rate": self.hedge_wins / self.hedges if self.hedges else 0.0
+        }
@@ -0,0 +1,323 @@
+"""
+Incremental device inventory sync for the HPE Aruba API client.
+
+The sync expects two list endpoints:
+
+* the inventory (``/api/v2/devices``), offset-paginated, whose first page
+  carries the ``watermark`` of the snapshot being listed;
+* the change feed (``/api/v2/devices/changes?since=<watermark>``),
+  cursor-paginated, listing devices changed after the watermark (deleted
+  devices as ``{"id": ..., "deleted": true}``), whose last page carries
+  the watermark to resume from.
+
+A watermark the server no longer accepts (``410 Gone`` by default) makes
+the next sync a full resync.
+"""
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .api_client import ArubaAPIClient, APIError
+    from .pagination import CURSOR
+    from .scheduler import BULK
+except ImportError:  # loaded as a top-level module (e.g. by the test suite)
+    from api_client import ArubaAPIClient, APIError
+    from pagination import CURSOR
+    from scheduler import BULK
+
+logger = logging.getLogger(__name__)
+
+# Sync modes
+INCREMENTAL = "incremental"
+FULL = "full"
+
+@dataclass
+class SyncResult:
+    """Outcome of one sync run."""
+    mode: str
+    upserted: int
+    deleted: int
+    pages: int
+    watermark: Optional[str]
+
+class SQLiteInventoryStore:
+    """
+    Local device mirror and its watermark in an SQLite database.
+    
+    Changes and the watermark they lead to are written in one
+    transaction, so after a crash the mirror never claims a watermark it
+    has not applied.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS devices (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            generation INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the store.
+        
+        Args:
+            path: Database file
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+    
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM devices").fetchone()[0]
+    
+    def get(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """Stored record of a device, or None."""
+        row = self._conn.execute("SELECT data FROM devices WHERE id = ?", (device_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def devices(self) -> Iterator[Dict[str, Any]]:
+        """All stored device records."""
+        for (data,) in self._conn.execute("SELECT data FROM devices ORDER BY id"):
+            yield json.loads(data)
+    
+    @property
+    def watermark(self) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM sync_state WHERE key = 'watermark'"
+        ).fetchone()
+        return row[0] if row else None
+    
+    def _set_watermark(self, watermark: Optional[str]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES ('watermark', ?)", (watermark,)
+        )
+    
+    def invalidate_watermark(self) -> None:
+        """Forget the watermark so the next sync is a full resync."""
+        self._set_watermark(None)
+    
+    def _generation(self) -> int:
+        row = self._conn.execute("SELECT value FROM sync_state WHERE key = 'generation'").fetchone()
+        return int(row[0]) if row else 0
+    
+    def apply(
+        self,
+        upserts: Iterable[Tuple[str, Dict[str, Any]]],
+        deletes: Iterable[str],
+        watermark: Optional[str]
+    ) -> None:
+        """
+        Apply changes and advance the watermark atomically.
+        
+        Args:
+            upserts: (device ID, record) pairs to insert or replace
+            deletes: Device IDs to remove
+            watermark: Watermark reached with these changes
+        """
+        generation = self._generation()
+        with self._transaction():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO devices VALUES (?, ?, ?)",
+                ((device_id, json.dumps(record), generation) for device_id, record in upserts)
+            )
+            self._conn.executemany("DELETE FROM devices WHERE id = ?", ((d,) for d in deletes))
+            self._set_watermark(watermark)
+    
+    def begin_resync(self) -> int:
+        """
+        Start a full resync, returning its generation.
+        
+        The watermark is cleared, so an interrupted resync is started over.
+        """
+        generation = self._generation() + 1
+        with self._transaction():
+            self._set_watermark(None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES ('generation', ?)", (str(generation),)
+            )
+        return generation
+    
+    def resync_batch(self, generation: int, records: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store records seen by the resync of ``generation``."""
+        with self._transaction():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO devices VALUES (?, ?, ?)",
+                ((device_id, json.dumps(record), generation) for device_id, record in records)
+            )
+    
+    def finish_resync(self, generation: int, watermark: Optional[str]) -> int:
+        """
+        Delete devices the resync did not see and set the watermark.
+        
+        Returns:
+            Number of deleted devices
+        """
+        with self._transaction():
+            deleted = self._conn.execute(
+                "DELETE FROM devices WHERE generation != ?", (generation,)
+            ).rowcount
+            self._set_watermark(watermark)
+        return deleted
+    
+    def _transaction(self):
+        return _Transaction(self._conn)
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+    
+    def __enter__(self) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+class InventorySync:
+    """
+    Keeps a local device mirror current with O(changes) API calls.
+    
+    Each ``sync()`` fetches only the devices changed since the stored
+    watermark and applies them as upserts and deletes. Without a
+    watermark, or when the server rejects it, the whole inventory is
+    listed instead and devices missing from it are removed. Requests run
+    at bulk priority. Runs must not overlap on the same store.
+    """
+    
+    def __init__(
+        self,
+        client: ArubaAPIClient,
+        store: SQLiteInventoryStore,
+        inventory_endpoint: str = "/api/v2/devices",
+        changes_endpoint: str = "/api/v2/devices/changes",
+        items_key: str = "devices",
+        changes_key: str = "changes",
+        id_key: str = "id",
+        watermark_key: str = "watermark",
+        since_param: str = "since",
+        page_size: int = 500,
+        invalid_watermark_statuses: Iterable[int] = (410,)
+    ):
+        """
+        Initialize the sync.
+        
+        Args:
+            client: API client (entered as a context manager by the caller)
+            store: Local mirror
+            inventory_endpoint: Full device listing
+            changes_endpoint: Change feed
+            items_key: Response key holding listed devices
+            changes_key: Response key holding changed devices
+            id_key: Device record key holding the device ID
+            watermark_key: Response key holding the watermark
+            since_param: Query parameter passing the watermark
+            page_size: Devices requested per page
+            invalid_watermark_statuses: Statuses meaning the watermark
+                is no longer valid
+        """
+        self.client = client
+        self.store = store
+        self.inventory_endpoint = inventory_endpoint
+        self.changes_endpoint = changes_endpoint
+        self.items_key = items_key
+        self.changes_key = changes_key
+        self.id_key = id_key
+        self.watermark_key = watermark_key
+        self.since_param = since_param
+        self.page_size = page_size
+        self.invalid_watermark_statuses = frozenset(invalid_watermark_statuses)
+    
+    async def sync(self) -> SyncResult:
+        """
+        Bring the store up to date.
+        
+        Returns:
+            What was done
+            
+        Raises:
+            APIError: If the inventory cannot be fetched
+        """
+        watermark = self.store.watermark
+        if watermark is not None:
+            try:
+                return await self._incremental(watermark)
+            except APIError as e:
+                if e.status_code not in self.invalid_watermark_statuses:
+                    raise
+                logger.warning("Inventory watermark rejected, resyncing", extra={
+                    "status_code": e.status_code
+                })
+                self.store.invalidate_watermark()
+        return await self._full()
+    
+    def _watermark_of(self, page: Optional[Dict[str, Any]]) -> Optional[str]:
+        value = (page or {}).get(self.watermark_key)
+        return None if value is None else str(value)
+    
+    async def _incremental(self, watermark: str) -> SyncResult:
+        changes = self.client.paginate(
+            self.changes_endpoint,
+            self.changes_key,
+            page_size=self.page_size,
+            params={self.since_param: watermark},
+            style=CURSOR,
+            priority=BULK
+        )
+        
+        upserts: Dict[str, Dict[str, Any]] = {}
+        deletes: Dict[str, None] = {}
+        async for record in changes:
+            device_id = str(record[self.id_key])
+            # The feed is ordered; the last change of a device wins
+            if record.get("deleted"):
+                upserts.pop(device_id, None)
+                deletes[device_id] = None
+            else:
+                deletes.pop(device_id, None)
+                upserts[device_id] = record
+        
+        new_watermark = self._watermark_of(changes.last_page)
+        if new_watermark is None:
+            # Re-reading the same changes next time is harmless
+            logger.warning("Change feed returned no watermark")
+            new_watermark = watermark
+        
+        self.store.apply(upserts.items(), deletes, new_watermark)
+        return SyncResult(INCREMENTAL, len(upserts), len(deletes), changes.pages_fetched, new_watermark)
+    
+    async def _full(self) -> SyncResult:
+        generation = self.store.begin_resync()
+        listing = self.client.paginate(
+            self.inventory_endpoint, self.items_key, page_size=self.page_size, priority=BULK
+        )
+        
+        upserted = 0
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        async for record in listing:
+            batch.append((str(record[self.id_key]), record))
+            if len(batch) >= self.page_size:
+                self.store.resync_batch(generation, batch)
+                upserted += len(batch)
+                batch = []
+        self.store.resync_batch(generation, batch)
+        upserted += len(batch)
+        
+        # The snapshot's watermark: changes made while listing are replayed
+        watermark = self._watermark_of(listing.first_page)
+        if watermark is None:
+            logger.warning("Inventory listing returned no watermark")
+        deleted = self.store.finish_resync(generation, watermark)
+        return SyncResult(FULL, upserted, deleted, listing.pages_fetched, watermark)
@@ -0,0 +1,205 @@
+"""
+Non-blocking logging for the HPE Aruba API client.
+
+Log records are put on a bounded queue and written by the configured
+handlers in a background thread, so slow file or socket handlers never
+block the event loop.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+class LogSampler(logging.Filter):
+    """
+    Rate-limits repeated identical log records.
+    
+    Records are identical when they share logger, level and message
+    template. Of each such group, ``burst`` records pass per ``interval``
+    seconds and the rest are counted and dropped; the first record passed
+    in the next interval carries the count as its ``suppressed``
+    attribute. CRITICAL records always pass.
+    """
+    
+    def __init__(self, burst: int = 10, interval: float = 60.0, max_keys: int = 1000):
+        """
+        Initialize the sampler.
+        
+        Args:
+            burst: Identical records passed per interval
+            interval: Window length in seconds
+            max_keys: Distinct record groups tracked (least recent forgotten)
+            
+        Raises:
+            ValueError: If burst or interval is not positive
+        """
+        super().__init__()
+        if not isinstance(burst, int) or burst < 1 or interval <= 0:
+            raise ValueError("burst and interval must be positive")
+        
+        self.burst = burst
+        self.interval = interval
+        self.max_keys = max_keys
+        # key -> [window start, passed in window, suppressed since last pass]
+        self._groups: "OrderedDict[Tuple[str, int, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.suppressed = 0
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.CRITICAL:
+            return True
+        
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = [now, 0, 0]
+                while len(self._groups) > self.max_keys:
+                    self._groups.popitem(last=False)
+            self._groups.move_to_end(key)
+            
+            if now - group[0] >= self.interval:
+                group[0], group[1] = now, 0
+            
+            if group[1] >= self.burst:
+                group[2] += 1
+                self.suppressed += 1
+                return False
+            
+            group[1] += 1
+            if group[2]:
+                record.suppressed = int(group[2])
+                group[2] = 0
+        return True
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+    
+    def __init__(self, log_queue: "queue.Queue[Any]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room: the queue may be full when stopping
+        self.queue.put(self._sentinel)
+
+class QueueLogging:
+    """
+    Routes a logger's records through a queue to a background thread.
+    
+    ``start()`` moves the logger's handlers (the root logger's by
+    default) behind a bounded queue served by a listener thread, with a
+    ``LogSampler`` in front of it; ``stop()`` writes the queued records
+    and restores the handlers. Use as a context manager or call
+    ``start``/``stop`` around the application's lifetime.
+    """
+    
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        handlers: Optional[Iterable[logging.Handler]] = None,
+        max_queue_size: int = 10000,
+        sampler: Optional[LogSampler] = None
+    ):
+        """
+        Initialize queue logging.
+        
+        Args:
+            logger: Logger whose records are queued (defaults to root)
+            handlers: Handlers writing the records (defaults to the
+                logger's current handlers)
+            max_queue_size: Records buffered before new ones are dropped
+            sampler: Rate limit for repeated records (defaults to
+                ``LogSampler()``)
+            
+        Raises:
+            ValueError: If max_queue_size is not positive
+        """
+        if not isinstance(max_queue_size, int) or max_queue_size < 1:
+            raise ValueError("max_queue_size must be a positive integer")
+        
+        self.logger = logger or logging.getLogger()
+        self._handlers = list(handlers) if handlers is not None else None
+        self.queue: "queue.Queue[Any]" = queue.Queue(max_queue_size)
+        self.sampler = sampler or LogSampler()
+        self.handler = DroppingQueueHandler(self.queue)
+        self.handler.addFilter(self.sampler)
+        self._listener: Optional[_Listener] = None
+        self._previous: List[logging.Handler] = []
+    
+    def start(self) -> "QueueLogging":
+        """Install the queue handler and start the listener thread."""
+        if self._listener is not None:
+            return self
+        
+        self._previous = list(self.logger.handlers)
+        handlers = self._handlers if self._handlers is not None else self._previous
+        for handler in self._previous:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(self.handler)
+        
+        self._listener = _Listener(self.queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        return self
+    
+    def stop(self) -> None:
+        """Write the queued records, stop the thread and restore the handlers."""
+        if self._listener is None:
+            return
+        
+        self.logger.removeHandler(self.handler)
+        self._listener.stop()
+        self._listener = None
+        for handler in self._previous:
+            self.logger.addHandler(handler)
+    
+    def __enter__(self) -> "QueueLogging":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+    
+    def stats(self) -> Dict[str, int]:
+        """Queue depth, capacity, and records dropped or sampled away."""
+        return {
+            "queue_depth": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "dropped": self.handler.dropped,
+            "suppressed": self.sampler.suppressed
+        }
+    
+    def render_prometheus(self, namespace: str = "aruba_api") -> str:
+        """
+        Queue statistics in the Prometheus text exposition format.
+        
+        Args:
+            namespace: Prefix for metric names
+            
+        Returns:
+            Exposition text
+        """
+        stats = self.stats()
+        ns = namespace
+        return "\n".join([
+            f"# HELP {ns}_log_queue_depth Log records waiting to be written.",
+            f"# TYPE {ns}_log_queue_depth gauge",
+            f"{ns}_log_queue_depth {stats['queue_depth']}",
+            f"# HELP {ns}_log_records_dropped_total Log records dropped because the queue was full.",
+            f"# TYPE {ns}_log_records_dropped_total counter",
+            f"{ns}_log_records_dropped_total {stats['dropped']}",
+            f"# HELP {ns}_log_records_suppressed_total Repeated log records dropped by sampling.",
+            f"# TYPE {ns}_log_records_suppressed_total counter",
+            f"{ns}_log_records_suppressed_total {stats['suppressed']}"
+        ]) + "\n"
@@ -0,0 +1,333 @@
+"""
+Request metrics for the HPE Aruba API client with Prometheus text export.
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments that identify a resource rather than a route
+_ID_SEGMENT = re.compile(
+    r'^(?:'
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'  # UUID
+    r'|(?:[0-9a-fA-F]{2}[:-]){5}[0-9a-fA-F]{2}'  # MAC address
+    r'|(?=[^/]*\d)[A-Za-z0-9._-]+'  # anything containing a digit (serials, device IDs)
+    r')$'
+)
+_VERSION_SEGMENT = re.compile(r'^v\d+$')
+
+@lru_cache(maxsize=4096)
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Reduce an endpoint path to a low-cardinality route template.
+    
+    Query strings are dropped and segments that look like identifiers
+    (UUIDs, MAC addresses, anything containing a digit other than API
+    versions) become ``{id}``, e.g. ``/api/v2/devices/AP-123/status`` ->
+    ``/api/v2/devices/{id}/status``.
+    
+    Args:
+        endpoint: API endpoint path
+        
+    Returns:
+        Route template
+    """
+    path = endpoint.split('?', 1)[0]
+    segments = [
+        '{id}' if segment and not _VERSION_SEGMENT.match(segment) and _ID_SEGMENT.match(segment)
+        else segment
+        for segment in path.split('/')
+    ]
+    return '/'.join(segments) or '/'
+
+def status_class(status_code: Optional[int]) -> str:
+    """Bucket an HTTP status into ``2xx``/``4xx``/..., or ``error`` for transport failures."""
+    if status_code is None:
+        return "error"
+    return f"{status_code // 100}xx"
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(``le`` label, cumulative count) pairs including ``+Inf``."""
+        result = []
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            result.append((_format_value(bound), running))
+        result.append(("+Inf", self.count))
+        return result
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate quantile (upper bound of the bucket holding it)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return float('inf')
+
+class ClientMetrics:
+    """
+    Per-endpoint request metrics.
+    
+    Tracks request counts by method, endpoint template and status class,
+    latency histograms, rate-limiter wait time, 429s, retries, bytes
+    saved by content encoding and the number of requests in flight. Endpoints are normalized to templates,
+    and after ``max_endpoints`` distinct templates further ones are
+    reported as ``other`` so label cardinality stays bounded.
+    """
+    
+    def __init__(
+        self,
+        namespace: str = "aruba_api",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        max_endpoints: int = 200
+    ):
+        """
+        Initialize the metrics registry.
+        
+        Args:
+            namespace: Prefix for exported metric names
+            buckets: Latency histogram buckets in seconds
+            max_endpoints: Maximum distinct endpoint templates
+        """
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self.max_endpoints = max_endpoints
+        self._endpoints: set = set()
+        self.requests: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.rate_limited: Dict[str, int] = defaultdict(int)
+        self.retries: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.rate_limit_wait = Histogram(buckets)
+        self.in_flight = 0
+        self.cancelled = 0
+        # Content-encoded bytes and their decoded size, by direction
+        self.encoded_bytes: Dict[str, int] = defaultdict(int)
+        self.decoded_bytes: Dict[str, int] = defaultdict(int)
+    
+    def endpoint_label(self, endpoint: str) -> str:
+        """Endpoint template label, capped at ``max_endpoints`` distinct values."""
+        template = normalize_endpoint(endpoint)
+        if template not in self._endpoints:
+            if len(self._endpoints) >= self.max_endpoints:
+                return "other"
+            self._endpoints.add(template)
+        return template
+    
+    def request_started(self) -> None:
+        self.in_flight += 1
+    
+    def request_finished(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        duration: float
+    ) -> None:
+        """
+        Record a completed request attempt.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            status_code: HTTP status, or None for transport failures
+            duration: Wall time in seconds
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+        label = self.endpoint_label(endpoint)
+        self.requests[(method, label, status_class(status_code))] += 1
+        
+        histogram = self.latency.get((method, label))
+        if histogram is None:
+            histogram = self.latency[(method, label)] = Histogram(self.buckets)
+        histogram.observe(duration)
+        
+        if status_code == 429:
+            self.rate_limited[label] += 1
+    
+    def request_cancelled(self) -> None:
+        """Record a request abandoned before completion (e.g. a losing hedge)."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self.cancelled += 1
+    
+    def record_rate_limit_wait(self, seconds: float) -> None:
+        """Record time spent waiting for rate-limiter admission."""
+        self.rate_limit_wait.observe(seconds)
+    
+    def record_retry(self, method: str, endpoint: str) -> None:
+        """Record a retry of a request."""
+        self.retries[(method, self.endpoint_label(endpoint))] += 1
+    
+    def record_compression(self, direction: str, encoded: int, decoded: int) -> None:
+        """
+        Record a compressed body.
+        
+        Args:
+            direction: ``request`` or ``response``
+            encoded: Size on the wire in bytes
+            decoded: Uncompressed size in bytes
+        """
+        self.encoded_bytes[direction] += encoded
+        self.decoded_bytes[direction] += decoded
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Metrics as a plain dictionary.
+        
+        Returns:
+            Nested dict of counters, latency summaries and gauges
+        """
+        return {
+            "requests": [
+                {"method": m, "endpoint": e, "status_class": c, "count": n}
+                for (m, e, c), n in sorted(self.requests.items())
+            ],
+            "latency": [
+                {
+                    "method": m,
+                    "endpoint": e,
+                    "count": h.count,
+                    "sum": h.sum,
+                    "p50": h.quantile(0.5),
+                    "p99": h.quantile(0.99)
+                }
+                for (m, e), h in sorted(self.latency.items())
+            ],
+            "rate_limited": dict(self.rate_limited),
+            "retries": [
+                {"method": m, "endpoint": e, "count": n}
+                for (m, e), n in sorted(self.retries.items())
+            ],
+            "rate_limit_wait": {
+                "count": self.rate_limit_wait.count,
+                "sum": self.rate_limit_wait.sum
+            },
+            "compression": {
+                direction: {
+                    "encoded_bytes": encoded,
+                    "decoded_bytes": self.decoded_bytes[direction],
+                    "saved_bytes": self.decoded_bytes[direction] - encoded,
+                    "ratio": self.decoded_bytes[direction] / encoded if encoded else None
+                }
+                for direction, encoded in sorted(self.encoded_bytes.items())
+            },
+            "in_flight": self.in_flight,
+            "cancelled": self.cancelled
+        }
+    
+    def render_prometheus(self) -> str:
+        """
+        Metrics in the Prometheus text exposition format (version 0.0.4).
+        
+        Returns:
+            Exposition text
+        """
+        ns = self.namespace
+        lines: List[str] = []
+        
+        lines.append(f"# HELP {ns}_requests_total API requests by method, endpoint and status class.")
+        lines.append(f"# TYPE {ns}_requests_total counter")
+        for (method, endpoint, cls), count in sorted(self.requests.items()):
+            lines.append(f"{ns}_requests_total{_labels(method=method, endpoint=endpoint, status_class=cls)} {count}")
+        
+        lines.append(f"# HELP {ns}_request_duration_seconds API request latency.")
+        lines.append(f"# TYPE {ns}_request_duration_seconds histogram")
+        for (method, endpoint), histogram in sorted(self.latency.items()):
+            _render_histogram(lines, f"{ns}_request_duration_seconds", histogram,
+                              method=method, endpoint=endpoint)
+        
+        lines.append(f"# HELP {ns}_rate_limited_total Responses with status 429 by endpoint.")
+        lines.append(f"# TYPE {ns}_rate_limited_total counter")
+        for endpoint, count in sorted(self.rate_limited.items()):
+            lines.append(f"{ns}_rate_limited_total{_labels(endpoint=endpoint)} {count}")
+        
+        lines.append(f"# HELP {ns}_retries_total Request retries by method and endpoint.")
+        lines.append(f"# TYPE {ns}_retries_total counter")
+        for (method, endpoint), count in sorted(self.retries.items()):
+            lines.append(f"{ns}_retries_total{_labels(method=method, endpoint=endpoint)} {count}")
+        
+        lines.append(f"# HELP {ns}_rate_limit_wait_seconds Time spent waiting for rate-limiter admission.")
+        lines.append(f"# TYPE {ns}_rate_limit_wait_seconds histogram")
+        _render_histogram(lines, f"{ns}_rate_limit_wait_seconds", self.rate_limit_wait)
+        
+        lines.append(f"# HELP {ns}_requests_cancelled_total Requests abandoned before completion.")
+        lines.append(f"# TYPE {ns}_requests_cancelled_total counter")
+        lines.append(f"{ns}_requests_cancelled_total {self.cancelled}")
+        
+        lines.append(f"# HELP {ns}_compressed_body_bytes_total Compressed bodies by direction, on the wire.")
+        lines.append(f"# TYPE {ns}_compressed_body_bytes_total counter")
+        for direction, count in sorted(self.encoded_bytes.items()):
+            lines.append(f"{ns}_compressed_body_bytes_total{_labels(direction=direction)} {count}")
+        
+        lines.append(f"# HELP {ns}_uncompressed_body_bytes_total Compressed bodies by direction, decoded size.")
+        lines.append(f"# TYPE {ns}_uncompressed_body_bytes_total counter")
+        for direction, count in sorted(self.decoded_bytes.items()):
+            lines.append(f"{ns}_uncompressed_body_bytes_total{_labels(direction=direction)} {count}")
+        
+        lines.append(f"# HELP {ns}_requests_in_flight API requests currently in flight.")
+        lines.append(f"# TYPE {ns}_requests_in_flight gauge")
+        lines.append(f"{ns}_requests_in_flight {self.in_flight}")
+        
+        return "\n".join(lines) + "\n"
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else f"{value:.1f}"
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+def _render_histogram(lines: List[str], name: str, histogram: Histogram, **labels: str) -> None:
+    for le, count in histogram.cumulative():
+        lines.append(f"{name}_bucket{_labels(**labels, le=le)} {count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+def metrics_handler(metrics: ClientMetrics):
+    """
+    Build an aiohttp.web handler serving the metrics in Prometheus format.
+    
+    Example:
+        app.router.add_get('/metrics', metrics_handler(client.metrics))
+        
+    Args:
+        metrics: Metrics to expose
+        
+    Returns:
+        Request handler coroutine
+    """
+    from aiohttp import web
+    
+    async def handler(request: "web.Request") -> "web.Response":
+        return web.Response(
+            body=metrics.render_prometheus().encode('utf-8'),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
+    
+    return handler
@@ -0,0 +1,242 @@
+"""
+Routing across Aruba Central regional clusters.
+"""
+
+import asyncio
+import logging
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional,
+    Tuple, TypeVar, Union
+)
+
+try:
+    from .api_client import ArubaAPIClient, ValidationError
+except ImportError:  # loaded as a top-level module (e.g. by the test suite)
+    from api_client import ArubaAPIClient, ValidationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class MultiClusterClient:
+    """
+    Routes API calls to the regional Central cluster owning a tenant or device.
+    
+    Each cluster gets its own ArubaAPIClient, and so its own connection
+    pool and rate limiter; a throttled or slow cluster does not consume
+    another cluster's quota or connections. Calls are routed by tenant
+    when one is given, otherwise by the longest matching device-ID
+    prefix, otherwise to ``default_cluster``. Bulk operations run on all
+    involved clusters in parallel.
+    """
+    
+    def __init__(
+        self,
+        clusters: Mapping[str, str],
+        api_keys: Union[str, Mapping[str, str]],
+        tenants: Optional[Mapping[str, str]] = None,
+        device_prefixes: Optional[Mapping[str, str]] = None,
+        default_cluster: Optional[str] = None,
+        cluster_options: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        **client_options: Any
+    ):
+        """
+        Initialize the routing client.
+        
+        Args:
+            clusters: Base URL per cluster name
+            api_keys: API key shared by all clusters, or one per cluster
+            tenants: Cluster per tenant ID
+            device_prefixes: Cluster per device-ID prefix
+            default_cluster: Cluster for calls no rule matches
+            cluster_options: ArubaAPIClient options per cluster (e.g. its
+                own ``requests_per_second``), overriding ``client_options``
+            **client_options: ArubaAPIClient options for every cluster
+            
+        Raises:
+            ValueError: If a rule or key names an unknown cluster, or a
+                cluster has no API key
+        """
+        if not clusters:
+            raise ValueError("At least one cluster is required")
+        
+        for name, cluster in [*(tenants or {}).items(), *(device_prefixes or {}).items()]:
+            if cluster not in clusters:
+                raise ValueError(f"Unknown cluster for {name}: {cluster}")
+        
+        if default_cluster is not None and default_cluster not in clusters:
+            raise ValueError(f"Unknown default cluster: {default_cluster}")
+        
+        self.tenants = dict(tenants or {})
+        # Longest prefix first so the most specific rule wins
+        self.device_prefixes = sorted((device_prefixes or {}).items(), key=lambda rule: -len(rule[0]))
+        self.default_cluster = default_cluster
+        
+        self.clients: Dict[str, ArubaAPIClient] = {}
+        for name, base_url in clusters.items():
+            api_key = api_keys if isinstance(api_keys, str) else api_keys.get(name)
+            if api_key is None:
+                raise ValueError(f"No API key for cluster: {name}")
+            options = dict(client_options, **(cluster_options or {}).get(name, {}))
+            self.clients[name] = ArubaAPIClient(base_url, api_key, **options)
+    
+    async def __aenter__(self):
+        entered: List[ArubaAPIClient] = []
+        try:
+            for client in self.clients.values():
+                await client.__aenter__()
+                entered.append(client)
+        except BaseException:
+            for client in entered:
+                await client.__aexit__(None, None, None)
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.gather(
+            *(client.__aexit__(exc_type, exc_val, exc_tb) for client in self.clients.values()),
+            return_exceptions=True
+        )
+    
+    def cluster_for(self, device_id: Optional[str] = None, tenant: Optional[str] = None) -> str:
+        """
+        Resolve the cluster serving a tenant or device.
+        
+        Args:
+            device_id: Device identifier
+            tenant: Tenant ID (takes precedence over the device; a tenant
+                without a rule falls through to the device prefixes)
+            
+        Returns:
+            Cluster name
+            
+        Raises:
+            ValidationError: If no rule matches and there is no default cluster
+        """
+        if tenant is not None and tenant in self.tenants:
+            return self.tenants[tenant]
+        
+        if device_id is not None:
+            for prefix, cluster in self.device_prefixes:
+                if device_id.startswith(prefix):
+                    return cluster
+        
+        if self.default_cluster is None:
+            raise ValidationError("No cluster configured for this tenant or device")
+        return self.default_cluster
+    
+    def client_for(self, device_id: Optional[str] = None, tenant: Optional[str] = None) -> ArubaAPIClient:
+        """Client of the cluster serving a tenant or device (see ``cluster_for``)."""
+        return self.clients[self.cluster_for(device_id, tenant)]
+    
+    async def get_device_status(self, device_id: str, tenant: Optional[str] = None) -> Dict[str, Any]:
+        """Get device status from the device's cluster."""
+        return await self.client_for(device_id, tenant).get_device_status(device_id)
+    
+    async def isolate_device(
+        self,
+        device_id: str,
+        rollback_timer: Optional[int] = None,
+        tenant: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Isolate a device through its cluster."""
+        return await self.client_for(device_id, tenant).isolate_device(device_id, rollback_timer)
+    
+    async def quarantine_device(
+        self,
+        device_id: str,
+        reason: Optional[str] = None,
+        tenant: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Quarantine a device through its cluster."""
+        return await self.client_for(device_id, tenant).quarantine_device(device_id, reason)
+    
+    async def iter_device_statuses(
+        self,
+        device_ids: Iterable[str],
+        concurrency: int = 10,
+        tenant: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+        """
+        Fetch status for many devices across clusters in parallel.
+        
+        Devices are grouped by cluster and each group is polled by its
+        cluster's client with up to ``concurrency`` requests in flight, so
+        a slow cluster only delays its own devices. Results are yielded in
+        completion order; devices that cannot be routed yield their
+        ``ValidationError``.
+        
+        Args:
+            device_ids: Device identifiers to query
+            concurrency: Maximum requests in flight per cluster
+            tenant: Tenant owning all the devices, if known
+            
+        Yields:
+            Tuples of (device_id, status data or exception)
+        """
+        groups: Dict[str, List[str]] = {}
+        unroutable: List[Tuple[str, Exception]] = []
+        for device_id in device_ids:
+            try:
+                groups.setdefault(self.cluster_for(device_id, tenant), []).append(device_id)
+            except ValidationError as e:
+                unroutable.append((device_id, e))
+        
+        for item in unroutable:
+            yield item
+        
+        results: asyncio.Queue = asyncio.Queue(maxsize=max(1, concurrency) * max(1, len(groups)))
+        finished = object()
+        
+        async def poll(cluster: str, ids: List[str]) -> None:
+            try:
+                async for item in self.clients[cluster].iter_device_statuses(ids, concurrency):
+                    await results.put(item)
+            except Exception as e:
+                logger.error("Cluster poll failed", extra={
+                    "cluster": cluster,
+                    "error_type": type(e).__name__
+                })
+                for device_id in ids:
+                    await results.put((device_id, e))
+            await results.put(finished)
+        
+        tasks = [asyncio.create_task(poll(cluster, ids)) for cluster, ids in groups.items()]
+        try:
+            active = len(tasks)
+            while active:
+                item = await results.get()
+                if item is finished:
+                    active -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def run_on_clusters(
+        self,
+        operation: Callable[[ArubaAPIClient], Awaitable[T]],
+        clusters: Optional[Iterable[str]] = None
+    ) -> Dict[str, Union[T, Exception]]:
+        """
+        Run an operation against several clusters in parallel.
+        
+        Args:
+            operation: Coroutine function called with each cluster's client
+            clusters: Cluster names (defaults to all)
+            
+        Returns:
+            Result or exception per cluster
+        """
+        names = list(clusters) if clusters is not None else list(self.clients)
+        results = await asyncio.gather(
+            *(operation(self.clients[name]) for name in names),
+            return_exceptions=True
+        )
+        return dict(zip(names, results))
+    
+    def rate_limit_status(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Rate limiter state per cluster."""
+        return {name: client.rate_limit_status() for name, client in self.clients.items()}
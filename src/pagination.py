@@ -0,0 +1,174 @@
+"""
+Asynchronous pagination over HPE Aruba list endpoints.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+# Pagination styles
+OFFSET = "offset"
+CURSOR = "cursor"
+
+class Paginator:
+    """
+    Async iterator over the items of a paginated list endpoint.
+    
+    Supports ``offset`` style (``limit``/``offset`` query parameters) and
+    ``cursor`` style (the response names the cursor of the next page).
+    While the caller works through one page, the next page is already
+    being fetched, so network time overlaps with processing. Only one page
+    is held in memory besides the prefetched one.
+    
+    Iteration stops when the endpoint runs out of items, after
+    ``max_items`` items, or at the first item for which ``stop_when``
+    returns True (that item is not yielded).
+    """
+    
+    def __init__(
+        self,
+        fetch_page: Callable[[Dict[str, str]], Awaitable[Dict[str, Any]]],
+        items_key: str,
+        page_size: int = 100,
+        params: Optional[Dict[str, str]] = None,
+        style: str = OFFSET,
+        limit_param: str = "limit",
+        offset_param: str = "offset",
+        cursor_param: str = "cursor",
+        next_cursor_key: str = "next_cursor",
+        total_key: Optional[str] = "total",
+        max_items: Optional[int] = None,
+        stop_when: Optional[Callable[[Any], bool]] = None,
+        prefetch: bool = True
+    ):
+        """
+        Initialize the paginator.
+        
+        Args:
+            fetch_page: Coroutine fetching one page for the given query parameters
+            items_key: Response key holding the page's items
+            page_size: Items requested per page
+            params: Extra query parameters sent with every page
+            style: ``offset`` or ``cursor``
+            limit_param: Query parameter for the page size
+            offset_param: Query parameter for the offset (offset style)
+            cursor_param: Query parameter for the cursor (cursor style)
+            next_cursor_key: Response key holding the next cursor (cursor style)
+            total_key: Response key holding the total item count, if any
+            max_items: Stop after this many items
+            stop_when: Predicate that ends iteration at the first matching item
+            prefetch: Fetch the next page while the current one is consumed
+            
+        Raises:
+            ValueError: If the style, page size or max_items is invalid
+        """
+        if style not in (OFFSET, CURSOR):
+            raise ValueError(f"Invalid pagination style: {style}")
+        
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        
+        if max_items is not None and (not isinstance(max_items, int) or max_items < 0):
+            raise ValueError("max_items must be a non-negative integer")
+        
+        self._fetch_page = fetch_page
+        self.items_key = items_key
+        self.page_size = page_size
+        self.params = dict(params or {})
+        self.style = style
+        self.limit_param = limit_param
+        self.offset_param = offset_param
+        self.cursor_param = cursor_param
+        self.next_cursor_key = next_cursor_key
+        self.total_key = total_key
+        self.max_items = max_items
+        self.stop_when = stop_when
+        self.prefetch = prefetch
+        self.pages_fetched = 0
+        # Raw responses, for page-level fields such as watermarks
+        self.first_page: Optional[Dict[str, Any]] = None
+        self.last_page: Optional[Dict[str, Any]] = None
+    
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+    
+    def _page_params(self, offset: int, cursor: Optional[str]) -> Dict[str, str]:
+        """Query parameters for a page."""
+        params = dict(self.params)
+        params[self.limit_param] = str(self.page_size)
+        if self.style == OFFSET:
+            params[self.offset_param] = str(offset)
+        elif cursor is not None:
+            params[self.cursor_param] = str(cursor)
+        return params
+    
+    def _next_page_params(self, page: Dict[str, Any], offset: int) -> Optional[Dict[str, str]]:
+        """
+        Query parameters for the page after ``page``, or None at the end.
+        
+        Args:
+            page: The page just fetched
+            offset: Offset of the item after this page
+        """
+        items = page.get(self.items_key) or []
+        
+        if self.style == CURSOR:
+            cursor = page.get(self.next_cursor_key)
+            if not cursor or not items:
+                return None
+            return self._page_params(offset, cursor)
+        
+        if len(items) < self.page_size:
+            return None
+        
+        total = page.get(self.total_key) if self.total_key else None
+        if isinstance(total, int) and offset >= total:
+            return None
+        
+        return self._page_params(offset, None)
+    
+    async def _fetch(self, params: Dict[str, str]) -> Dict[str, Any]:
+        page = await self._fetch_page(params)
+        self.pages_fetched += 1
+        page = page if isinstance(page, dict) else {}
+        if self.first_page is None:
+            self.first_page = page
+        self.last_page = page
+        return page
+    
+    async def _iterate(self) -> AsyncIterator[Any]:
+        yielded = 0
+        offset = 0
+        next_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
+        params: Optional[Dict[str, str]] = self._page_params(0, None)
+        
+        try:
+            while params is not None:
+                if self.max_items is not None and yielded >= self.max_items:
+                    return
+                
+                if next_task is not None:
+                    page = await next_task
+                    next_task = None
+                else:
+                    page = await self._fetch(params)
+                
+                items = page.get(self.items_key) or []
+                offset += len(items)
+                params = self._next_page_params(page, offset)
+                
+                if params is not None and self.prefetch:
+                    remaining = None if self.max_items is None else self.max_items - yielded - len(items)
+                    if remaining is None or remaining > 0:
+                        next_task = asyncio.ensure_future(self._fetch(params))
+                
+                for item in items:
+                    if self.max_items is not None and yielded >= self.max_items:
+                        return
+                    if self.stop_when is not None and self.stop_when(item):
+                        return
+                    yield item
+                    yielded += 1
+        finally:
+            if next_task is not None:
+                next_task.cancel()
+                await asyncio.gather(next_task, return_exceptions=True)
@@ -0,0 +1,288 @@
+"""
+Rate limiting primitives for the HPE Aruba API client.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Mapping, Optional
+
+# Rate-limit headers returned by Aruba Central
+HEADER_LIMIT_SECOND = 'X-RateLimit-Limit-second'
+HEADER_REMAINING_SECOND = 'X-RateLimit-Remaining-second'
+HEADER_LIMIT_DAY = 'X-RateLimit-Limit-day'
+HEADER_REMAINING_DAY = 'X-RateLimit-Remaining-day'
+HEADER_RESET_DAY = 'X-RateLimit-Reset-day'
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    """Read a numeric header, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number >= 0 else None
+
+def retry_after_from_headers(headers: Mapping[str, str], default: float = 60.0) -> float:
+    """
+    Determine how long to back off after a 429 response.
+    
+    Uses ``Retry-After`` (seconds or HTTP date) when present. Without it,
+    an exhausted per-second window only needs a one second pause; the
+    full ``default`` applies only when the daily quota is exhausted or
+    the server gave no hint at all.
+    
+    Args:
+        headers: Response headers
+        default: Fallback delay in seconds
+        
+    Returns:
+        Delay in seconds
+    """
+    retry_after = headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return default
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    
+    remaining_day = _header_number(headers, HEADER_REMAINING_DAY)
+    if remaining_day is not None and remaining_day < 1:
+        return _header_number(headers, HEADER_RESET_DAY) or default
+    
+    if _header_number(headers, HEADER_REMAINING_SECOND) is not None:
+        return 1.0
+    
+    return default
+
+class TokenBucket:
+    """
+    Token bucket rate limiter for concurrent request admission.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve a token up front and sleep only for their own deficit,
+    so waiters are admitted in FIFO order without holding a lock across
+    the request itself.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Sustained requests per second
+            capacity: Maximum burst size (defaults to ``max(1, rate)``)
+            
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise ValueError("rate must be a positive number")
+        
+        if capacity is None:
+            capacity = max(1, int(rate))
+        
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        
+        self.rate = float(rate)
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+    
+    @property
+    def available(self) -> float:
+        """Tokens currently available (negative while requests are queued)."""
+        self._refill()
+        return self._tokens
+    
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._updated = now
+            self._tokens = min(float(self.capacity), self._tokens + elapsed * self.rate)
+    
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve tokens without waiting.
+        
+        Args:
+            tokens: Number of tokens to reserve
+            
+        Returns:
+            Seconds the caller must wait before the reservation is valid
+        """
+        self._refill()
+        self._tokens -= tokens
+        # While paused, refill starts from a point in the future
+        paused_for = max(0.0, self._updated - time.monotonic())
+        if self._tokens >= 0:
+            return paused_for
+        return paused_for - self._tokens / self.rate
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Stop admitting requests for a period, e.g. after a 429.
+        
+        Args:
+            seconds: Pause duration in seconds
+        """
+        self._refill()
+        resume_at = time.monotonic() + max(0.0, seconds)
+        if resume_at > self._updated:
+            self._updated = resume_at
+            self._tokens = min(self._tokens, 0.0)
+    
+    def refund(self, tokens: int = 1) -> None:
+        """Return reserved tokens that were never used."""
+        self._refill()
+        self._tokens = min(float(self.capacity), self._tokens + tokens)
+    
+    async def acquire(self, tokens: int = 1) -> float:
+        """
+        Wait until tokens are available and consume them.
+        
+        Args:
+            tokens: Number of tokens to acquire
+            
+        Returns:
+            Seconds spent waiting for admission
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund(tokens)
+                raise
+        return wait
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket that adjusts its pacing from Aruba Central rate-limit headers.
+    
+    The configured rate is a starting point. Each response's
+    ``X-RateLimit-*`` headers move the rate towards what the tenant can
+    actually sustain: the advertised per-second limit caps the rate, the
+    per-second remaining count caps the tokens on hand, and the daily
+    remaining budget is spread over the time left until the daily reset.
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[int] = None,
+        min_rate: float = 0.5,
+        safety_factor: float = 0.9
+    ):
+        """
+        Initialize the adaptive limiter.
+        
+        Args:
+            rate: Initial requests per second
+            capacity: Maximum burst size
+            min_rate: Lower bound for the adjusted rate
+            safety_factor: Fraction of the advertised limit to use (0-1]
+            
+        Raises:
+            ValueError: If any parameter is out of range
+        """
+        super().__init__(rate, capacity)
+        
+        if not isinstance(min_rate, (int, float)) or min_rate <= 0:
+            raise ValueError("min_rate must be a positive number")
+        
+        if not isinstance(safety_factor, (int, float)) or not (0 < safety_factor <= 1):
+            raise ValueError("safety_factor must be between 0 and 1")
+        
+        self.min_rate = float(min(min_rate, rate))
+        self.safety_factor = float(safety_factor)
+        self._ceiling = self.rate
+        self.limit_second: Optional[float] = None
+        self.remaining_second: Optional[float] = None
+        self.limit_day: Optional[float] = None
+        self.remaining_day: Optional[float] = None
+        self.rate_limited_count = 0
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Adjust pacing from a response's rate-limit headers.
+        
+        Args:
+            headers: Response headers
+        """
+        limit_second = _header_number(headers, HEADER_LIMIT_SECOND)
+        remaining_second = _header_number(headers, HEADER_REMAINING_SECOND)
+        limit_day = _header_number(headers, HEADER_LIMIT_DAY)
+        remaining_day = _header_number(headers, HEADER_REMAINING_DAY)
+        
+        if limit_second is not None and limit_second > 0:
+            self.limit_second = limit_second
+            self._ceiling = max(self.min_rate, limit_second * self.safety_factor)
+        if remaining_second is not None:
+            self.remaining_second = remaining_second
+        if limit_day is not None:
+            self.limit_day = limit_day
+        if remaining_day is not None:
+            self.remaining_day = remaining_day
+        
+        self._refill()
+        
+        # The server's view of this second's window wins over our estimate
+        if remaining_second is not None:
+            self._tokens = min(self._tokens, remaining_second)
+        
+        rate = self._ceiling
+        if remaining_day is not None:
+            if remaining_day < 1:
+                self.pause(_header_number(headers, HEADER_RESET_DAY) or _seconds_until_utc_midnight())
+            else:
+                reset_in = _header_number(headers, HEADER_RESET_DAY) or _seconds_until_utc_midnight()
+                rate = min(rate, remaining_day / max(reset_in, 1.0))
+        
+        self.rate = max(self.min_rate, rate)
+    
+    def on_rate_limited(self, headers: Mapping[str, str], default: float = 60.0) -> float:
+        """
+        Pause admission after a 429 response.
+        
+        Args:
+            headers: Response headers
+            default: Fallback delay when the server gives no hint
+            
+        Returns:
+            Pause duration in seconds
+        """
+        self.rate_limited_count += 1
+        self.update_from_headers(headers)
+        delay = retry_after_from_headers(headers, default)
+        self.pause(delay)
+        return delay
+    
+    def status(self) -> Dict[str, Any]:
+        """Snapshot of the limiter's current view of the quota."""
+        return {
+            "rate": self.rate,
+            "available_tokens": self.available,
+            "limit_second": self.limit_second,
+            "remaining_second": self.remaining_second,
+            "limit_day": self.limit_day,
+            "remaining_day": self.remaining_day,
+            "rate_limited_count": self.rate_limited_count
+        }
+
+def _seconds_until_utc_midnight() -> float:
+    """Seconds until the daily quota window resets (UTC midnight)."""
+    now = datetime.now(timezone.utc)
+    return 86400.0 - (now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6)
@@ -0,0 +1,482 @@
+"""
+Response caching for idempotent HPE Aruba API calls.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Dict, Any, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CacheEntry:
+    """Cached response body with its validators."""
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    expires_at: float
+    
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return (now if now is not None else time.time()) < self.expires_at
+    
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class ResponseCache:
+    """
+    In-memory TTL cache with LRU eviction and conditional revalidation.
+    
+    TTLs are configured per endpoint pattern (shell-style, e.g.
+    ``/api/v2/devices/*/status``); the first matching pattern wins and
+    endpoints without a positive TTL are never cached. Expired entries that
+    carry an ``ETag`` or ``Last-Modified`` validator are kept so the next
+    request can be made conditional; a ``304 Not Modified`` then refreshes
+    the entry without transferring the body.
+    
+    Cached bodies are shared between callers and must be treated as
+    read-only.
+    """
+    
+    def __init__(
+        self,
+        ttl_rules: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize the response cache.
+        
+        Args:
+            ttl_rules: Mapping of endpoint pattern to TTL in seconds
+            default_ttl: TTL for endpoints matching no pattern (0 disables)
+            max_entries: Maximum number of cached responses
+            
+        Raises:
+            ValueError: If a TTL or max_entries is invalid
+        """
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        
+        rules = dict(ttl_rules or {})
+        for pattern, ttl in rules.items():
+            if not isinstance(ttl, (int, float)) or ttl < 0:
+                raise ValueError(f"Invalid TTL for pattern {pattern}: {ttl}")
+        
+        if not isinstance(default_ttl, (int, float)) or default_ttl < 0:
+            raise ValueError("default_ttl must be a non-negative number")
+        
+        self.ttl_rules = rules
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "stores": 0,
+            "evictions": 0
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Resolve the TTL for an endpoint path.
+        
+        Args:
+            endpoint: API endpoint path (without query string)
+            
+        Returns:
+            TTL in seconds (0 means not cacheable)
+        """
+        for pattern, ttl in self.ttl_rules.items():
+            if fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Find an entry and record a hit or miss.
+        
+        A fresh entry counts as a hit. A stale entry with validators is
+        returned for revalidation; a stale entry without validators is
+        dropped and counts as a miss.
+        
+        Args:
+            key: Normalized request key
+            
+        Returns:
+            Cached entry (fresh or revalidatable) or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        if entry.is_fresh():
+            self._stats["hits"] += 1
+            return entry
+        
+        if not entry.validators():
+            del self._entries[key]
+            self._stats["misses"] += 1
+            return None
+        
+        return entry
+    
+    def store(
+        self,
+        key: str,
+        endpoint: str,
+        data: Any,
+        headers: Mapping[str, str]
+    ) -> Optional[CacheEntry]:
+        """
+        Cache a successful response.
+        
+        Args:
+            key: Normalized request key
+            endpoint: API endpoint path used for TTL lookup
+            data: Parsed response body
+            headers: Response headers
+            
+        Returns:
+            The stored entry, or None if the response is not cacheable
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or 'no-store' in headers.get('Cache-Control', ''):
+            self._entries.pop(key, None)
+            return None
+        
+        now = time.time()
+        previous = self._entries.get(key)
+        if previous is not None and not previous.is_fresh(now):
+            # A conditional request that came back with a new body
+            self._stats["misses"] += 1
+        
+        entry = CacheEntry(
+            data=data,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            fetched_at=now,
+            expires_at=now + ttl
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._stats["stores"] += 1
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+        
+        return entry
+    
+    def revalidated(
+        self,
+        key: str,
+        endpoint: str,
+        headers: Mapping[str, str]
+    ) -> Optional[CacheEntry]:
+        """
+        Refresh an entry after a ``304 Not Modified`` response.
+        
+        Args:
+            key: Normalized request key
+            endpoint: API endpoint path used for TTL lookup
+            headers: Headers of the 304 response
+            
+        Returns:
+            The refreshed entry, or None if it was evicted meanwhile
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        now = time.time()
+        entry.fetched_at = now
+        entry.expires_at = now + self.ttl_for(endpoint)
+        entry.etag = headers.get('ETag', entry.etag)
+        entry.last_modified = headers.get('Last-Modified', entry.last_modified)
+        self._entries.move_to_end(key)
+        self._stats["revalidations"] += 1
+        return entry
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop one entry, or the whole cache when no key is given.
+        
+        Args:
+            key: Normalized request key
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/revalidation counters and current size."""
+        lookups = self._stats["hits"] + self._stats["misses"] + self._stats["revalidations"]
+        return {
+            **self._stats,
+            "size": len(self._entries),
+            "hit_ratio": (self._stats["hits"] + self._stats["revalidations"]) / lookups if lookups else 0.0
+        }
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Response cache persisted in an SQLite database (WAL mode).
+    
+    Entries survive restarts, so a new run revalidates stale entries with
+    their ETag instead of downloading the bodies again. WAL mode lets
+    several worker processes read the file while one of them writes. The
+    cache is bounded by ``max_entries`` and ``max_bytes`` of stored
+    bodies; the least recently used entries are evicted first. Use times
+    are updated at most once per ``touch_interval`` to keep reads from
+    turning into writes.
+    
+    Operations are synchronous; on a local disk they take well under a
+    millisecond. While another process holds the write lock, an operation
+    waits at most ``busy_timeout``; database errors are logged and
+    counted, and the request proceeds as if the response were not
+    cached. Hit/miss counters are per process.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            used_at REAL NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        ttl_rules: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        touch_interval: float = 60.0,
+        busy_timeout: float = 0.05
+    ):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Database file, can be shared between processes
+            ttl_rules: Mapping of endpoint pattern to TTL in seconds
+            default_ttl: TTL for endpoints matching no pattern (0 disables)
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies
+            touch_interval: Seconds between use-time updates of an entry
+            busy_timeout: Seconds to wait for another process's write lock
+                (blocks the event loop, so keep it short)
+            
+        Raises:
+            ValueError: If a TTL or limit is invalid
+        """
+        super().__init__(ttl_rules, default_ttl, max_entries)
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer")
+        
+        self.path = path
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._stats["errors"] = 0
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+    
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+    
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        row = self._conn.execute(
+            "SELECT body, etag, last_modified, fetched_at, expires_at, used_at "
+            "FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        body, etag, last_modified, fetched_at, expires_at, used_at = row
+        now = time.time()
+        if now - used_at >= self.touch_interval:
+            try:
+                self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+            except sqlite3.Error as e:
+                # The use time can wait for the next lookup
+                self._failed("touch", e)
+        return CacheEntry(json.loads(body), etag, last_modified, fetched_at, expires_at)
+    
+    def _failed(self, operation: str, error: sqlite3.Error) -> None:
+        """Record a database error the request path carries on without."""
+        self._stats["errors"] += 1
+        logger.warning("Response cache %s failed: %s", operation, error, extra={"cache": self.path})
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        try:
+            entry = self._load(key)
+        except sqlite3.Error as e:
+            self._failed("lookup", e)
+            entry = None
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        
+        if entry.is_fresh():
+            self._stats["hits"] += 1
+            return entry
+        
+        if not entry.validators():
+            self.invalidate(key)
+            self._stats["misses"] += 1
+            return None
+        
+        return entry
+    
+    def store(
+        self,
+        key: str,
+        endpoint: str,
+        data: Any,
+        headers: Mapping[str, str]
+    ) -> Optional[CacheEntry]:
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or 'no-store' in headers.get('Cache-Control', ''):
+            self.invalidate(key)
+            return None
+        
+        body = json.dumps(data, separators=(',', ':')).encode()
+        if len(body) > self.max_bytes:
+            self.invalidate(key)
+            return None
+        
+        now = time.time()
+        entry = CacheEntry(
+            data=data,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            fetched_at=now,
+            expires_at=now + ttl
+        )
+        
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            previous = self._conn.execute(
+                "SELECT expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if previous is not None and previous[0] <= now:
+                # A conditional request that came back with a new body
+                self._stats["misses"] += 1
+            
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, body, entry.etag, entry.last_modified, now, entry.expires_at, now, len(body))
+            )
+            self._stats["stores"] += 1
+            self._evict()
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            self._rollback()
+            self._failed("store", e)
+            return None
+        except BaseException:
+            self._rollback()
+            raise
+        
+        return entry
+    
+    def _rollback(self) -> None:
+        if self._conn.in_transaction:
+            self._conn.execute("ROLLBACK")
+    
+    def _evict(self) -> None:
+        """Delete least recently used entries until both limits hold."""
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        
+        victims = []
+        for key, entry_size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY used_at"
+        ):
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            size -= entry_size
+        
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._stats["evictions"] += len(victims)
+    
+    def revalidated(
+        self,
+        key: str,
+        endpoint: str,
+        headers: Mapping[str, str]
+    ) -> Optional[CacheEntry]:
+        now = time.time()
+        try:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, expires_at = ?, used_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE key = ?",
+                (now, now + self.ttl_for(endpoint), now,
+                 headers.get('ETag'), headers.get('Last-Modified'), key)
+            )
+            entry = self._load(key)
+        except sqlite3.Error as e:
+            self._failed("revalidation", e)
+            return None
+        if entry is not None:
+            self._stats["revalidations"] += 1
+        return entry
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        try:
+            if key is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            self._failed("invalidation", e)
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"] + self._stats["revalidations"]
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return {
+            **self._stats,
+            "size": count,
+            "bytes": size,
+            "hit_ratio": (self._stats["hits"] + self._stats["revalidations"]) / lookups if lookups else 0.0
+        }
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
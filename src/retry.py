@@ -0,0 +1,157 @@
+"""
+Retry policies and retry budgets for the HPE Aruba API client.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Tuple, Type
+
+import aiohttp
+
+# Methods that can be repeated without changing the outcome (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How a failed request is retried.
+    
+    Delays use exponential backoff with full jitter: attempt ``n`` sleeps a
+    random time in ``[0, min(max_delay, base_delay * 2 ** (n - 1))]`` so
+    that clients which failed together do not retry together.
+    
+    Non-idempotent requests (e.g. POST) are only retried when
+    ``retry_non_idempotent`` is set or the caller marks the request as
+    safe, except for 429 responses, which the server rejected before
+    processing.
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_on_status: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    retry_on_exceptions: Tuple[Type[BaseException], ...] = field(
+        default=(aiohttp.ClientError, asyncio.TimeoutError)
+    )
+    retry_non_idempotent: bool = False
+    
+    def __post_init__(self):
+        if not isinstance(self.max_attempts, int) or self.max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer")
+        
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("delays must be non-negative")
+    
+    def backoff(self, attempt: int, rng: Optional[random.Random] = None) -> float:
+        """
+        Delay before the next attempt.
+        
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            rng: Random source (defaults to the module generator)
+            
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return (rng or random).uniform(0, ceiling)
+    
+    def is_retryable(
+        self,
+        status_code: Optional[int],
+        cause: Optional[BaseException],
+        idempotent: bool
+    ) -> bool:
+        """
+        Whether a failure qualifies for a retry under this policy.
+        
+        Args:
+            status_code: HTTP status of the failed response, if any
+            cause: Underlying transport exception, if any
+            idempotent: Whether the request is safe to repeat
+            
+        Returns:
+            True if the failure may be retried
+        """
+        if status_code is not None:
+            if status_code not in self.retry_on_status:
+                return False
+            return status_code == 429 or idempotent or self.retry_non_idempotent
+        
+        if cause is not None and isinstance(cause, self.retry_on_exceptions):
+            return idempotent or self.retry_non_idempotent
+        
+        return False
+
+# Retries disabled
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent traffic.
+    
+    Every original request deposits ``ratio`` tokens and every retry spends
+    one, with a small ``min_per_second`` allowance so that low-traffic
+    clients can still retry. During an outage, when most requests fail,
+    retries therefore add at most ``ratio`` extra load instead of
+    multiplying it by the attempt count.
+    """
+    
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 100.0):
+        """
+        Initialize the retry budget.
+        
+        Args:
+            ratio: Retries allowed per original request
+            min_per_second: Retries always allowed per second
+            max_tokens: Maximum accumulated retry allowance
+            
+        Raises:
+            ValueError: If any parameter is negative
+        """
+        if ratio < 0 or min_per_second < 0 or max_tokens < 1:
+            raise ValueError("Invalid retry budget parameters")
+        
+        self.ratio = float(ratio)
+        self.min_per_second = float(min_per_second)
+        self.max_tokens = float(max_tokens)
+        self._tokens = min(self.max_tokens, 10 * self.min_per_second)
+        self._updated = time.monotonic()
+        self.retries = 0
+        self.rejected = 0
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+    
+    def record_request(self) -> None:
+        """Credit the budget for an original (non-retry) request."""
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+    
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget.
+        
+        Returns:
+            True if the retry may proceed
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.retries += 1
+            return True
+        self.rejected += 1
+        return False
+    
+    def stats(self) -> Dict[str, float]:
+        """Retry and rejection counters."""
+        self._refill()
+        return {
+            "available": self._tokens,
+            "retries": self.retries,
+            "rejected": self.rejected
+        }
@@ -0,0 +1,160 @@
+"""
+Priority admission scheduling for the HPE Aruba API client.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Mapping, Optional
+
+# Priority classes
+CRITICAL = "critical"
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (CRITICAL, INTERACTIVE, BULK)
+
+# Share of admissions for the weighted classes when both are waiting
+DEFAULT_WEIGHTS = {INTERACTIVE: 4, BULK: 1}
+
+class PriorityScheduler:
+    """
+    Hands out admissions from a shared gate in priority order.
+    
+    The gate is any coroutine granting one admission, such as the rate
+    limiter's ``acquire`` or a lock's ``acquire``. A single dispatcher
+    obtains admissions one at a time and only then picks who gets each
+    one, so a request that arrives while the dispatcher waits still
+    competes for that admission:
+    
+    - ``critical`` requests always win, so they are admitted by the next
+      admission the gate grants (one token interval under the rate
+      limiter) however much other work is queued.
+    - ``interactive`` and ``bulk`` requests share the remaining admissions
+      by weight (smooth weighted round robin), so bulk work is slowed
+      but never starved.
+    """
+    
+    def __init__(
+        self,
+        admit: Callable[[], Awaitable[Any]],
+        give_back: Callable[[], None],
+        weights: Optional[Mapping[str, int]] = None
+    ):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            admit: Coroutine function waiting for one admission
+            give_back: Returns an admission that nobody claimed
+            weights: Weights of the interactive and bulk classes
+            
+        Raises:
+            ValueError: If a weight is missing or not positive
+        """
+        weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        for priority in (INTERACTIVE, BULK):
+            if not isinstance(weights.get(priority), int) or weights[priority] < 1:
+                raise ValueError(f"weight for {priority} must be a positive integer")
+        
+        self._admit = admit
+        self._give_back = give_back
+        self.weights = {priority: weights[priority] for priority in (INTERACTIVE, BULK)}
+        self._queues: Dict[str, Deque["asyncio.Future[None]"]] = {p: deque() for p in PRIORITIES}
+        self._current = {priority: 0 for priority in self.weights}
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
+        self.admitted = {priority: 0 for priority in PRIORITIES}
+        self.max_wait = {priority: 0.0 for priority in PRIORITIES}
+    
+    async def acquire(self, priority: str = INTERACTIVE) -> float:
+        """
+        Wait for an admission.
+        
+        Args:
+            priority: Priority class of the request
+            
+        Returns:
+            Seconds spent waiting
+            
+        Raises:
+            ValueError: If the priority class is unknown
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Invalid priority: {priority}")
+        
+        started = time.monotonic()
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._queues[priority].append(future)
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Granted, but cancelled before the caller could use it
+            if future.done() and not future.cancelled():
+                self._give_back()
+            raise
+        
+        waited = time.monotonic() - started
+        self.admitted[priority] += 1
+        self.max_wait[priority] = max(self.max_wait[priority], waited)
+        return waited
+    
+    def _waiting(self, priority: str) -> bool:
+        """Whether a class has a live waiter, dropping cancelled ones."""
+        queue = self._queues[priority]
+        while queue and queue[0].done():
+            queue.popleft()
+        return bool(queue)
+    
+    def _pick(self) -> Optional[str]:
+        """Choose the class receiving the next admission."""
+        if self._waiting(CRITICAL):
+            return CRITICAL
+        
+        ready = [priority for priority in self.weights if self._waiting(priority)]
+        if not ready:
+            return None
+        if len(ready) == 1:
+            return ready[0]
+        
+        # Smooth weighted round robin
+        for priority in ready:
+            self._current[priority] += self.weights[priority]
+        chosen = max(ready, key=lambda p: self._current[p])
+        self._current[chosen] -= sum(self.weights[p] for p in ready)
+        return chosen
+    
+    async def _dispatch(self) -> None:
+        try:
+            while any(self._waiting(priority) for priority in PRIORITIES):
+                await self._admit()
+                priority = self._pick()
+                if priority is None:
+                    self._give_back()
+                    break
+                self._queues[priority].popleft().set_result(None)
+        except BaseException as e:
+            # Waiters cannot be admitted without a dispatcher
+            for queue in self._queues.values():
+                while queue:
+                    future = queue.popleft()
+                    if not future.done():
+                        if isinstance(e, Exception):
+                            future.set_exception(e)
+                        else:
+                            future.cancel()
+            raise
+        finally:
+            self._dispatcher = None
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, admissions and worst wait per priority class."""
+        return {
+            priority: {
+                "queued": sum(not f.done() for f in self._queues[priority]),
+                "admitted": self.admitted[priority],
+                "max_wait": self.max_wait[priority]
+            }
+            for priority in PRIORITIES
+        }
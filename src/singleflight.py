@@ -0,0 +1,64 @@
+"""
+Coalescing of identical concurrent operations for the HPE Aruba API client.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+class SingleFlight:
+    """
+    Run at most one instance of an operation per key at a time.
+    
+    Callers that arrive while an operation for the same key is in flight
+    wait for that operation instead of starting their own, and all of them
+    receive its result or exception. The shared operation runs as its own
+    task, so one caller being cancelled does not cancel it for the others.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.started = 0
+        self.coalesced = 0
+    
+    def __len__(self) -> int:
+        return len(self._calls)
+    
+    async def do(self, key: Hashable, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``operation`` or join an identical in-flight run.
+        
+        Args:
+            key: Identity of the operation
+            operation: Zero-argument coroutine factory
+            
+        Returns:
+            The shared operation's result
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(operation())
+            self._calls[key] = task
+            self.started += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        
+        return await asyncio.shield(task)
+    
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """Drop a finished operation so the next call starts a fresh one."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        """Started and coalesced call counters."""
+        return {
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls)
+        }
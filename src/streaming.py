@@ -0,0 +1,205 @@
+"""
+Incremental JSON parsing for large HPE Aruba list responses.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, List, Optional
+
+# Characters that change the nesting structure outside of strings
+_STRUCTURE = re.compile(r'["{}\[\],]')
+# Characters that end or escape inside a string
+_STRING_SPECIAL = re.compile(r'["\\]')
+# Separators between array elements
+_SEPARATOR = re.compile(r'[\s,]*')
+# Characters that may follow a number inside an array
+_NUMBER_END = frozenset(' \t\r\n,]')
+
+class JSONArrayStream:
+    """
+    Extracts the elements of one array from a JSON document fed in chunks.
+    
+    The array is named by a dotted path of object keys from the document
+    root (``"devices"``, ``"data.items"``; ``""`` for a top-level array).
+    Chunks are passed to ``feed()``, which returns the elements completed
+    so far, so only the element being received is held in memory no
+    matter how large the document is. Elements are decoded with the
+    standard library's C scanner; everything outside the array is only
+    scanned for structure, not validated, and ignored.
+    """
+    
+    def __init__(self, path: str, max_item_size: int = 10 * 1024 * 1024):
+        """
+        Initialize the parser.
+        
+        Args:
+            path: Dotted key path of the array
+            max_item_size: Largest single element accepted, in characters
+        """
+        self.path = [segment for segment in path.split('.') if segment]
+        self.max_item_size = max_item_size
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ""
+        # Open containers: the key being read for objects, None for arrays
+        self._stack: List[Optional[str]] = []
+        self._is_object: List[bool] = []
+        self._expect_key = False
+        self._in_array = False
+        self.found = False
+        self.finished = False
+        self.items = 0
+    
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Add a chunk of the document.
+        
+        Args:
+            chunk: Next bytes of the UTF-8 document
+            
+        Returns:
+            Array elements completed by this chunk
+            
+        Raises:
+            ValueError: If an element is malformed or too large
+        """
+        if self.finished:
+            return []
+        self._buffer += self._text.decode(chunk)
+        return self._process(final=False)
+    
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the document.
+        
+        Returns:
+            Remaining array elements
+            
+        Raises:
+            ValueError: If the document ended inside the array
+        """
+        if self.finished:
+            return []
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._process(final=True)
+        if self._in_array:
+            raise ValueError("JSON document ended inside the streamed array")
+        return items
+    
+    def _process(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        pos = 0
+        while not self.finished:
+            if self._in_array:
+                pos, done = self._read_items(pos, final, items)
+            else:
+                pos, done = self._navigate(pos)
+            if done:
+                break
+        self._buffer = self._buffer[pos:] if not self.finished else ""
+        return items
+    
+    def _navigate(self, pos: int):
+        """Scan structure up to the target array. Returns (position, needs more data)."""
+        text = self._buffer
+        while True:
+            match = _STRUCTURE.search(text, pos)
+            if match is None:
+                return len(text), True
+            
+            index = match.start()
+            char = text[index]
+            
+            if char == '"':
+                end = self._string_end(text, index + 1)
+                if end is None:
+                    return index, True
+                if self._expect_key and self._is_object and self._is_object[-1]:
+                    self._stack[-1] = json.loads(text[index:end + 1])
+                    self._expect_key = False
+                pos = end + 1
+            elif char == '{':
+                self._stack.append(None)
+                self._is_object.append(True)
+                self._expect_key = True
+                pos = index + 1
+            elif char == '[':
+                if not self.found and all(self._is_object) and self._stack == self.path:
+                    self.found = True
+                    self._in_array = True
+                    return index + 1, False
+                self._stack.append(None)
+                self._is_object.append(False)
+                pos = index + 1
+            elif char in '}]':
+                if self._stack:
+                    self._stack.pop()
+                    self._is_object.pop()
+                self._expect_key = False
+                pos = index + 1
+                if not self._stack:
+                    self.finished = True
+                    return pos, True
+            else:  # ','
+                self._expect_key = bool(self._is_object) and self._is_object[-1]
+                pos = index + 1
+    
+    def _read_items(self, pos: int, final: bool, items: List[Any]):
+        """Decode complete elements of the target array. Returns (position, needs more data)."""
+        text = self._buffer
+        while True:
+            pos = _SEPARATOR.match(text, pos).end()
+            if pos >= len(text):
+                return pos, True
+            
+            if text[pos] == ']':
+                self._in_array = False
+                # Only the array was wanted; ignore the rest of the document
+                self.finished = True
+                return pos + 1, True
+            
+            try:
+                item, end = self._decoder.raw_decode(text, pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    if self._truncated(text, e):
+                        # close() reports the document ended inside the array
+                        return pos, True
+                    raise ValueError("Malformed element in streamed JSON array")
+                if len(text) - pos > self.max_item_size:
+                    raise ValueError("Streamed JSON array element too large")
+                return pos, True
+            
+            # A number is only complete once a delimiter follows it
+            if isinstance(item, (int, float)) and not isinstance(item, bool):
+                if end >= len(text) or text[end] not in _NUMBER_END:
+                    if not final:
+                        return pos, True
+                    if end < len(text):
+                        raise ValueError("Malformed element in streamed JSON array")
+            
+            items.append(item)
+            self.items += 1
+            pos = end
+    
+    @staticmethod
+    def _truncated(text: str, error: json.JSONDecodeError) -> bool:
+        """Whether a decode error is due to the text ending mid-element."""
+        if error.pos >= len(text) or error.msg.startswith("Unterminated"):
+            return True
+        rest = text[error.pos:].rstrip()
+        return any(literal.startswith(rest) for literal in ("true", "false", "null"))
+    
+    @staticmethod
+    def _string_end(text: str, pos: int) -> Optional[int]:
+        """Index of the quote closing a string whose content starts at ``pos``."""
+        while True:
+            match = _STRING_SPECIAL.search(text, pos)
+            if match is None:
+                return None
+            if text[match.start()] == '"':
+                return match.start()
+            if match.start() + 1 >= len(text):
+                return None
+            pos = match.start() + 2
@@ -0,0 +1,194 @@
+"""
+Connection-phase tracing for the HPE Aruba API client.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RequestSpan:
+    """
+    Timing breakdown of one HTTP request.
+    
+    Phase durations are in seconds and None when the phase did not occur
+    (e.g. no DNS lookup or connect on a reused connection). ``connect``
+    covers TCP connect plus TLS handshake, which aiohttp does not report
+    separately, excluding DNS. ``ttfb`` is server time from request
+    headers sent until response headers received.
+    """
+    method: str
+    host: str
+    path: str
+    endpoint: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    queued: Optional[float] = None
+    dns: Optional[float] = None
+    dns_cache_hit: Optional[bool] = None
+    connect: Optional[float] = None
+    connection_reused: bool = False
+    ttfb: Optional[float] = None
+    total: Optional[float] = None
+    status: Optional[int] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class RequestTracer:
+    """
+    Records per-request connection phases using aiohttp trace hooks.
+    
+    Finished spans are kept in a bounded ring buffer (see ``dump()``) and
+    optionally passed to a callback, e.g. to forward them to a tracing
+    backend. Query strings are never recorded.
+    """
+    
+    def __init__(
+        self,
+        capacity: int = 1000,
+        callback: Optional[Callable[[RequestSpan], None]] = None
+    ):
+        """
+        Initialize the tracer.
+        
+        Args:
+            capacity: Number of finished spans kept in memory
+            callback: Called with each finished span
+            
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        
+        self.callback = callback
+        self._spans: Deque[RequestSpan] = deque(maxlen=capacity)
+    
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build a TraceConfig feeding this tracer.
+        
+        Returns:
+            Trace configuration for ``aiohttp.ClientSession(trace_configs=...)``
+        """
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_connection_queued_start.append(self._mark("queued_start"))
+        config.on_connection_queued_end.append(self._mark("queued_end"))
+        config.on_connection_create_start.append(self._mark("create_start"))
+        config.on_connection_create_end.append(self._mark("create_end"))
+        config.on_dns_resolvehost_start.append(self._mark("dns_start"))
+        config.on_dns_resolvehost_end.append(self._mark("dns_end"))
+        config.on_dns_cache_hit.append(self._on_dns_cache(True))
+        config.on_dns_cache_miss.append(self._on_dns_cache(False))
+        config.on_connection_reuseconn.append(self._on_reuse)
+        config.on_request_headers_sent.append(self._mark("headers_sent"))
+        config.on_request_end.append(self._on_request_end)
+        config.on_request_exception.append(self._on_request_exception)
+        return config
+    
+    async def _on_request_start(self, session, ctx, params) -> None:
+        request_ctx = ctx.trace_request_ctx if isinstance(ctx.trace_request_ctx, dict) else {}
+        ctx.span = RequestSpan(
+            method=params.method,
+            host=params.url.host or "",
+            path=params.url.path,
+            endpoint=request_ctx.get("endpoint")
+        )
+        ctx.marks = {"start": time.monotonic()}
+    
+    def _mark(self, name: str):
+        async def hook(session, ctx, params) -> None:
+            if hasattr(ctx, "marks"):
+                ctx.marks[name] = time.monotonic()
+        return hook
+    
+    def _on_dns_cache(self, hit: bool):
+        async def hook(session, ctx, params) -> None:
+            if hasattr(ctx, "span"):
+                ctx.span.dns_cache_hit = hit
+        return hook
+    
+    async def _on_reuse(self, session, ctx, params) -> None:
+        if hasattr(ctx, "span"):
+            ctx.span.connection_reused = True
+    
+    async def _on_request_end(self, session, ctx, params) -> None:
+        if hasattr(ctx, "span"):
+            ctx.span.status = params.response.status
+            self._finish(ctx)
+    
+    async def _on_request_exception(self, session, ctx, params) -> None:
+        if hasattr(ctx, "span"):
+            ctx.span.error = type(params.exception).__name__
+            self._finish(ctx)
+    
+    def _finish(self, ctx) -> None:
+        """Turn the recorded marks into phase durations and publish the span."""
+        span: RequestSpan = ctx.span
+        marks = ctx.marks
+        end = time.monotonic()
+        
+        def between(start: str, stop: str) -> Optional[float]:
+            if start in marks and stop in marks:
+                return max(0.0, marks[stop] - marks[start])
+            return None
+        
+        span.queued = between("queued_start", "queued_end")
+        span.dns = between("dns_start", "dns_end")
+        create = between("create_start", "create_end")
+        if create is not None:
+            span.connect = max(0.0, create - (span.dns or 0.0))
+        if "headers_sent" in marks and span.error is None:
+            span.ttfb = max(0.0, end - marks["headers_sent"])
+        span.total = end - marks["start"]
+        
+        self._spans.append(span)
+        if self.callback is not None:
+            try:
+                self.callback(span)
+            except Exception as e:
+                logger.warning("Trace callback failed", extra={"error_type": type(e).__name__})
+    
+    def dump(self, clear: bool = False) -> List[Dict[str, Any]]:
+        """
+        Finished spans, oldest first.
+        
+        Args:
+            clear: Empty the ring buffer afterwards
+            
+        Returns:
+            Spans as dictionaries
+        """
+        spans = [span.to_dict() for span in self._spans]
+        if clear:
+            self._spans.clear()
+        return spans
+    
+    def summary(self) -> Dict[str, Any]:
+        """Connection reuse ratio and mean phase durations over the buffered spans."""
+        spans = list(self._spans)
+        if not spans:
+            return {"requests": 0}
+        
+        def mean(name: str) -> Optional[float]:
+            values = [getattr(s, name) for s in spans if getattr(s, name) is not None]
+            return sum(values) / len(values) if values else None
+        
+        return {
+            "requests": len(spans),
+            "connection_reuse_ratio": sum(s.connection_reused for s in spans) / len(spans),
+            "errors": sum(s.error is not None for s in spans),
+            "mean_queued": mean("queued"),
+            "mean_dns": mean("dns"),
+            "mean_connect": mean("connect"),
+            "mean_ttfb": mean("ttfb"),
+            "mean_total": mean("total")
+        }
@@ -0,0 +1,157 @@
+"""
+HTTP transports for the HPE Aruba API client.
+
+The client talks to an aiohttp-style session: ``request(...)`` returns an
+async context manager yielding a response with ``status``, ``headers``,
+``read()`` and ``content.iter_chunked()``, and transport failures raise
+``aiohttp.ClientError`` or ``asyncio.TimeoutError``. aiohttp's
+``ClientSession`` is the default; ``HTTP2Transport`` provides the same
+interface over httpx.
+"""
+
+import asyncio
+import ssl
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Mapping, Optional, Union
+
+import aiohttp
+
+# Optional HTTP/2 backend
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+class _StreamReader:
+    """``response.content`` of an HTTP2Transport response."""
+    
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.total_bytes = 0  # decoded
+    
+    @property
+    def total_raw_bytes(self) -> int:
+        return self._response.num_bytes_downloaded
+    
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.aiter_bytes(size):
+                self.total_bytes += len(chunk)
+                yield chunk
+        except httpx.HTTPError as e:
+            raise _client_error(e) from e
+
+class _Response:
+    """aiohttp-style view of an httpx response."""
+    
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.http_version = response.http_version
+        self.content = _StreamReader(response)
+    
+    async def read(self) -> bytes:
+        try:
+            return await self._response.aread()
+        except httpx.HTTPError as e:
+            raise _client_error(e) from e
+
+def _client_error(error: Exception) -> BaseException:
+    """Map an httpx error to the aiohttp/asyncio error the client handles."""
+    if isinstance(error, httpx.TimeoutException):
+        return asyncio.TimeoutError()
+    if isinstance(error, httpx.DecodingError):
+        return aiohttp.ClientPayloadError(str(error))
+    return aiohttp.ClientConnectionError(str(error))
+
+class HTTP2Transport:
+    """
+    HTTP/2 session backed by httpx (``pip install httpx[http2]``).
+    
+    Concurrent requests to one host are multiplexed over a single
+    connection instead of one TCP+TLS connection each. The server picks
+    the protocol during the TLS handshake, so hosts without HTTP/2 are
+    served over HTTP/1.1. Timeouts apply to each connect, read and write
+    rather than to the whole request.
+    
+    Pass the class (or a ``functools.partial`` of it) as
+    ``ArubaAPIClient(transport=...)``.
+    """
+    
+    def __init__(
+        self,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 30,
+        max_connections: int = 10,
+        verify: Union[bool, ssl.SSLContext] = True
+    ):
+        """
+        Initialize the transport.
+        
+        Args:
+            headers: Headers sent with every request
+            timeout: Timeout in seconds
+            max_connections: Connection limit (each multiplexes many requests)
+            verify: TLS verification (False or a custom SSL context)
+            
+        Raises:
+            ImportError: If httpx or its HTTP/2 support is not installed
+        """
+        if httpx is None:
+            raise ImportError("HTTP2Transport requires httpx: pip install 'httpx[http2]'")
+        
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        # Raises ImportError if the h2 package is missing
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(max_connections=max_connections),
+            verify=verify
+        )
+    
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+    
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        **options: Any
+    ) -> AsyncIterator[_Response]:
+        """
+        Send a request (same call as ``aiohttp.ClientSession.request``).
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            data: Request body
+            headers: Extra request headers
+            timeout: aiohttp timeout; its ``sock_read`` becomes the read timeout
+            **options: aiohttp-only options (e.g. ``trace_request_ctx``), ignored
+            
+        Yields:
+            Response whose body has not been read yet
+        """
+        request_timeout = None
+        if timeout is not None:
+            request_timeout = httpx.Timeout(self.timeout, read=timeout.sock_read or timeout.total)
+        
+        try:
+            async with self._client.stream(
+                method, url, content=data, headers=headers,
+                **({"timeout": request_timeout} if request_timeout else {})
+            ) as response:
+                yield _Response(response)
+        except httpx.HTTPError as e:
+            raise _client_error(e) from e
+    
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -4,15 +4,100 @@ Comprehensive test suite for the enhanced HPE Aruba API client.
 
 import pytest
 import asyncio
+import json
+import logging
+import sqlite3
+import time
 from unittest.mock import Mock, patch, AsyncMock
-from aiohttp import ClientError, ClientTimeout
+from aiohttp import ClientError, ClientTimeout, ClientPayloadError
 
 # Import our improved modules
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from api_client import ArubaAPIClient, ValidationError, APIError
+from api_client import ArubaAPIClient, ValidationError, APIError, CircuitOpenError, DeadlineExceeded
+from response_cache import ResponseCache, SQLiteResponseCache
+from retry import RetryPolicy, RetryBudget
+from codec import JSONCodec
+from circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from hedging import Hedger
+from tracing import RequestTracer
+from auth import AccessToken, OAuthTokenProvider
+from deadline import deadline
+from log_queue import LogSampler
+
+class FakeResponse:
+    """Canned aiohttp-style response used by FakeSession."""
+    
+    def __init__(self, status=200, payload=None, headers=None, delay=0.0, body=None):
+        self.status = status
+        self.payload = payload if payload is not None else {}
+        self.headers = headers or {}
+        self.delay = delay
+        self.body = body if body is not None else json.dumps(self.payload).encode()
+    
+    async def json(self):
+        return self.payload
+    
+    async def read(self):
+        return self.body
+    
+    @property
+    def content(self):
+        return FakeStreamReader(self.body)
+
+class FakeStreamReader:
+    """Serves a body in small chunks; ClientError instances in the body list are raised."""
+    
+    def __init__(self, body):
+        self.parts = body if isinstance(body, list) else [body]
+    
+    async def iter_chunked(self, size):
+        for part in self.parts:
+            if isinstance(part, BaseException):
+                raise part
+            for i in range(0, len(part), 7):
+                await asyncio.sleep(0)
+                yield part[i:i + 7]
+
+class FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession that replays canned responses."""
+    
+    def __init__(self, responses):
+        self._responses = responses
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def _next_response(self, method, url):
+        if callable(self._responses):
+            return self._responses(method, url)
+        return self._responses.pop(0)
+    
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return _FakeRequestContext(self, self._next_response(method, url))
+
+class _FakeRequestContext:
+    def __init__(self, session, response):
+        self.session = session
+        self.response = response
+    
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+        try:
+            if isinstance(self.response, BaseException):
+                raise self.response
+            await asyncio.sleep(self.response.delay)
+        except BaseException:
+            self.session.in_flight -= 1
+            raise
+        return self.response
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.session.in_flight -= 1
 
 class TestArubaAPIClient:
     """Test cases for ArubaAPIClient with comprehensive coverage."""
@@ -344,5 +429,1235 @@ class TestArubaAPIClient:
         with pytest.raises(ValidationError, match="Invalid severity"):
             await client.get_threats(severity="invalid")
 
+class TestConcurrentMode:
+    """Test cases for the token-bucket concurrent request mode."""
+    
+    def test_init_concurrent_mode(self):
+        """Test concurrent mode is enabled by a requests-per-second quota."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+        assert not client.concurrent
+        
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=25, burst=50, max_connections=40
+        )
+        assert client.concurrent
+        assert client._rate_limiter.rate == 25
+        assert client._rate_limiter.capacity == 50
+        assert client.max_connections == 40
+        
+        with pytest.raises(ValueError, match="max_connections"):
+            ArubaAPIClient("https://api.example.com", "valid_key_123", max_connections=0)
+    
+    @pytest.mark.asyncio
+    async def test_requests_overlap(self):
+        """Test requests overlap in concurrent mode."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, burst=10
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"ok": True}, delay=0.05))
+        
+        results = await asyncio.gather(*(client._make_request("GET", "/api/test") for _ in range(10)))
+        
+        assert results == [{"ok": True}] * 10
+        assert client.session.max_in_flight == 10
+    
+    @pytest.mark.asyncio
+    async def test_serialized_mode_single_in_flight(self):
+        """Test the default mode still issues one request at a time."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+        client.rate_limit_delay = 0
+        client.session = FakeSession(lambda m, u: FakeResponse(delay=0.01))
+        
+        await asyncio.gather(*(client._make_request("GET", "/api/test") for _ in range(5)))
+        
+        assert client.session.max_in_flight == 1
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_retry_releases_lock(self):
+        """Test a 429 backs off without blocking other callers."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+        client.rate_limit_delay = 0
+        client.session = FakeSession([
+            FakeResponse(status=429, headers={'Retry-After': '0'}),
+            FakeResponse(payload={"status": "success"})
+        ])
+        
+        result = await client._make_request("GET", "/api/test")
+        
+        assert result == {"status": "success"}
+        assert len(client.session.calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_adaptive_limiter_follows_headers(self):
+        """Test response rate-limit headers adjust the concurrent limiter."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=50
+        )
+        client.session = FakeSession([FakeResponse(headers={
+            'X-RateLimit-Limit-second': '10',
+            'X-RateLimit-Remaining-second': '9',
+            'X-RateLimit-Remaining-day': '9000'
+        })])
+        
+        await client._make_request("GET", "/api/test")
+        
+        status = client.rate_limit_status()
+        assert status["limit_second"] == 10
+        assert status["remaining_day"] == 9000
+        assert status["rate"] <= 10
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_pauses_limiter(self):
+        """Test a 429 in concurrent mode pauses the limiter instead of sleeping per caller."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=100
+        )
+        client.session = FakeSession([
+            FakeResponse(status=429, headers={'Retry-After': '0.05'}),
+            FakeResponse(payload={"status": "success"})
+        ])
+        
+        result = await client._make_request("GET", "/api/test")
+        
+        assert result == {"status": "success"}
+        assert client.rate_limit_status()["rate_limited_count"] == 1
+
+class TestBulkDeviceStatus:
+    """Test cases for the streaming bulk device status API."""
+    
+    @pytest.mark.asyncio
+    async def test_iter_device_statuses(self):
+        """Test results stream per device and failures do not abort the batch."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000
+        )
+        
+        def respond(method, url):
+            if "AP-2" in url:
+                return FakeResponse(status=404)
+            return FakeResponse(payload={"url": url})
+        
+        client.session = FakeSession(respond)
+        
+        results = {}
+        async for device_id, result in client.iter_device_statuses(
+            ["AP-1", "AP-2", "bad id", "AP-3"], concurrency=2
+        ):
+            results[device_id] = result
+        
+        assert set(results) == {"AP-1", "AP-2", "bad id", "AP-3"}
+        assert results["AP-1"] == {"url": "https://api.example.com/api/v2/devices/AP-1/status"}
+        assert isinstance(results["AP-2"], APIError)
+        assert "Resource not found" in str(results["AP-2"])
+        assert isinstance(results["bad id"], ValidationError)
+        assert len(client.session.calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_iter_device_statuses_bounded(self):
+        """Test in-flight requests never exceed the concurrency limit."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(delay=0.01))
+        
+        device_ids = (f"AP-{i}" for i in range(20))
+        count = 0
+        async for _ in client.iter_device_statuses(device_ids, concurrency=4):
+            count += 1
+        
+        assert count == 20
+        assert client.session.max_in_flight <= 4
+    
+    @pytest.mark.asyncio
+    async def test_iter_device_statuses_early_exit(self):
+        """Test breaking out of the iterator cancels outstanding work."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(delay=0.01))
+        
+        iterator = client.iter_device_statuses((f"AP-{i}" for i in range(100)), concurrency=2)
+        async for _ in iterator:
+            break
+        await iterator.aclose()
+        
+        assert len(client.session.calls) < 100
+    
+    @pytest.mark.asyncio
+    async def test_iter_device_statuses_invalid_concurrency(self):
+        """Test invalid concurrency is rejected."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+        
+        with pytest.raises(ValidationError, match="concurrency"):
+            async for _ in client.iter_device_statuses(["AP-1"], concurrency=0):
+                pass
+
+class TestResponseCaching:
+    """Test cases for GET response caching in the client."""
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_request(self):
+        """Test a fresh cached GET does not hit the network."""
+        cache = ResponseCache({"/api/v2/devices/*/status": 60})
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, cache=cache
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"status": "online"}))
+        
+        first = await client.get_device_status("AP-1")
+        second = await client.get_device_status("AP-1")
+        
+        assert first == second == {"status": "online"}
+        assert len(client.session.calls) == 1
+        assert cache.stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_cache_revalidates_with_etag(self):
+        """Test a stale entry is revalidated with If-None-Match and a 304 reuses it."""
+        cache = ResponseCache({"/api/v2/security/threats": 60})
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, cache=cache
+        )
+        client.session = FakeSession([
+            FakeResponse(payload={"threats": [1]}, headers={"ETag": '"abc"'}),
+            FakeResponse(status=304, headers={"ETag": '"abc"'})
+        ])
+        
+        await client.get_threats(limit=10)
+        for entry in cache._entries.values():
+            entry.expires_at = 0
+        result = await client.get_threats(limit=10)
+        
+        assert result == {"threats": [1]}
+        assert client.session.calls[1][2]["headers"] == {"If-None-Match": '"abc"'}
+        assert cache.stats()["revalidations"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_cache_ignores_writes_and_unconfigured(self):
+        """Test POSTs and endpoints without a TTL bypass the cache."""
+        cache = ResponseCache({"/api/v2/devices/*/status": 60})
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, cache=cache
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"ok": True}))
+        
+        await client.quarantine_device("AP-1")
+        await client.quarantine_device("AP-1")
+        await client._make_request("GET", "/api/v2/other")
+        await client._make_request("GET", "/api/v2/other")
+        
+        assert len(client.session.calls) == 4
+        assert len(cache) == 0
+    
+    def test_request_key_sorts_query(self):
+        """Test cache keys do not depend on query parameter order."""
+        key_a = ArubaAPIClient._request_key("GET", "https://h/p?b=2&a=1")
+        key_b = ArubaAPIClient._request_key("GET", "https://h/p?a=1&b=2")
+        assert key_a == key_b
+    
+    @pytest.mark.asyncio
+    async def test_shared_cache_is_scoped_per_tenant(self):
+        """Test clients with different credentials do not see each other's entries."""
+        cache = ResponseCache({"/api/v2/security/threats": 60})
+        tenants = []
+        for api_key in ("tenant_a_key_123", "tenant_b_key_123"):
+            client = ArubaAPIClient(
+                "https://api.example.com", api_key, requests_per_second=1000, cache=cache
+            )
+            client.session = FakeSession([FakeResponse(payload={"owner": api_key})])
+            tenants.append(await client.get_threats(limit=10))
+        
+        assert tenants == [{"owner": "tenant_a_key_123"}, {"owner": "tenant_b_key_123"}]
+        assert len(cache) == 2
+        
+        provider = OAuthTokenProvider(AsyncMock(), AccessToken("t", time.time() + 3600))
+        with pytest.raises(ValueError, match="cache_namespace"):
+            ArubaAPIClient("https://api.example.com", token_provider=provider, cache=cache)
+    
+    @pytest.mark.asyncio
+    async def test_locked_persistent_cache_does_not_fail_request(self, tmp_path):
+        """Test a cache locked by another process is bypassed."""
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteResponseCache(path, {"/api/v2/security/threats": 60})
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", requests_per_second=1000, cache=cache
+        )
+        client.session = FakeSession([FakeResponse(payload={"threats": [1]})])
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            assert await client.get_threats(limit=10) == {"threats": [1]}
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+            cache.close()
+        
+        assert cache._stats["errors"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_persistent_cache_warm_start(self, tmp_path):
+        """Test a new client revalidates entries cached by a previous run."""
+        path = str(tmp_path / "cache.db")
+        
+        async def run(response):
+            cache = SQLiteResponseCache(path, {"/api/v2/security/threats": 60})
+            client = ArubaAPIClient(
+                "https://api.example.com", "valid_key_123",
+                requests_per_second=1000, cache=cache
+            )
+            client.session = FakeSession([response])
+            try:
+                return await client.get_threats(limit=10), client.session.calls, cache
+            finally:
+                cache._conn.execute("UPDATE responses SET expires_at = 0")
+                cache.close()
+        
+        first, _, _ = await run(FakeResponse(payload={"threats": [1]}, headers={"ETag": '"abc"'}))
+        second, calls, cache = await run(FakeResponse(status=304, body=b""))
+        
+        assert first == second == {"threats": [1]}
+        assert calls[0][2]["headers"] == {"If-None-Match": '"abc"'}
+        assert cache._stats["revalidations"] == 1
+
+class TestRequestCoalescing:
+    """Test cases for single-flight coalescing of identical GETs."""
+    
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_request(self):
+        """Test overlapping identical GETs issue one upstream call."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, coalesce_requests=True
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"status": "online"}, delay=0.02))
+        
+        results = await asyncio.gather(*(client.get_device_status("AP-1") for _ in range(5)))
+        
+        assert results == [{"status": "online"}] * 5
+        assert len(client.session.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_coalesced_error_reaches_all_callers(self):
+        """Test every coalesced caller receives the shared APIError."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, coalesce_requests=True
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(status=404, delay=0.02))
+        
+        results = await asyncio.gather(
+            *(client.get_device_status("AP-1") for _ in range(3)),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(r, APIError) for r in results)
+        assert len(client.session.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_posts_and_distinct_gets_not_coalesced(self):
+        """Test writes and different URLs are never merged."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, coalesce_requests=True
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(delay=0.02))
+        
+        await asyncio.gather(
+            client.get_device_status("AP-1"),
+            client.get_device_status("AP-2"),
+            client.quarantine_device("AP-1"),
+            client.quarantine_device("AP-1")
+        )
+        
+        assert len(client.session.calls) == 4
+
+class TestRetries:
+    """Test cases for the retry engine in the request path."""
+    
+    FAST = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+    
+    def make_client(self, responses, **kwargs):
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, retry_policy=self.FAST, **kwargs
+        )
+        client.session = FakeSession(responses)
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_retries_transient_status(self):
+        """Test 502/503 responses are retried for GETs."""
+        client = self.make_client([
+            FakeResponse(status=502),
+            FakeResponse(status=503),
+            FakeResponse(payload={"ok": True})
+        ])
+        
+        assert await client._make_request("GET", "/api/test") == {"ok": True}
+        assert len(client.session.calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_retry_warnings_can_be_sampled(self):
+        """Test retry warnings share one message template whatever the delay."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", requests_per_second=1000,
+            retry_policy=RetryPolicy(max_attempts=4)
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(status=503))
+        sampler = LogSampler(burst=1)
+        records = []
+        
+        with patch.object(RetryPolicy, "backoff", side_effect=[0.011, 0.023, 0.037]), \
+                patch.object(logging.getLogger("api_client"), "handle", side_effect=records.append):
+            with pytest.raises(APIError):
+                await client._make_request("GET", "/api/test")
+        
+        retries = [r for r in records if "Retrying" in r.getMessage()]
+        assert len(retries) == 3
+        assert [sampler.filter(r) for r in retries] == [True, False, False]
+    
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Test the last error is raised once attempts are exhausted."""
+        client = self.make_client(lambda m, u: FakeResponse(status=503))
+        
+        with pytest.raises(APIError, match="Service unavailable") as exc_info:
+            await client._make_request("GET", "/api/test")
+        
+        assert exc_info.value.status_code == 503
+        assert len(client.session.calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_retries_network_errors(self):
+        """Test transient aiohttp errors are retried."""
+        client = self.make_client([
+            ClientError("reset"),
+            FakeResponse(payload={"ok": True})
+        ])
+        
+        assert await client._make_request("GET", "/api/test") == {"ok": True}
+    
+    @pytest.mark.asyncio
+    async def test_post_not_retried_unless_safe(self):
+        """Test non-idempotent POSTs are not retried unless marked safe."""
+        client = self.make_client(lambda m, u: FakeResponse(status=503))
+        
+        with pytest.raises(APIError):
+            await client.quarantine_device("AP-1")
+        assert len(client.session.calls) == 1
+        
+        with pytest.raises(APIError):
+            await client._make_request("POST", "/api/test", {"x": 1}, idempotent=True)
+        assert len(client.session.calls) == 4
+    
+    @pytest.mark.asyncio
+    async def test_post_retried_on_429(self):
+        """Test a 429 is retried even for POSTs since it was never processed."""
+        client = self.make_client([
+            FakeResponse(status=429, headers={'Retry-After': '0'}),
+            FakeResponse(payload={"status": "quarantined"})
+        ])
+        
+        assert await client.quarantine_device("AP-1") == {"status": "quarantined"}
+    
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self):
+        """Test 4xx responses other than 429 fail immediately."""
+        client = self.make_client(lambda m, u: FakeResponse(status=404))
+        
+        with pytest.raises(APIError, match="Resource not found"):
+            await client._make_request("GET", "/api/test")
+        assert len(client.session.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_retry_budget_caps_retries(self):
+        """Test an exhausted retry budget stops further retries."""
+        budget = RetryBudget(ratio=0, min_per_second=0)
+        client = self.make_client(lambda m, u: FakeResponse(status=503), retry_budget=budget)
+        
+        with pytest.raises(APIError):
+            await client._make_request("GET", "/api/test")
+        
+        assert len(client.session.calls) == 1
+        assert budget.stats()["rejected"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_per_endpoint_policy(self):
+        """Test endpoint patterns and per-call overrides select the policy."""
+        client = self.make_client(
+            lambda m, u: FakeResponse(status=503),
+            retry_policies={"/api/v2/devices/*/status": RetryPolicy(max_attempts=1)}
+        )
+        
+        with pytest.raises(APIError):
+            await client.get_device_status("AP-1")
+        assert len(client.session.calls) == 1
+        
+        with pytest.raises(APIError):
+            await client._make_request(
+                "GET", "/api/test",
+                retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+            )
+        assert len(client.session.calls) == 3
+
+class TestPagination:
+    """Test cases for paginated list endpoints on the client."""
+    
+    @pytest.mark.asyncio
+    async def test_iter_threats_all_pages(self):
+        """Test iter_threats walks every page of threats."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000
+        )
+        
+        def respond(method, url):
+            offset = int(url.split("offset=")[1].split("&")[0])
+            threats = [{"id": i} for i in range(offset, min(offset + 2, 5))]
+            return FakeResponse(payload={"threats": threats})
+        
+        client.session = FakeSession(respond)
+        
+        threats = [t async for t in client.iter_threats(severity="HIGH", page_size=2)]
+        
+        assert [t["id"] for t in threats] == [0, 1, 2, 3, 4]
+        assert all("severity=high" in call[1] for call in client.session.calls)
+    
+    def test_iter_threats_validation(self):
+        """Test iter_threats validates its parameters up front."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+        
+        with pytest.raises(ValidationError, match="page_size"):
+            client.iter_threats(page_size=5000)
+        
+        with pytest.raises(ValidationError, match="Invalid severity"):
+            client.iter_threats(severity="urgent")
+
+class TestCodec:
+    """Test cases for the pluggable JSON codec and raw mode."""
+    
+    @pytest.mark.asyncio
+    async def test_request_body_encoded_by_codec(self):
+        """Test request bodies are encoded with the configured codec."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, codec=JSONCodec()
+        )
+        client.session = FakeSession([FakeResponse(payload={"status": "quarantined"})])
+        
+        result = await client.quarantine_device("AP-1", reason="test")
+        
+        body = client.session.calls[0][2]["data"]
+        assert json.loads(body) == {"device_id": "AP-1", "action": "quarantine", "reason": "test"}
+        assert result == {"status": "quarantined"}
+    
+    @pytest.mark.asyncio
+    async def test_raw_mode_returns_bytes(self):
+        """Test raw mode passes the response body through undecoded."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000
+        )
+        client.session = FakeSession([FakeResponse(body=b'{"threats": []}')])
+        
+        result = await client._make_request("GET", "/api/v2/security/threats", raw=True)
+        
+        assert result == b'{"threats": []}'
+    
+    @pytest.mark.asyncio
+    async def test_invalid_and_empty_bodies(self):
+        """Test undecodable bodies map to an error payload and empty bodies to None."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000
+        )
+        client.session = FakeSession([
+            FakeResponse(body=b"<html>oops</html>"),
+            FakeResponse(status=204, body=b"")
+        ])
+        
+        assert await client._make_request("GET", "/api/a") == {"error": "Invalid JSON response"}
+        assert await client._make_request("GET", "/api/b") is None
+
+class TestClientMetrics:
+    """Test cases for request instrumentation in the client."""
+    
+    @pytest.mark.asyncio
+    async def test_requests_and_retries_recorded(self):
+        """Test outcomes, retries and limiter waits are recorded per template."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000,
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        )
+        client.session = FakeSession([
+            FakeResponse(status=503),
+            FakeResponse(payload={"status": "online"}),
+            ClientError("reset"),
+            ClientError("reset")
+        ])
+        
+        await client.get_device_status("AP-1")
+        with pytest.raises(APIError):
+            await client.get_device_status("AP-2")
+        
+        snapshot = client.metrics.snapshot()
+        counts = {r["status_class"]: r["count"] for r in snapshot["requests"]}
+        assert counts == {"2xx": 1, "5xx": 1, "error": 2}
+        assert {r["endpoint"] for r in snapshot["requests"]} == {"/api/v2/devices/{id}/status"}
+        assert snapshot["retries"][0]["count"] == 2
+        assert snapshot["rate_limit_wait"]["count"] == 4
+        assert snapshot["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_metrics_and_traces_use_route_templates(self):
+        """Test device names without digits share their endpoint's label."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, tracer=RequestTracer(),
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        )
+        client.session = FakeSession([
+            FakeResponse(status=503),
+            FakeResponse(payload={"status": "online"}),
+            FakeResponse(payload={"status": "online"})
+        ])
+        
+        await client.get_device_status("lobby-ap")
+        await client.get_device_status("core.switch")
+        
+        snapshot = client.metrics.snapshot()
+        assert {r["endpoint"] for r in snapshot["requests"]} == {"/api/v2/devices/{id}/status"}
+        assert [r["endpoint"] for r in snapshot["retries"]] == ["/api/v2/devices/{id}/status"]
+        assert {
+            kwargs["trace_request_ctx"]["endpoint"] for _, _, kwargs in client.session.calls
+        } == {"/api/v2/devices/{id}/status"}
+
+class TestCircuitBreaking:
+    """Test cases for circuit breaking in the request path."""
+    
+    def make_client(self, responses):
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000,
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreaker(CircuitBreakerConfig(minimum_requests=2, window=4))
+        )
+        client.session = FakeSession(responses)
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test a failing endpoint is isolated while others keep working."""
+        def respond(method, url):
+            if "/status" in url:
+                return FakeResponse(status=503)
+            return FakeResponse(payload={"ok": True})
+        
+        client = self.make_client(respond)
+        for device_id in ("AP-1", "AP-2"):
+            with pytest.raises(APIError) as exc_info:
+                await client.get_device_status(device_id)
+            assert exc_info.value.status_code == 503
+        
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await client.get_device_status("AP-3")
+        assert exc_info.value.endpoint == "/api/v2/devices/{id}/status"
+        assert exc_info.value.retry_after > 0
+        assert len(client.session.calls) == 2
+        
+        assert await client.quarantine_device("AP-3") == {"ok": True}
+    
+    @pytest.mark.asyncio
+    async def test_device_ids_without_digits_share_circuit(self):
+        """Test status failures trip one circuit whatever the device ID looks like."""
+        client = self.make_client(lambda m, u: FakeResponse(status=503))
+        for device_id in ("lobby-ap", "core.switch"):
+            with pytest.raises(APIError):
+                await client.get_device_status(device_id)
+        
+        with pytest.raises(CircuitOpenError):
+            await client.get_device_status("edge-sw")
+        assert list(client.circuit_breaker.stats()) == ["/api/v2/devices/{id}/status"]
+    
+    @pytest.mark.asyncio
+    async def test_client_errors_keep_circuit_closed(self):
+        """Test 4xx responses do not open the circuit."""
+        client = self.make_client(lambda m, u: FakeResponse(status=404))
+        
+        for _ in range(3):
+            with pytest.raises(APIError) as exc_info:
+                await client.get_device_status("AP-1")
+            assert not isinstance(exc_info.value, CircuitOpenError)
+        
+        assert client.circuit_breaker.stats()["/api/v2/devices/{id}/status"]["state"] == "closed"
+
+class TestPriorityScheduling:
+    """Test cases for priority admission in the request path."""
+    
+    @pytest.mark.asyncio
+    async def test_quarantine_preempts_bulk_polling(self):
+        """Test a quarantine is admitted ahead of queued status polls."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=50, burst=1, max_connections=50
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"ok": True}))
+        
+        async def poll():
+            return [item async for item in client.iter_device_statuses(
+                [f"AP-{i}" for i in range(20)], concurrency=20
+            )]
+        
+        polling = asyncio.create_task(poll())
+        await asyncio.sleep(0.05)
+        await client.quarantine_device("AP-1")
+        
+        urls = [url for _, url, _ in client.session.calls]
+        assert urls.index("https://api.example.com/api/v2/devices/quarantine") <= 5
+        assert len(await polling) == 20
+        
+        stats = client.priority_status()
+        assert stats["critical"]["admitted"] == 1
+        assert stats["bulk"]["admitted"] == 20
+    
+    @pytest.mark.asyncio
+    async def test_serialized_mode_priority(self):
+        """Test priorities also order the serialized request lock."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+        client.rate_limit_delay = 0.01
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"ok": True}))
+        
+        statuses = [
+            asyncio.create_task(client._make_request("GET", f"/api/v2/devices/AP-{i}/status", priority="bulk"))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0)
+        await client.isolate_device("AP-9")
+        
+        urls = [url for _, url, _ in client.session.calls]
+        assert urls.index("https://api.example.com/api/v2/devices/isolate") <= 1
+        await asyncio.gather(*statuses)
+        assert not client._lock.locked()
+    
+    def test_priority_resolution(self):
+        """Test endpoint patterns map to priority classes."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            priorities={"/api/v2/threats*": "bulk"}
+        )
+        
+        assert client._priority_for("/api/v2/devices/quarantine") == "critical"
+        assert client._priority_for("/api/v2/threats?severity=high") == "bulk"
+        assert client._priority_for("/api/v2/devices/AP-1/status") == "interactive"
+        
+        with pytest.raises(ValueError, match="Invalid priority"):
+            ArubaAPIClient("https://api.example.com", "valid_key_123", priorities={"/x": "urgent"})
+
+class TestHedging:
+    """Test cases for hedged GETs in the request path."""
+    
+    def test_requires_concurrent_mode(self):
+        """Test hedging is rejected for serialized clients."""
+        with pytest.raises(ValueError, match="concurrent mode"):
+            ArubaAPIClient("https://api.example.com", "valid_key_123", hedger=Hedger())
+    
+    @pytest.mark.asyncio
+    async def test_slow_get_is_hedged(self):
+        """Test a slow GET is raced and only GETs are hedged."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", requests_per_second=1000,
+            hedger=Hedger(initial_delay=0.01, min_delay=0, budget_ratio=1)
+        )
+        responses = [
+            FakeResponse(payload={"copy": "primary"}, delay=1.0),
+            FakeResponse(payload={"copy": "hedge"}),
+            FakeResponse(payload={"ok": True}, delay=0.05)
+        ]
+        client.session = FakeSession(responses)
+        
+        assert await client.get_device_status("AP-1") == {"copy": "hedge"}
+        assert await client.quarantine_device("AP-1") == {"ok": True}
+        assert len(client.session.calls) == 3
+        
+        assert client.hedger.stats()["hedge_wins"] == 1
+        snapshot = client.metrics.snapshot()
+        assert snapshot["cancelled"] == 1
+        assert snapshot["in_flight"] == 0
+
+class TestDeviceActionBatching:
+    """Test cases for batched isolate and quarantine calls."""
+    
+    @pytest.mark.asyncio
+    async def test_quarantines_share_bulk_request(self):
+        """Test concurrent quarantines become one mass_quarantine request."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, batch_window=0.01
+        )
+        client.session = FakeSession([FakeResponse(payload={
+            "status": "partial",
+            "details": [
+                {"device_id": "AP-1", "status": "quarantined"},
+                {"device_id": "AP-2", "status": "failed"}
+            ]
+        })])
+        
+        first, second, third = await asyncio.gather(
+            client.quarantine_device("AP-1", "Coordinated attack"),
+            client.quarantine_device("AP-2", "Coordinated attack"),
+            client.quarantine_device("AP-3", "Coordinated attack"),
+            return_exceptions=True
+        )
+        
+        assert first == {"device_id": "AP-1", "status": "quarantined"}
+        assert second["status"] == "failed"
+        assert isinstance(third, APIError)
+        
+        (method, url, kwargs), = client.session.calls
+        assert url == "https://api.example.com/api/v2/devices/quarantine"
+        assert json.loads(kwargs["data"]) == {
+            "device_ids": ["AP-1", "AP-2", "AP-3"],
+            "action": "mass_quarantine",
+            "reason": "Coordinated attack"
+        }
+    
+    @pytest.mark.asyncio
+    async def test_isolations_grouped_by_rollback_timer(self):
+        """Test isolations with different options are sent separately."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, batch_window=0.01
+        )
+        
+        def respond(method, url):
+            return FakeResponse(payload={"details": [
+                {"device_id": d, "status": "isolated"} for d in ("AP-1", "AP-2")
+            ]})
+        
+        client.session = FakeSession(respond)
+        await asyncio.gather(
+            client.isolate_device("AP-1", rollback_timer=60),
+            client.isolate_device("AP-2", rollback_timer=3600)
+        )
+        
+        payloads = sorted(
+            (json.loads(kwargs["data"]) for _, _, kwargs in client.session.calls),
+            key=lambda p: p["rollback_timer"]
+        )
+        assert payloads == [
+            {"device_ids": ["AP-1"], "action": "mass_isolate", "rollback_timer": 60},
+            {"device_ids": ["AP-2"], "action": "mass_isolate", "rollback_timer": 3600}
+        ]
+
+class TestStreaming:
+    """Test cases for streamed list responses."""
+    
+    def make_client(self, responses):
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", requests_per_second=1000,
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        )
+        client.session = FakeSession(responses)
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_streams_items(self):
+        """Test items of the array path are yielded in order."""
+        devices = [{"id": f"AP-{i}", "name": "lobby ]"} for i in range(50)]
+        client = self.make_client([
+            FakeResponse(body=json.dumps({"total": 50, "data": {"devices": devices}}).encode())
+        ])
+        
+        items = [item async for item in client.stream_items(
+            "/api/v2/devices", "data.devices", params={"limit": "50"}, max_buffered=2
+        )]
+        
+        assert items == devices
+        assert client.session.calls[0][1] == "https://api.example.com/api/v2/devices?limit=50"
+        assert client.metrics.snapshot()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_retries_before_first_item(self):
+        """Test errors are retried until an item has been yielded."""
+        client = self.make_client([
+            FakeResponse(status=503),
+            FakeResponse(body=b'{"devices": [1, 2]}')
+        ])
+        
+        assert [item async for item in client.stream_items("/api/v2/devices", "devices")] == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_missing_items_path_raises(self):
+        """Test a body without the array is an error, not an empty list."""
+        client = self.make_client([
+            FakeResponse(body=b'{"data": {"devices": [1]}}'),
+            FakeResponse(body=b'{"devices": []}')
+        ])
+        
+        with pytest.raises(APIError, match="No array at 'devices'"):
+            async for _ in client.stream_items("/api/v2/devices", "devices"):
+                pass
+        assert [item async for item in client.stream_items("/api/v2/devices", "devices")] == []
+    
+    @pytest.mark.asyncio
+    async def test_interrupted_stream_not_retried(self):
+        """Test a failure after yielding items raises instead of repeating them."""
+        client = self.make_client([
+            FakeResponse(body=[b'{"devices": [1, 2, 3', ClientError("reset")]),
+            FakeResponse(body=b'{"devices": [1, 2, 3]}')
+        ])
+        
+        received = []
+        with pytest.raises(APIError, match="Stream interrupted"):
+            async for item in client.stream_items("/api/v2/devices", "devices"):
+                received.append(item)
+        
+        assert received == [1, 2]
+        assert len(client.session.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_request(self):
+        """Test leaving the loop early releases the request."""
+        client = self.make_client([
+            FakeResponse(body=json.dumps({"devices": list(range(1000))}).encode())
+        ])
+        
+        stream = client.stream_items("/api/v2/devices", "devices", max_buffered=1)
+        async for item in stream:
+            if item == 3:
+                break
+        await asyncio.wait_for(stream.aclose(), 1)
+        
+        assert client.session.in_flight == 0
+        assert client.metrics.snapshot()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_requires_concurrent_mode(self):
+        """Test streaming is rejected when requests are serialized."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+        client.session = FakeSession([FakeResponse(body=b'{"devices": [1]}')])
+        
+        with pytest.raises(ValidationError, match="concurrent mode"):
+            async for _ in client.stream_items("/api/v2/devices", "devices"):
+                pass
+        assert client.session.calls == []
+
+class TestTokenRefresh:
+    """Test cases for expiring access tokens in the request path."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_401s_refresh_once_and_replay(self):
+        """Test requests failing on an expired token share one refresh and are replayed."""
+        refreshes = []
+        
+        async def refresh(current):
+            refreshes.append(current.access_token)
+            await asyncio.sleep(0.01)
+            return AccessToken("new_token", time.time() + 3600, obtained_at=time.time())
+        
+        provider = OAuthTokenProvider(
+            refresh, token=AccessToken("old_token", time.time() + 3600, obtained_at=time.time())
+        )
+        client = ArubaAPIClient(
+            "https://api.example.com", requests_per_second=1000, token_provider=provider
+        )
+        
+        def respond(method, url):
+            auth = client.session.calls[-1][2]["headers"]["Authorization"]
+            if auth == "Bearer old_token":
+                return FakeResponse(status=401, delay=0.02)
+            return FakeResponse(payload={"ok": True})
+        
+        client.session = FakeSession(respond)
+        try:
+            results = await asyncio.gather(*(
+                client.get_device_status(f"AP-{i}") for i in range(5)
+            ))
+        finally:
+            await provider.close()
+        
+        assert results == [{"ok": True}] * 5
+        assert refreshes == ["old_token"]
+        assert len(client.session.calls) == 10
+        assert client.metrics.snapshot()["retries"] == []
+    
+    @pytest.mark.asyncio
+    async def test_repeated_401_is_raised(self):
+        """Test a request is replayed only once after a refresh."""
+        async def refresh(current):
+            return AccessToken("new_token", time.time() + 3600, obtained_at=time.time())
+        
+        provider = OAuthTokenProvider(
+            refresh, token=AccessToken("old_token", time.time() + 3600, obtained_at=time.time())
+        )
+        client = ArubaAPIClient("https://api.example.com", token_provider=provider)
+        client.session = FakeSession(lambda method, url: FakeResponse(status=401))
+        try:
+            with pytest.raises(APIError) as exc_info:
+                await client.get_device_status("AP-1")
+        finally:
+            await provider.close()
+        
+        assert exc_info.value.status_code == 401
+        assert len(client.session.calls) == 2
+    
+    def test_api_key_required_without_provider(self):
+        """Test the static key is still validated when no provider is given."""
+        with pytest.raises(ValueError):
+            ArubaAPIClient("https://api.example.com")
+
+class TestRequestCompression:
+    """Test cases for compressed request bodies."""
+    
+    @pytest.mark.asyncio
+    async def test_rejected_compression_is_disabled(self):
+        """Test a 415 on a compressed body resends it uncompressed and stops compressing."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", compress_requests_above=100
+        )
+        client.rate_limit_delay = 0
+        client.session = FakeSession([
+            FakeResponse(status=415),
+            FakeResponse(payload={"ok": True}),
+            FakeResponse(payload={"ok": True})
+        ])
+        data = {"devices": ["AP-1"] * 100}
+        
+        assert await client._make_request("POST", "/api/v2/config", data) == {"ok": True}
+        assert await client._make_request("POST", "/api/v2/config", data) == {"ok": True}
+        
+        first, second, third = client.session.calls
+        assert first[2]["headers"]["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in (second[2]["headers"] or {})
+        assert "Content-Encoding" not in (third[2]["headers"] or {})
+        assert client.compress_requests_above is None
+        assert "request" not in client.metrics.snapshot()["compression"]
+
+class TestDeadlines:
+    """Test cases for deadline propagation in the request path."""
+    
+    @pytest.mark.asyncio
+    async def test_slow_request_is_cancelled(self):
+        """Test a request outliving the deadline is cancelled and reported as such."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123", requests_per_second=1000)
+        client.session = FakeSession([FakeResponse(payload={"ok": True}, delay=5)])
+        
+        started = time.monotonic()
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceeded):
+                await client.get_device_status("AP-1")
+        
+        assert time.monotonic() - started < 1
+        assert client.session.in_flight == 0
+        assert client.metrics.snapshot()["cancelled"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_calls_share_the_budget(self):
+        """Test sequential calls use what is left and later calls fail without being sent."""
+        client = ArubaAPIClient("https://api.example.com", "valid_key_123", requests_per_second=1000)
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"ok": True}, delay=0.04))
+        
+        results = []
+        with deadline(0.1):
+            with pytest.raises(DeadlineExceeded):
+                for i in range(10):
+                    results.append(await client.get_device_status(f"AP-{i}"))
+            with pytest.raises(DeadlineExceeded):
+                await client.get_device_status("AP-late")
+        
+        assert len(results) == 2
+        assert len(client.session.calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_backoff_beyond_deadline_is_skipped(self):
+        """Test no retry is scheduled when its backoff would outlast the deadline."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", requests_per_second=1000,
+            retry_policy=RetryPolicy(max_attempts=3)
+        )
+        client.session = FakeSession([FakeResponse(status=503)])
+        
+        started = time.monotonic()
+        with deadline(1), patch.object(RetryPolicy, "backoff", return_value=10.0):
+            with pytest.raises(DeadlineExceeded) as exc_info:
+                await client.get_device_status("AP-1")
+        
+        assert time.monotonic() - started < 0.5
+        assert exc_info.value.__cause__.status_code == 503
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_wait_is_bounded(self):
+        """Test waiting for admission stops at the deadline."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", requests_per_second=1, burst=1
+        )
+        client.session = FakeSession(lambda m, u: FakeResponse(payload={"ok": True}))
+        await client.get_device_status("AP-1")
+        
+        started = time.monotonic()
+        with deadline(0.1):
+            with pytest.raises(DeadlineExceeded):
+                await client.get_device_status("AP-2")
+        
+        assert time.monotonic() - started < 0.5
+        assert len(client.session.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_coalesced_request_outlives_starters_deadline(self):
+        """Test a caller's deadline only ends its own wait on a shared request."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, coalesce_requests=True
+        )
+        client.session = FakeSession([FakeResponse(payload={"ok": True}, delay=0.2)])
+        
+        async def with_deadline():
+            with deadline(0.05):
+                return await client.get_device_status("AP-1")
+        
+        first, second = await asyncio.gather(
+            with_deadline(), client.get_device_status("AP-1"), return_exceptions=True
+        )
+        
+        assert isinstance(first, DeadlineExceeded)
+        assert second == {"ok": True}
+        assert len(client.session.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_outlives_flushing_callers_deadline(self):
+        """Test a batched action is not cancelled by another caller's deadline."""
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123",
+            requests_per_second=1000, batch_window=0.01
+        )
+        client.session = FakeSession([FakeResponse(payload={"details": [
+            {"device_id": "AP-1", "status": "quarantined"},
+            {"device_id": "AP-2", "status": "quarantined"}
+        ]}, delay=0.2)])
+        
+        async def with_deadline():
+            with deadline(0.05):
+                return await client.quarantine_device("AP-1")
+        
+        first, second = await asyncio.gather(
+            with_deadline(), client.quarantine_device("AP-2"), return_exceptions=True
+        )
+        
+        assert isinstance(first, DeadlineExceeded)
+        assert second == {"device_id": "AP-2", "status": "quarantined"}
+        assert len(client.session.calls) == 1
+
+class TestFileTransfers:
+    """Test cases for streaming downloads and uploads."""
+    
+    def make_client(self, responses):
+        client = ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", requests_per_second=1000,
+            retry_policy=RetryPolicy(base_delay=0)
+        )
+        client.session = FakeSession(responses)
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_download_streams_to_file(self, tmp_path):
+        """Test the body is written to the file with progress reports."""
+        body = bytes(range(256)) * 4
+        client = self.make_client([FakeResponse(body=body, headers={"Content-Length": str(len(body))})])
+        target = tmp_path / "backup.bin"
+        progress = []
+        
+        size = await client.download_to(
+            "/api/v2/backups/1", str(target), progress=lambda done, total: progress.append((done, total))
+        )
+        
+        assert size == len(body)
+        assert target.read_bytes() == body
+        assert not (tmp_path / "backup.bin.part").exists()
+        assert progress[-1] == (len(body), len(body))
+        assert client.session.calls[0][2]["headers"] == {"Accept-Encoding": "identity"}
+    
+    @pytest.mark.asyncio
+    async def test_broken_download_resumes_with_range(self, tmp_path):
+        """Test a retry after a broken transfer requests only the missing bytes."""
+        client = self.make_client([
+            FakeResponse(body=[b"0123456789", ClientPayloadError("connection reset")]),
+            FakeResponse(status=206, headers={"Content-Range": "bytes 10-19/20"}, body=b"abcdefghij")
+        ])
+        target = tmp_path / "image.bin"
+        
+        await client.download_to("/api/v2/firmware/1", str(target))
+        
+        assert target.read_bytes() == b"0123456789abcdefghij"
+        assert client.session.calls[1][2]["headers"]["Range"] == "bytes=10-"
+    
+    @pytest.mark.asyncio
+    async def test_partial_file_is_resumed(self, tmp_path):
+        """Test an existing partial download is continued, or replaced if the server ignores the range."""
+        target = tmp_path / "report.csv"
+        (tmp_path / "report.csv.part").write_bytes(b"01234")
+        client = self.make_client([
+            FakeResponse(status=206, headers={"Content-Range": "bytes 5-9/10"}, body=b"56789")
+        ])
+        await client.download_to("/api/v2/reports/1", str(target))
+        assert target.read_bytes() == b"0123456789"
+        assert client.session.calls[0][2]["headers"]["Range"] == "bytes=5-"
+        
+        (tmp_path / "report.csv.part").write_bytes(b"stale-partial-content")
+        client = self.make_client([FakeResponse(body=b"fresh")])
+        await client.download_to("/api/v2/reports/1", str(target))
+        assert target.read_bytes() == b"fresh"
+    
+    @pytest.mark.asyncio
+    async def test_complete_partial_file(self, tmp_path):
+        """Test a 416 for a partial file that is already complete finishes the download."""
+        target = tmp_path / "report.csv"
+        (tmp_path / "report.csv.part").write_bytes(b"0123456789")
+        client = self.make_client([FakeResponse(status=416, headers={"Content-Range": "bytes */10"})])
+        
+        assert await client.download_to("/api/v2/reports/1", str(target)) == 10
+        assert target.read_bytes() == b"0123456789"
+    
+    @pytest.mark.asyncio
+    async def test_upload_streams_file(self, tmp_path):
+        """Test the file is sent in chunks with its length, and resent on retry."""
+        source = tmp_path / "config.bin"
+        source.write_bytes(b"x" * 100_000)
+        client = self.make_client([FakeResponse(status=503), FakeResponse(payload={"stored": True})])
+        progress = []
+        
+        result = await client.upload_from(
+            "/api/v2/configs/1", str(source), method="PUT", chunk_size=16 * 1024,
+            progress=lambda done, total: progress.append((done, total))
+        )
+        
+        assert result == {"stored": True}
+        for _, _, kwargs in client.session.calls:
+            assert kwargs["headers"]["Content-Length"] == "100000"
+            assert kwargs["headers"]["Content-Type"] == "application/octet-stream"
+            chunks = [chunk async for chunk in kwargs["data"]]
+            assert max(len(c) for c in chunks) == 16 * 1024
+            assert b"".join(chunks) == source.read_bytes()
+        assert progress[-1] == (100_000, 100_000)
+    
+    @pytest.mark.asyncio
+    async def test_upload_requires_body_method(self, tmp_path):
+        """Test uploads with methods that take no body are rejected."""
+        source = tmp_path / "config.bin"
+        source.write_bytes(b"x")
+        client = self.make_client([])
+        with pytest.raises(ValidationError):
+            await client.upload_from("/api/v2/configs/1", str(source), method="GET")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Test suite for access-token providers.
+"""
+
+import pytest
+import asyncio
+import os
+import stat
+import time
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from auth import AccessToken, OAuthTokenProvider, FileTokenStore, TokenRefreshError
+
+def make_token(name, lifetime=3600.0):
+    now = time.time()
+    return AccessToken(name, now + lifetime, refresh_token=f"refresh-{name}", obtained_at=now)
+
+class CountingRefresher:
+    def __init__(self, lifetime=3600.0, delay=0.01, fail=None):
+        self.calls = 0
+        self.lifetime = lifetime
+        self.delay = delay
+        self.fail = fail
+    
+    async def __call__(self, current):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise self.fail
+        return make_token(f"token-{self.calls}", self.lifetime)
+
+class TestOAuthTokenProvider:
+    """Test cases for OAuthTokenProvider."""
+    
+    @pytest.mark.asyncio
+    async def test_first_use_obtains_token(self):
+        """Test a provider without a token refreshes on first use."""
+        refresher = CountingRefresher()
+        provider = OAuthTokenProvider(refresher)
+        try:
+            assert await provider.get_token() == "token-1"
+            assert await provider.get_token() == "token-1"
+            assert refresher.calls == 1
+        finally:
+            await provider.close()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_single_flight(self):
+        """Test many callers rejecting the same token share one refresh."""
+        refresher = CountingRefresher(delay=0.05)
+        provider = OAuthTokenProvider(refresher, token=make_token("old"))
+        
+        tokens = await asyncio.gather(*(provider.refresh(stale="old") for _ in range(20)))
+        
+        assert set(tokens) == {"token-1"}
+        assert refresher.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_late_stale_refresh_is_skipped(self):
+        """Test a 401 on an already replaced token does not refresh again."""
+        refresher = CountingRefresher()
+        provider = OAuthTokenProvider(refresher, token=make_token("old"))
+        
+        assert await provider.refresh(stale="old") == "token-1"
+        assert await provider.refresh(stale="old") == "token-1"
+        assert refresher.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_refresh_propagates_and_is_retried(self):
+        """Test a failed refresh reaches every waiter and is not cached."""
+        refresher = CountingRefresher(fail=TokenRefreshError("denied"))
+        provider = OAuthTokenProvider(refresher, token=make_token("old"))
+        
+        results = await asyncio.gather(
+            provider.refresh(stale="old"), provider.refresh(stale="old"),
+            return_exceptions=True
+        )
+        assert all(isinstance(r, TokenRefreshError) for r in results)
+        assert refresher.calls == 1
+        
+        refresher.fail = None
+        assert await provider.refresh(stale="old") == "token-2"
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_refresh(self):
+        """Test cancelling one waiter leaves the shared refresh running."""
+        refresher = CountingRefresher(delay=0.05)
+        provider = OAuthTokenProvider(refresher, token=make_token("old"))
+        
+        first = asyncio.ensure_future(provider.refresh(stale="old"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        
+        assert await provider.refresh(stale="old") == "token-1"
+        assert refresher.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_refreshes_ahead_of_expiry(self):
+        """Test the background task replaces a token before it expires."""
+        refresher = CountingRefresher(lifetime=0.2, delay=0)
+        provider = OAuthTokenProvider(refresher, token=make_token("old", 0.2), refresh_margin=0.1)
+        try:
+            assert await provider.get_token() == "old"
+            await asyncio.sleep(0.15)
+            assert provider.token.access_token == "token-1"
+            assert provider.token.remaining() > 0.1
+        finally:
+            await provider.close()
+    
+    @pytest.mark.asyncio
+    async def test_store_persists_and_shares_tokens(self, tmp_path):
+        """Test refreshed tokens are stored and adopted by other providers."""
+        path = str(tmp_path / "token.json")
+        refresher = CountingRefresher()
+        first = OAuthTokenProvider(refresher, token=make_token("old"), store=FileTokenStore(path))
+        await first.refresh(stale="old")
+        
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        
+        # Another process started with the old token and got a 401
+        second = OAuthTokenProvider(refresher, token=make_token("old"), store=FileTokenStore(path))
+        assert await second.refresh(stale="old") == "token-1"
+        assert refresher.calls == 1
+        
+        third = OAuthTokenProvider(refresher, store=FileTokenStore(path))
+        assert third.token.access_token == "token-1"
+
+class TestFileTokenStore:
+    """Test cases for FileTokenStore."""
+    
+    def test_missing_or_corrupt_file(self, tmp_path):
+        """Test unreadable stores yield no token."""
+        path = tmp_path / "token.json"
+        assert FileTokenStore(str(path)).load() is None
+        path.write_text("{not json")
+        assert FileTokenStore(str(path)).load() is None
+    
+    def test_round_trip(self, tmp_path):
+        """Test a saved token loads back unchanged."""
+        store = FileTokenStore(str(tmp_path / "token.json"))
+        token = make_token("abc")
+        store.save(token)
+        assert store.load() == token
+        assert os.listdir(tmp_path) == ["token.json"]
+
+class TestAccessToken:
+    """Test cases for AccessToken."""
+    
+    def test_refresh_due_for_short_lifetimes(self):
+        """Test short-lived tokens refresh halfway through their lifetime."""
+        token = AccessToken("t", expires_at=1100.0, obtained_at=1000.0)
+        now = time.time()
+        due = token.refresh_due_in(300) + now
+        assert due == pytest.approx(1050.0, abs=0.01)
@@ -0,0 +1,102 @@
+"""
+Test suite for micro-batching.
+"""
+
+import pytest
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batching import MicroBatcher
+
+class RecordingSender:
+    def __init__(self, fail=None):
+        self.batches = []
+        self.fail = fail
+    
+    async def __call__(self, key, items):
+        self.batches.append((key, items))
+        if self.fail:
+            raise self.fail
+        return {
+            item: KeyError(item) if item == "missing" else f"{key}:{item}"
+            for item in items
+        }
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher."""
+    
+    def test_parameter_validation(self):
+        """Test invalid sizes and delays are rejected."""
+        with pytest.raises(ValueError, match="max_batch_size"):
+            MicroBatcher(RecordingSender(), max_batch_size=0)
+        
+        with pytest.raises(ValueError, match="max_delay"):
+            MicroBatcher(RecordingSender(), max_delay=-1)
+    
+    @pytest.mark.asyncio
+    async def test_window_groups_calls_by_key(self):
+        """Test calls within the window share one request per key."""
+        sender = RecordingSender()
+        batcher = MicroBatcher(sender, max_delay=0.01)
+        
+        results = await asyncio.gather(
+            batcher.submit("a", "AP-1"),
+            batcher.submit("a", "AP-2"),
+            batcher.submit("b", "AP-3"),
+            batcher.submit("a", "AP-1")
+        )
+        
+        assert results == ["a:AP-1", "a:AP-2", "b:AP-3", "a:AP-1"]
+        assert sorted(sender.batches) == [("a", ["AP-1", "AP-2"]), ("b", ["AP-3"])]
+        assert batcher.stats()["calls"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_size_limit_sends_immediately(self):
+        """Test a full batch is sent without waiting for the window."""
+        sender = RecordingSender()
+        batcher = MicroBatcher(sender, max_batch_size=2, max_delay=10)
+        
+        results = await asyncio.wait_for(asyncio.gather(
+            batcher.submit("a", "AP-1"),
+            batcher.submit("a", "AP-2")
+        ), 1)
+        
+        assert results == ["a:AP-1", "a:AP-2"]
+    
+    @pytest.mark.asyncio
+    async def test_per_item_and_batch_errors(self):
+        """Test item errors reach only their callers and batch errors reach all."""
+        batcher = MicroBatcher(RecordingSender(), max_delay=0)
+        ok, missing = await asyncio.gather(
+            batcher.submit("a", "AP-1"),
+            batcher.submit("a", "missing"),
+            return_exceptions=True
+        )
+        assert ok == "a:AP-1"
+        assert isinstance(missing, KeyError)
+        
+        failing = MicroBatcher(RecordingSender(fail=RuntimeError("down")), max_delay=0)
+        results = await asyncio.gather(
+            failing.submit("a", "AP-1"),
+            failing.submit("a", "AP-2"),
+            return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_flush_sends_waiting_groups(self):
+        """Test flush sends pending groups without waiting for the window."""
+        sender = RecordingSender()
+        batcher = MicroBatcher(sender, max_delay=10)
+        
+        task = asyncio.create_task(batcher.submit("a", "AP-1"))
+        await asyncio.sleep(0)
+        await batcher.flush()
+        
+        assert await task == "a:AP-1"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
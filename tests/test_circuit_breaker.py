@@ -0,0 +1,133 @@
+"""
+Test suite for per-endpoint circuit breakers.
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from circuit_breaker import (
+    CircuitBreaker, CircuitBreakerConfig, CLOSED, OPEN, HALF_OPEN, is_failure
+)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+CONFIG = CircuitBreakerConfig(failure_rate_threshold=0.5, minimum_requests=4, window=10, cooldown=30)
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+    
+    def test_config_validation(self):
+        """Test invalid thresholds are rejected."""
+        with pytest.raises(ValueError, match="failure_rate_threshold"):
+            CircuitBreakerConfig(failure_rate_threshold=0)
+        
+        with pytest.raises(ValueError, match="minimum_requests"):
+            CircuitBreakerConfig(minimum_requests=30, window=20)
+    
+    def test_failure_classification(self):
+        """Test only server errors and transport failures count."""
+        assert is_failure(None)
+        assert is_failure(503)
+        assert not is_failure(404)
+        assert not is_failure(429)
+    
+    def test_opens_at_failure_rate(self):
+        """Test the circuit opens once the failure rate reaches the threshold."""
+        breaker = CircuitBreaker(CONFIG, clock=FakeClock())
+        circuit = breaker.circuit_for("/api/v2/devices/AP-1/status")
+        
+        circuit.record_failure()
+        circuit.record_failure()
+        circuit.record_success()
+        assert circuit.state == CLOSED  # below minimum_requests
+        
+        circuit.record_failure()
+        assert circuit.state == OPEN
+        assert not circuit.allow()
+        assert circuit.rejected == 1
+    
+    def test_circuits_are_per_template(self):
+        """Test endpoints sharing a template share a circuit, others do not."""
+        breaker = CircuitBreaker(CONFIG, clock=FakeClock())
+        
+        assert breaker.circuit_for("/api/v2/devices/AP-1/status") is \
+            breaker.circuit_for("/api/v2/devices/AP-2/status")
+        assert breaker.circuit_for("/api/v2/threats") is not \
+            breaker.circuit_for("/api/v2/devices/AP-1/status")
+    
+    def test_half_open_recovery(self):
+        """Test a successful trial after the cool-down closes the circuit."""
+        clock = FakeClock()
+        circuit = CircuitBreaker(CONFIG, clock=clock).circuit_for("/api/test")
+        for _ in range(4):
+            circuit.record_failure()
+        
+        clock.now = 10
+        assert circuit.retry_after() == 20
+        
+        clock.now = 30
+        assert circuit.state == HALF_OPEN
+        assert circuit.allow()
+        assert not circuit.allow()  # one trial at a time
+        
+        circuit.record_success()
+        assert circuit.state == CLOSED
+        assert circuit.allow()
+    
+    def test_half_open_failure_reopens(self):
+        """Test a failed trial opens the circuit for another cool-down."""
+        clock = FakeClock()
+        circuit = CircuitBreaker(CONFIG, clock=clock).circuit_for("/api/test")
+        for _ in range(4):
+            circuit.record_failure()
+        
+        clock.now = 30
+        assert circuit.allow()
+        circuit.record_failure()
+        
+        assert circuit.state == OPEN
+        assert circuit.retry_after() == 30
+        assert circuit.times_opened == 2
+    
+    def test_release_returns_trial_slot(self):
+        """Test a cancelled trial frees its slot."""
+        clock = FakeClock()
+        circuit = CircuitBreaker(CONFIG, clock=clock).circuit_for("/api/test")
+        for _ in range(4):
+            circuit.record_failure()
+        
+        clock.now = 30
+        assert circuit.allow()
+        circuit.release()
+        assert circuit.allow()
+    
+    def test_circuit_count_is_bounded(self):
+        """Test templates beyond max_circuits share the other circuit."""
+        breaker = CircuitBreaker(CONFIG, clock=FakeClock(), max_circuits=2)
+        breaker.circuit_for("/api/v2/threats")
+        breaker.circuit_for("/api/v2/sites")
+        
+        overflow = breaker.circuit_for("/api/v2/groups")
+        assert overflow.name == "other"
+        assert breaker.circuit_for("/api/v2/labels") is overflow
+        assert len(breaker.stats()) == 3
+    
+    def test_stats(self):
+        """Test stats report state per template."""
+        breaker = CircuitBreaker(CONFIG, clock=FakeClock())
+        breaker.circuit_for("/api/v2/devices/AP-1/status").record_failure()
+        
+        stats = breaker.stats()
+        assert stats["/api/v2/devices/{id}/status"]["state"] == CLOSED
+        assert stats["/api/v2/devices/{id}/status"]["failure_rate"] == 1.0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+"""
+Test suite for the JSON codecs.
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import codec
+from codec import JSONCodec, OrjsonCodec, get_default_codec
+
+SAMPLE = {"devices": [{"id": "AP-1", "name": "Café", "up": True, "clients": 12}], "count": 1}
+
+class TestCodecs:
+    """Test cases for JSON codecs."""
+    
+    def test_stdlib_round_trip(self):
+        """Test the stdlib codec round-trips compact UTF-8."""
+        stdlib = JSONCodec()
+        encoded = stdlib.dumps(SAMPLE)
+        
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded.replace(b"Caf", b"")
+        assert stdlib.loads(encoded) == SAMPLE
+    
+    def test_invalid_json_raises_value_error(self):
+        """Test decode errors surface as ValueError for every codec."""
+        with pytest.raises(ValueError):
+            JSONCodec().loads(b"{not json")
+        
+        if codec.orjson is not None:
+            with pytest.raises(ValueError):
+                OrjsonCodec().loads(b"{not json")
+    
+    @pytest.mark.skipif(codec.orjson is None, reason="orjson not installed")
+    def test_orjson_matches_stdlib(self):
+        """Test orjson decodes what the stdlib encodes and vice versa."""
+        fast = OrjsonCodec()
+        
+        assert fast.loads(JSONCodec().dumps(SAMPLE)) == SAMPLE
+        assert JSONCodec().loads(fast.dumps(SAMPLE)) == SAMPLE
+    
+    def test_default_codec_fallback(self, monkeypatch):
+        """Test the default falls back to the stdlib when no fast library is installed."""
+        monkeypatch.setattr(codec, "orjson", None)
+        monkeypatch.setattr(codec, "ujson", None)
+        monkeypatch.setattr(codec, "_default_codec", None)
+        
+        assert get_default_codec().name == "json"
+    
+    def test_missing_backend(self, monkeypatch):
+        """Test requesting an uninstalled backend fails clearly."""
+        monkeypatch.setattr(codec, "orjson", None)
+        
+        with pytest.raises(ImportError, match="orjson"):
+            OrjsonCodec()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
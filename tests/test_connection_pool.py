@@ -0,0 +1,107 @@
+"""
+Test suite for shared connection pools and the client registry.
+"""
+
+import pytest
+from aiohttp import web
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from connection_pool import ClientRegistry, PoolConfig, get_registry
+
+class TestClientRegistry:
+    """Test cases for ClientRegistry."""
+    
+    def test_pool_config_validation(self):
+        """Test invalid pool limits are rejected."""
+        with pytest.raises(ValueError, match="limit must be"):
+            PoolConfig(limit=-1)
+        
+        with pytest.raises(ValueError, match="keepalive_timeout"):
+            PoolConfig(keepalive_timeout=-1)
+    
+    def test_pool_key_hides_credentials(self):
+        """Test pool keys contain a credential digest, not the key."""
+        origin, digest = ClientRegistry._pool_key("https://API.example.com/base", "secret_key_123")
+        
+        assert origin == "https://api.example.com"
+        assert "secret_key_123" not in digest
+    
+    @pytest.mark.asyncio
+    async def test_shared_connector(self):
+        """Test clients with the same URL and credentials share a connector."""
+        registry = ClientRegistry(PoolConfig(limit=50, limit_per_host=25))
+        try:
+            first = registry.connector_for("https://api.example.com", "valid_key_123")
+            second = registry.connector_for("https://api.example.com/", "valid_key_123")
+            other = registry.connector_for("https://api.example.com", "other_key_456")
+            
+            assert first is second
+            assert first is not other
+            assert first.limit == 50
+            assert first.limit_per_host == 25
+        finally:
+            await registry.close()
+    
+    @pytest.mark.asyncio
+    async def test_host_limits(self):
+        """Test per-host limits override the default."""
+        registry = ClientRegistry(host_limits={"eu.example.com": 5})
+        try:
+            connector = registry.connector_for("https://eu.example.com", "valid_key_123")
+            assert connector.limit_per_host == 5
+        finally:
+            await registry.close()
+    
+    @pytest.mark.asyncio
+    async def test_client_does_not_close_shared_connector(self):
+        """Test a registry client leaves the shared connector open on exit."""
+        registry = ClientRegistry()
+        try:
+            async with registry.client("https://api.example.com", "valid_key_123") as client:
+                assert client.session.connector is registry.connector_for(
+                    "https://api.example.com", "valid_key_123"
+                )
+            
+            connector = registry.connector_for("https://api.example.com", "valid_key_123")
+            assert not connector.closed
+            assert client.session.closed
+        finally:
+            await registry.close()
+        
+        assert connector.closed
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections(self):
+        """Test warm-up leaves keep-alive connections in the pool."""
+        app = web.Application()
+        async def handler(request):
+            return web.Response()
+        
+        app.router.add_route("OPTIONS", "/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        
+        registry = ClientRegistry()
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            opened = await registry.warm_up(base_url, "valid_key_123", connections=3)
+            connector = registry.connector_for(base_url, "valid_key_123")
+            
+            assert opened == 3
+            assert sum(len(conns) for conns in connector._conns.values()) == 3
+        finally:
+            await registry.close()
+            await runner.cleanup()
+    
+    def test_default_registry_singleton(self):
+        """Test the process-wide registry is created once."""
+        assert get_registry() is get_registry()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
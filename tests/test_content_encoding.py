@@ -0,0 +1,118 @@
+"""
+Test suite for content-encoding support.
+"""
+
+import pytest
+import gzip
+import json
+from contextlib import asynccontextmanager
+from aiohttp import web
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from content_encoding import accept_encoding, compress_body, encoded_size
+from api_client import ArubaAPIClient
+
+DEVICES = {"devices": [{"id": f"AP-{i}", "status": "up"} for i in range(500)]}
+
+@asynccontextmanager
+async def serve(received):
+    """Run a local HTTP server with a compressible inventory and an echo endpoint."""
+    app = web.Application()
+    async def inventory(request):
+        response = web.json_response(DEVICES)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            response.enable_compression()
+        return response
+    
+    async def push(request):
+        received.append((request.headers.get("Content-Encoding"), await request.read()))
+        return web.json_response({"ok": True})
+    
+    app.router.add_get("/api/v2/devices", inventory)
+    app.router.add_post("/api/v2/config", push)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+class FakeResponse:
+    def __init__(self, headers, content=None):
+        self.headers = headers
+        self.content = content
+
+class TestContentEncoding:
+    """Test cases for the content-encoding helpers."""
+    
+    def test_accept_encoding(self):
+        """Test gzip and deflate are always offered."""
+        assert accept_encoding().startswith("gzip, deflate")
+    
+    def test_compress_body(self):
+        """Test bodies are gzipped only when that makes them smaller."""
+        body = json.dumps(DEVICES).encode()
+        compressed = compress_body(body)
+        assert gzip.decompress(compressed) == body
+        assert len(compressed) < len(body)
+        assert compress_body(b"{}") is None
+    
+    def test_encoded_size(self):
+        """Test the wire size is only reported for encoded bodies."""
+        assert encoded_size(FakeResponse({"Content-Length": "10"})) is None
+        assert encoded_size(FakeResponse({"Content-Encoding": "gzip", "Content-Length": "10"})) == 10
+        assert encoded_size(FakeResponse({"Content-Encoding": "gzip"})) is None
+
+class TestClientCompression:
+    """Test cases for compression between the client and a real server."""
+    
+    @asynccontextmanager
+    async def client(self, received, **kwargs):
+        async with serve(received) as server:
+            async with ArubaAPIClient("https://api.example.com", "valid_key_123", **kwargs) as client:
+                # The local server speaks plain HTTP
+                client._construct_url = lambda endpoint: server + endpoint
+                yield client
+    
+    @pytest.mark.asyncio
+    async def test_response_compression_is_measured(self):
+        """Test compressed responses are decoded and their savings reported."""
+        async with self.client([]) as client:
+            assert await client._make_request("GET", "/api/v2/devices") == DEVICES
+        
+        compression = client.metrics.snapshot()["compression"]["response"]
+        assert compression["decoded_bytes"] == len(json.dumps(DEVICES).encode())
+        assert compression["saved_bytes"] > 0
+        assert compression["ratio"] > 5
+    
+    @pytest.mark.asyncio
+    async def test_streamed_response_compression_is_measured(self):
+        """Test compressed streams are decoded incrementally and measured."""
+        async with self.client([], requests_per_second=100) as client:
+            items = [item async for item in client.stream_items("/api/v2/devices", "devices")]
+        
+        assert items == DEVICES["devices"]
+        assert client.metrics.snapshot()["compression"]["response"]["saved_bytes"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_large_request_bodies_are_compressed(self):
+        """Test only bodies above the threshold are gzipped."""
+        received = []
+        async with self.client(received, compress_requests_above=1024) as client:
+            await client._make_request("POST", "/api/v2/config", DEVICES)
+            await client._make_request("POST", "/api/v2/config", {"small": True})
+        
+        (encoding, body), (small_encoding, _) = received
+        assert encoding == "gzip"
+        assert json.loads(body) == DEVICES  # decoded by the server
+        assert small_encoding is None
+        
+        compression = client.metrics.snapshot()["compression"]["request"]
+        assert compression["decoded_bytes"] == len(body)
+        assert compression["ratio"] > 5
@@ -0,0 +1,52 @@
+"""
+Test suite for deadline contexts.
+"""
+
+import pytest
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deadline import deadline, remaining
+
+class TestDeadline:
+    """Test cases for the deadline context."""
+    
+    def test_no_deadline(self):
+        """Test there is no budget outside a deadline block."""
+        assert remaining() is None
+    
+    def test_nested_deadlines_only_shorten(self):
+        """Test an inner deadline cannot extend the outer one."""
+        with deadline(1) as outer:
+            with deadline(60) as inner:
+                assert inner == outer
+                assert 0 < remaining() <= 1
+            with deadline(0.5):
+                assert remaining() <= 0.5
+            assert 0.5 < remaining() <= 1
+        assert remaining() is None
+    
+    def test_negative_budget_rejected(self):
+        """Test budgets must not be negative."""
+        with pytest.raises(ValueError):
+            with deadline(-1):
+                pass
+    
+    @pytest.mark.asyncio
+    async def test_propagates_to_tasks(self):
+        """Test tasks created inside the block see its deadline, others do not."""
+        async def budget():
+            return remaining()
+        
+        with deadline(5):
+            inside = await asyncio.gather(budget(), budget())
+        outside = await asyncio.ensure_future(budget())
+        
+        assert all(0 < b <= 5 for b in inside)
+        assert outside is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
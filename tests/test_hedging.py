@@ -0,0 +1,122 @@
+"""
+Test suite for hedged requests.
+"""
+
+import pytest
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from hedging import Hedger
+
+class TestHedger:
+    """Test cases for Hedger."""
+    
+    def test_parameter_validation(self):
+        """Test out-of-range parameters are rejected."""
+        with pytest.raises(ValueError, match="percentile"):
+            Hedger(percentile=1.5)
+        
+        with pytest.raises(ValueError, match="min_samples"):
+            Hedger(min_samples=500, window=100)
+    
+    def test_delay_follows_percentile(self):
+        """Test the hedge delay tracks the endpoint template's latency percentile."""
+        hedger = Hedger(percentile=0.9, initial_delay=0.5, min_delay=0, min_samples=10)
+        assert hedger.delay_for("/api/v2/devices/AP-1/status") == 0.5
+        
+        for i in range(1, 11):
+            hedger.record_latency(f"/api/v2/devices/AP-{i}/status", i / 10)
+        
+        assert hedger.delay_for("/api/v2/devices/AP-99/status") == pytest.approx(0.9)
+        assert hedger.delay_for("/api/v2/threats") == 0.5
+    
+    def test_latency_windows_are_bounded(self):
+        """Test templates beyond max_endpoints share the other window."""
+        hedger = Hedger(max_endpoints=1)
+        hedger.record_latency("/api/v2/threats", 0.1)
+        hedger.record_latency("/api/v2/sites", 0.2)
+        hedger.record_latency("/api/v2/groups", 0.3)
+        
+        assert sorted(hedger._latencies) == ["/api/v2/threats", "other"]
+        assert list(hedger._latencies["other"]) == [0.2, 0.3]
+    
+    def test_delay_is_clamped(self):
+        """Test the delay stays within min_delay and max_delay."""
+        hedger = Hedger(initial_delay=10, max_delay=2)
+        assert hedger.delay_for("/api/test") == 2
+    
+    @pytest.mark.asyncio
+    async def test_fast_request_not_hedged(self):
+        """Test requests finishing before the delay run once."""
+        hedger = Hedger(initial_delay=0.5)
+        calls = []
+        
+        async def operation():
+            calls.append(1)
+            return "ok"
+        
+        assert await hedger.run("/api/test", operation) == "ok"
+        assert len(calls) == 1
+        assert hedger.stats()["hedges"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_loser_is_cancelled(self):
+        """Test a slow primary is raced and the faster hedge is used."""
+        hedger = Hedger(initial_delay=0.01, min_delay=0, budget_ratio=1)
+        delays = [1.0, 0.0]
+        cancelled = []
+        
+        async def operation():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+        
+        assert await hedger.run("/api/test", operation) == 0.0
+        assert cancelled == [1.0]
+        
+        stats = hedger.stats()
+        assert stats["hedges"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["win_rate"] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_failed_copy_waits_for_other(self):
+        """Test a failing copy does not discard the other copy's success."""
+        hedger = Hedger(initial_delay=0.01, min_delay=0, budget_ratio=1)
+        outcomes = [0.05, RuntimeError("boom")]
+        
+        async def operation():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            await asyncio.sleep(outcome)
+            return "primary"
+        
+        assert await hedger.run("/api/test", operation) == "primary"
+        assert hedger.stats()["hedge_wins"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedges(self):
+        """Test hedges stop once the budget is spent."""
+        hedger = Hedger(initial_delay=0.001, min_delay=0, budget_ratio=0.5)
+        
+        async def operation():
+            await asyncio.sleep(0.01)
+            return "ok"
+        
+        for _ in range(6):
+            await hedger.run("/api/test", operation)
+        
+        stats = hedger.stats()
+        assert stats["hedges"] <= 3
+        assert stats["hedges"] + stats["skipped"] == 6
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
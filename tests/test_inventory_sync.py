@@ -0,0 +1,175 @@
+"""
+Test suite for incremental inventory sync.
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from api_client import ArubaAPIClient, APIError
+from inventory_sync import InventorySync, SQLiteInventoryStore, FULL, INCREMENTAL
+
+class FakeCentral:
+    """Inventory with a change feed; events before ``oldest`` are pruned."""
+    
+    def __init__(self, count):
+        self.devices = {f"AP-{i}": {"id": f"AP-{i}", "status": "up"} for i in range(count)}
+        self.events = []  # (sequence, device ID)
+        self.sequence = 0
+        self.oldest = 0
+        self.requests = []
+    
+    def change(self, device_id, status=None):
+        self.sequence += 1
+        if status is None:
+            self.devices.pop(device_id, None)
+        else:
+            self.devices[device_id] = {"id": device_id, "status": status}
+        self.events.append((self.sequence, device_id))
+    
+    async def handle(self, method, endpoint, params=None, priority=None, **kwargs):
+        self.requests.append((endpoint, dict(params or {}), priority))
+        limit = int(params["limit"])
+        
+        if endpoint == "/api/v2/devices":
+            offset = int(params["offset"])
+            ids = sorted(self.devices)[offset:offset + limit]
+            return {
+                "devices": [self.devices[i] for i in ids],
+                "total": len(self.devices),
+                "watermark": self.sequence
+            }
+        
+        since = int(params["since"])
+        if since < self.oldest:
+            raise APIError("Gone (Status: 410)", status_code=410)
+        start = int(params.get("cursor", since))
+        events = [(seq, d) for seq, d in self.events if seq > start][:limit]
+        changes = [
+            self.devices.get(d, {"id": d, "deleted": True})
+            for _, d in events
+        ]
+        last = events[-1][0] if events else start
+        return {
+            "changes": changes,
+            "next_cursor": str(last) if events else None,
+            "watermark": last
+        }
+
+def make_sync(central, tmp_path, **kwargs):
+    client = ArubaAPIClient("https://api.example.com", "valid_key_123")
+    client._make_request = central.handle
+    store = SQLiteInventoryStore(str(tmp_path / "inventory.db"))
+    return InventorySync(client, store, page_size=10, **kwargs), store
+
+class TestInventorySync:
+    """Test cases for InventorySync."""
+    
+    @pytest.mark.asyncio
+    async def test_first_sync_is_full(self, tmp_path):
+        """Test a store without a watermark lists the whole inventory."""
+        central = FakeCentral(25)
+        central.change("AP-3", "down")
+        sync, store = make_sync(central, tmp_path)
+        
+        result = await sync.sync()
+        
+        assert result.mode == FULL
+        assert result.upserted == 25
+        assert result.pages == 3
+        assert store.watermark == "1"
+        assert len(store) == 25
+        assert store.get("AP-3") == {"id": "AP-3", "status": "down"}
+        assert all(priority == "bulk" for _, _, priority in central.requests)
+    
+    @pytest.mark.asyncio
+    async def test_incremental_sync_fetches_only_changes(self, tmp_path):
+        """Test later syncs apply upserts and deletes from the change feed."""
+        central = FakeCentral(100)
+        sync, store = make_sync(central, tmp_path)
+        await sync.sync()
+        central.requests.clear()
+        
+        central.change("AP-1", "down")
+        central.change("AP-2", None)
+        central.change("AP-NEW", "up")
+        central.change("AP-1", "up")
+        
+        result = await sync.sync()
+        
+        assert result.mode == INCREMENTAL
+        assert (result.upserted, result.deleted) == (2, 1)
+        assert result.pages == 2
+        assert [(e, p["since"]) for e, p, _ in central.requests] == [("/api/v2/devices/changes", "0")] * 2
+        assert store.watermark == "4"
+        assert store.get("AP-2") is None
+        assert store.get("AP-NEW") == {"id": "AP-NEW", "status": "up"}
+        assert list(store.devices()) == sorted(central.devices.values(), key=lambda d: d["id"])
+        
+        result = await sync.sync()
+        assert (result.upserted, result.deleted, result.watermark) == (0, 0, "4")
+    
+    @pytest.mark.asyncio
+    async def test_invalid_watermark_triggers_resync(self, tmp_path):
+        """Test a rejected watermark falls back to a full resync that removes stale devices."""
+        central = FakeCentral(5)
+        sync, store = make_sync(central, tmp_path)
+        await sync.sync()
+        
+        central.change("AP-0", None)
+        central.change("AP-9", "up")
+        central.oldest = central.sequence + 1
+        
+        result = await sync.sync()
+        
+        assert result.mode == FULL
+        assert result.deleted == 1
+        assert store.watermark == "2"
+        assert store.get("AP-0") is None
+        assert store.get("AP-9") is not None
+        assert len(store) == 5
+    
+    @pytest.mark.asyncio
+    async def test_other_errors_propagate(self, tmp_path):
+        """Test unrelated API errors keep the watermark."""
+        central = FakeCentral(3)
+        sync, store = make_sync(central, tmp_path)
+        await sync.sync()
+        
+        async def fail(*args, **kwargs):
+            raise APIError("Server error (Status: 503)", status_code=503)
+        
+        sync.client._make_request = fail
+        with pytest.raises(APIError):
+            await sync.sync()
+        assert store.watermark == "0"
+    
+    @pytest.mark.asyncio
+    async def test_interrupted_resync_starts_over(self, tmp_path):
+        """Test a failed resync leaves no watermark, so the next sync is full again."""
+        central = FakeCentral(30)
+        sync, store = make_sync(central, tmp_path)
+        
+        calls = 0
+        handle = central.handle
+        
+        async def flaky(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise APIError("Server error (Status: 503)", status_code=503)
+            return await handle(*args, **kwargs)
+        
+        sync.client._make_request = flaky
+        with pytest.raises(APIError):
+            await sync.sync()
+        assert store.watermark is None
+        
+        result = await sync.sync()
+        assert result.mode == FULL
+        assert len(store) == 30
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,128 @@
+"""
+Test suite for non-blocking queue logging.
+"""
+
+import pytest
+import logging
+import threading
+import time
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from log_queue import QueueLogging, LogSampler
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, delay=0.0, gate=None):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+        self.delay = delay
+        self.gate = gate
+    
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        self.threads.add(threading.current_thread())
+        self.records.append(record)
+
+def make_logger(name, handler):
+    logger = logging.getLogger(f"test_log_queue.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+class TestQueueLogging:
+    """Test cases for QueueLogging."""
+    
+    def test_records_written_by_listener_thread(self):
+        """Test records reach the original handlers off the calling thread."""
+        handler = RecordingHandler()
+        logger = make_logger("thread", handler)
+        
+        with QueueLogging(logger) as queue_logging:
+            assert logger.handlers == [queue_logging.handler]
+            logger.error("API request failed", extra={"endpoint": "/api/v2/devices", "status_code": 503})
+        
+        assert logger.handlers == [handler]
+        (record,) = handler.records
+        assert record.getMessage() == "API request failed"
+        assert record.endpoint == "/api/v2/devices"
+        assert threading.current_thread() not in handler.threads
+    
+    def test_slow_handler_does_not_block(self):
+        """Test logging returns immediately even when the handler is slow."""
+        handler = RecordingHandler(delay=0.02)
+        logger = make_logger("slow", handler)
+        
+        with QueueLogging(logger, sampler=LogSampler(burst=100)):
+            started = time.monotonic()
+            for i in range(20):
+                logger.warning("Retrying request %d", i)
+            elapsed = time.monotonic() - started
+        
+        assert elapsed < 0.1
+        assert len(handler.records) == 20
+    
+    def test_full_queue_drops_records(self):
+        """Test records are dropped and counted instead of blocking on a full queue."""
+        gate = threading.Event()
+        handler = RecordingHandler(gate=gate)
+        logger = make_logger("full", handler)
+        
+        queue_logging = QueueLogging(logger, max_queue_size=2, sampler=LogSampler(burst=100)).start()
+        try:
+            for i in range(10):
+                logger.info("Record %d", i)
+            stats = queue_logging.stats()
+            assert stats["dropped"] >= 7
+            assert stats["queue_capacity"] == 2
+            assert 1 <= stats["queue_depth"] <= 2
+        finally:
+            gate.set()
+            queue_logging.stop()
+        
+        assert len(handler.records) + queue_logging.stats()["dropped"] == 10
+    
+    def test_prometheus_text(self):
+        """Test the queue statistics are exported."""
+        queue_logging = QueueLogging(make_logger("prometheus", RecordingHandler()))
+        text = queue_logging.render_prometheus()
+        assert "# TYPE aruba_api_log_queue_depth gauge" in text
+        assert "aruba_api_log_records_dropped_total 0" in text
+        assert "aruba_api_log_records_suppressed_total 0" in text
+
+class TestLogSampler:
+    """Test cases for LogSampler."""
+    
+    def test_repeated_records_are_rate_limited(self):
+        """Test a burst passes per interval and the next window reports the suppressed count."""
+        handler = RecordingHandler()
+        logger = make_logger("sampler", handler)
+        sampler = LogSampler(burst=3, interval=0.05)
+        handler.addFilter(sampler)
+        
+        for _ in range(10):
+            logger.error("Network connection failed")
+        logger.error("Request timeout")
+        logger.critical("Network connection failed")
+        
+        assert len(handler.records) == 5
+        assert sampler.suppressed == 7
+        
+        time.sleep(0.06)
+        logger.error("Network connection failed")
+        assert handler.records[-1].suppressed == 7
+    
+    def test_invalid_configuration(self):
+        """Test burst and interval must be positive."""
+        with pytest.raises(ValueError):
+            LogSampler(burst=0)
+        with pytest.raises(ValueError):
+            LogSampler(interval=0)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
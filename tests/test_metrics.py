@@ -0,0 +1,103 @@
+"""
+Test suite for API client metrics.
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from metrics import ClientMetrics, Histogram, normalize_endpoint, status_class, metrics_handler
+
+class TestNormalization:
+    """Test cases for endpoint template normalization."""
+    
+    def test_identifiers_replaced(self):
+        """Test IDs, MACs and UUIDs collapse to {id} while versions stay."""
+        assert normalize_endpoint("/api/v2/devices/AP-123/status") == "/api/v2/devices/{id}/status"
+        assert normalize_endpoint("/api/v2/clients/aa:bb:cc:dd:ee:ff") == "/api/v2/clients/{id}"
+        assert normalize_endpoint(
+            "/api/v2/sites/123e4567-e89b-12d3-a456-426614174000/health"
+        ) == "/api/v2/sites/{id}/health"
+        assert normalize_endpoint("/api/v2/security/threats?limit=5") == "/api/v2/security/threats"
+    
+    def test_status_class(self):
+        """Test status codes map to classes and transport failures to error."""
+        assert status_class(200) == "2xx"
+        assert status_class(503) == "5xx"
+        assert status_class(None) == "error"
+
+class TestClientMetrics:
+    """Test cases for ClientMetrics."""
+    
+    def test_request_counters_and_latency(self):
+        """Test requests are counted per method, template and status class."""
+        metrics = ClientMetrics()
+        for device_id in ("AP-1", "AP-2"):
+            metrics.request_started()
+            metrics.request_finished("GET", f"/api/v2/devices/{device_id}/status", 200, 0.02)
+        metrics.request_started()
+        metrics.request_finished("GET", "/api/v2/devices/AP-3/status", 429, 0.01)
+        
+        snapshot = metrics.snapshot()
+        assert {"method": "GET", "endpoint": "/api/v2/devices/{id}/status",
+                "status_class": "2xx", "count": 2} in snapshot["requests"]
+        assert snapshot["rate_limited"] == {"/api/v2/devices/{id}/status": 1}
+        assert snapshot["latency"][0]["count"] == 3
+        assert snapshot["in_flight"] == 0
+    
+    def test_cardinality_cap(self):
+        """Test templates beyond max_endpoints are reported as other."""
+        metrics = ClientMetrics(max_endpoints=2)
+        assert metrics.endpoint_label("/a") == "/a"
+        assert metrics.endpoint_label("/b") == "/b"
+        assert metrics.endpoint_label("/c") == "other"
+        assert metrics.endpoint_label("/a") == "/a"
+    
+    def test_histogram_quantile(self):
+        """Test histogram quantiles resolve to bucket upper bounds."""
+        histogram = Histogram((0.1, 0.5, 1.0))
+        for value in (0.05, 0.05, 0.3, 2.0):
+            histogram.observe(value)
+        
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.75) == 0.5
+        assert histogram.quantile(1.0) == float('inf')
+        assert histogram.cumulative()[-1] == ("+Inf", 4)
+    
+    def test_prometheus_text(self):
+        """Test the exposition text has typed metrics with escaped labels."""
+        metrics = ClientMetrics()
+        metrics.request_started()
+        metrics.request_finished("GET", "/api/v2/security/threats", 200, 0.03)
+        metrics.record_retry("GET", "/api/v2/security/threats")
+        metrics.record_rate_limit_wait(0.2)
+        metrics.record_compression("response", 100, 400)
+        
+        text = metrics.render_prometheus()
+        
+        assert "# TYPE aruba_api_requests_total counter" in text
+        assert 'aruba_api_requests_total{method="GET",endpoint="/api/v2/security/threats",status_class="2xx"} 1' in text
+        assert 'aruba_api_request_duration_seconds_bucket{method="GET",endpoint="/api/v2/security/threats",le="0.05"} 1' in text
+        assert 'aruba_api_retries_total{method="GET",endpoint="/api/v2/security/threats"} 1' in text
+        assert "aruba_api_rate_limit_wait_seconds_count 1" in text
+        assert 'aruba_api_compressed_body_bytes_total{direction="response"} 100' in text
+        assert 'aruba_api_uncompressed_body_bytes_total{direction="response"} 400' in text
+        assert "aruba_api_requests_in_flight 0" in text
+        
+        assert metrics.snapshot()["compression"] == {
+            "response": {"encoded_bytes": 100, "decoded_bytes": 400, "saved_bytes": 300, "ratio": 4.0}
+        }
+    
+    @pytest.mark.asyncio
+    async def test_metrics_handler(self):
+        """Test the aiohttp handler serves the exposition text."""
+        metrics = ClientMetrics()
+        response = await metrics_handler(metrics)(None)
+        
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert b"aruba_api_requests_in_flight 0" in response.body
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,116 @@
+"""
+Test suite for multi-cluster routing.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from api_client import ValidationError, APIError
+from multi_cluster import MultiClusterClient
+
+CLUSTERS = {
+    "us": "https://us.example.com",
+    "eu": "https://eu.example.com"
+}
+
+def make_client(**kwargs):
+    return MultiClusterClient(
+        CLUSTERS,
+        "valid_key_123",
+        tenants={"acme": "eu"},
+        device_prefixes={"EU-": "eu", "EU-US-": "us"},
+        **kwargs
+    )
+
+class TestMultiClusterClient:
+    """Test cases for MultiClusterClient."""
+    
+    def test_configuration_validation(self):
+        """Test rules naming unknown clusters are rejected."""
+        with pytest.raises(ValueError, match="Unknown cluster"):
+            MultiClusterClient(CLUSTERS, "valid_key_123", tenants={"acme": "apac"})
+        
+        with pytest.raises(ValueError, match="No API key"):
+            MultiClusterClient(CLUSTERS, {"us": "valid_key_123"})
+    
+    def test_routing(self):
+        """Test tenant, longest prefix and default routing."""
+        client = make_client(default_cluster="us")
+        
+        assert client.cluster_for(tenant="acme") == "eu"
+        assert client.cluster_for("EU-AP-1") == "eu"
+        assert client.cluster_for("EU-US-AP-1") == "us"
+        assert client.cluster_for("AP-1") == "us"
+        assert client.cluster_for("AP-1", tenant="acme") == "eu"
+        assert client.cluster_for("EU-AP-1", tenant="t-new") == "eu"
+        assert client.cluster_for("AP-1", tenant="t-new") == "us"
+        
+        with pytest.raises(ValidationError):
+            make_client().cluster_for("AP-1")
+    
+    def test_independent_clusters(self):
+        """Test each cluster has its own client and rate limiter."""
+        client = make_client(
+            requests_per_second=10,
+            cluster_options={"eu": {"requests_per_second": 2}}
+        )
+        
+        assert client.clients["us"].base_url == "https://us.example.com"
+        assert client.clients["us"]._rate_limiter is not client.clients["eu"]._rate_limiter
+        assert client.clients["eu"]._rate_limiter.rate == 2
+        assert client.clients["us"]._rate_limiter.rate == 10
+    
+    @pytest.mark.asyncio
+    async def test_calls_are_routed(self):
+        """Test single-device calls reach the owning cluster."""
+        client = make_client()
+        for cluster in client.clients.values():
+            cluster._make_request = AsyncMock(return_value={"ok": True})
+        
+        await client.quarantine_device("EU-AP-1", "malware")
+        
+        client.clients["eu"]._make_request.assert_called_once()
+        client.clients["us"]._make_request.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_slow_cluster_does_not_block_others(self):
+        """Test bulk polling yields fast clusters' results first."""
+        client = make_client()
+        
+        async def slow(method, endpoint, **kwargs):
+            await asyncio.sleep(0.2)
+            return {"cluster": "eu"}
+        
+        client.clients["eu"]._make_request = AsyncMock(side_effect=slow)
+        client.clients["us"]._make_request = AsyncMock(return_value={"cluster": "us"})
+        
+        results = [item async for item in client.iter_device_statuses(
+            ["EU-AP-1", "EU-US-1", "EU-US-2", "AP-1"]
+        )]
+        
+        assert results[0][0] == "AP-1"
+        assert isinstance(results[0][1], ValidationError)
+        assert sorted(device for device, _ in results[1:3]) == ["EU-US-1", "EU-US-2"]
+        assert results[3] == ("EU-AP-1", {"cluster": "eu"})
+    
+    @pytest.mark.asyncio
+    async def test_run_on_clusters(self):
+        """Test per-cluster results and errors are collected."""
+        client = make_client()
+        
+        async def operation(cluster_client):
+            if "eu" in cluster_client.base_url:
+                raise APIError("down")
+            return "ok"
+        
+        results = await client.run_on_clusters(operation)
+        assert results["us"] == "ok"
+        assert isinstance(results["eu"], APIError)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
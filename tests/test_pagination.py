@@ -0,0 +1,102 @@
+"""
+Test suite for the async pagination iterator.
+"""
+
+import pytest
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pagination import Paginator
+
+def offset_source(total, calls):
+    """Fake offset-style endpoint serving items 0..total-1."""
+    async def fetch_page(params):
+        calls.append(dict(params))
+        offset, limit = int(params["offset"]), int(params["limit"])
+        return {"items": list(range(offset, min(offset + limit, total))), "total": total}
+    return fetch_page
+
+async def collect(paginator):
+    return [item async for item in paginator]
+
+class TestPaginator:
+    """Test cases for Paginator."""
+    
+    def test_invalid_options(self):
+        """Test invalid styles and sizes are rejected."""
+        with pytest.raises(ValueError, match="Invalid pagination style"):
+            Paginator(None, "items", style="pages")
+        
+        with pytest.raises(ValueError, match="page_size"):
+            Paginator(None, "items", page_size=0)
+    
+    @pytest.mark.asyncio
+    async def test_offset_pagination(self):
+        """Test offset pagination walks every page once."""
+        calls = []
+        items = await collect(Paginator(offset_source(25, calls), "items", page_size=10, params={"q": "x"}))
+        
+        assert items == list(range(25))
+        assert [c["offset"] for c in calls] == ["0", "10", "20"]
+        assert all(c["q"] == "x" for c in calls)
+    
+    @pytest.mark.asyncio
+    async def test_total_avoids_empty_page(self):
+        """Test an exact multiple of page_size stops at the advertised total."""
+        calls = []
+        items = await collect(Paginator(offset_source(20, calls), "items", page_size=10))
+        
+        assert len(items) == 20
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(self):
+        """Test cursor pagination follows next_cursor until it is absent."""
+        pages = {
+            None: {"items": [1, 2], "next_cursor": "c2"},
+            "c2": {"items": [3, 4], "next_cursor": "c3"},
+            "c3": {"items": [5]}
+        }
+        
+        async def fetch_page(params):
+            return pages[params.get("cursor")]
+        
+        items = await collect(Paginator(fetch_page, "items", page_size=2, style="cursor"))
+        assert items == [1, 2, 3, 4, 5]
+    
+    @pytest.mark.asyncio
+    async def test_max_items_and_predicate(self):
+        """Test iteration stops at max_items or the first matching item."""
+        calls = []
+        items = await collect(Paginator(offset_source(100, calls), "items", page_size=10, max_items=15))
+        assert items == list(range(15))
+        assert len(calls) == 2
+        
+        items = await collect(Paginator(
+            offset_source(100, []), "items", page_size=10, stop_when=lambda item: item >= 12
+        ))
+        assert items == list(range(12))
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_overlaps_processing(self):
+        """Test the next page is fetched while the current one is processed."""
+        async def fetch_page(params):
+            await asyncio.sleep(0.05)
+            offset = int(params["offset"])
+            return {"items": list(range(offset, offset + 5)) if offset < 20 else []}
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async for item in Paginator(fetch_page, "items", page_size=5):
+            if item % 5 == 4:
+                await asyncio.sleep(0.05)
+        elapsed = loop.time() - start
+        
+        # Sequential would take 5 fetches + 4 processing pauses = 0.45s
+        assert elapsed < 0.4
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,151 @@
+"""
+Test suite for the API client rate limiting primitives.
+"""
+
+import pytest
+import asyncio
+import time
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rate_limiter import TokenBucket, AdaptiveRateLimiter, retry_after_from_headers
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+    
+    def test_init_defaults(self):
+        """Test capacity defaults to the per-second rate."""
+        bucket = TokenBucket(20)
+        assert bucket.rate == 20.0
+        assert bucket.capacity == 20
+        
+        assert TokenBucket(0.5).capacity == 1
+    
+    def test_init_invalid(self):
+        """Test invalid rate and capacity are rejected."""
+        with pytest.raises(ValueError, match="rate must be"):
+            TokenBucket(0)
+        
+        with pytest.raises(ValueError, match="capacity must be"):
+            TokenBucket(10, capacity=0)
+    
+    def test_reserve_within_burst(self):
+        """Test reservations inside the burst do not wait."""
+        bucket = TokenBucket(10, capacity=3)
+        
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+    
+    def test_refund(self):
+        """Test refunded tokens become available again."""
+        bucket = TokenBucket(1, capacity=1)
+        bucket.reserve()
+        bucket.refund()
+        assert bucket.reserve() == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_acquire_paces_requests(self):
+        """Test acquire spaces requests beyond the burst at the configured rate."""
+        bucket = TokenBucket(50, capacity=5)
+        
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+        elapsed = time.monotonic() - start
+        
+        # 5 burst tokens, then 10 more at 50/s
+        assert 0.15 <= elapsed < 0.5
+    
+    @pytest.mark.asyncio
+    async def test_acquire_cancel_refunds(self):
+        """Test cancelling a waiter returns its token."""
+        bucket = TokenBucket(1, capacity=1)
+        await bucket.acquire()
+        
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        
+        assert bucket.available > -0.5
+    
+    def test_pause_delays_reservations(self):
+        """Test a pause pushes every reservation past the pause window."""
+        bucket = TokenBucket(100, capacity=10)
+        bucket.pause(2)
+        
+        assert bucket.reserve() == pytest.approx(2.01, abs=0.02)
+
+class TestRetryAfter:
+    """Test cases for 429 back-off selection."""
+    
+    def test_retry_after_header(self):
+        """Test an explicit Retry-After wins."""
+        assert retry_after_from_headers({'Retry-After': '7'}) == 7.0
+    
+    def test_per_second_window(self):
+        """Test an exhausted per-second window only waits one second."""
+        headers = {'X-RateLimit-Remaining-second': '0', 'X-RateLimit-Remaining-day': '5000'}
+        assert retry_after_from_headers(headers) == 1.0
+    
+    def test_daily_quota_exhausted(self):
+        """Test an exhausted daily quota waits for the daily reset."""
+        headers = {'X-RateLimit-Remaining-day': '0', 'X-RateLimit-Reset-day': '120'}
+        assert retry_after_from_headers(headers) == 120.0
+    
+    def test_no_hint(self):
+        """Test the default applies when the server gives no hint."""
+        assert retry_after_from_headers({}, default=60) == 60
+        assert retry_after_from_headers({'Retry-After': 'garbage'}, default=5) == 5
+
+class TestAdaptiveRateLimiter:
+    """Test cases for AdaptiveRateLimiter."""
+    
+    def test_advertised_limit_caps_rate(self):
+        """Test the per-second limit header sets the pacing ceiling."""
+        limiter = AdaptiveRateLimiter(50, safety_factor=0.8)
+        limiter.update_from_headers({'X-RateLimit-Limit-second': '10'})
+        assert limiter.rate == pytest.approx(8.0)
+    
+    def test_speeds_up_with_headroom(self):
+        """Test the rate rises when the server advertises a higher limit."""
+        limiter = AdaptiveRateLimiter(5, safety_factor=1.0)
+        limiter.update_from_headers({'X-RateLimit-Limit-second': '20'})
+        assert limiter.rate == 20.0
+    
+    def test_remaining_second_caps_tokens(self):
+        """Test the server's remaining count caps the tokens on hand."""
+        limiter = AdaptiveRateLimiter(10, capacity=10)
+        limiter.update_from_headers({'X-RateLimit-Remaining-second': '2'})
+        assert limiter.available <= 2.1
+    
+    def test_daily_budget_spread(self):
+        """Test the remaining daily budget is spread until the reset."""
+        limiter = AdaptiveRateLimiter(10, min_rate=0.1)
+        limiter.update_from_headers({
+            'X-RateLimit-Remaining-day': '3600',
+            'X-RateLimit-Reset-day': '7200'
+        })
+        assert limiter.rate == pytest.approx(0.5)
+    
+    def test_on_rate_limited_pauses(self):
+        """Test a 429 pauses admission for the advised delay."""
+        limiter = AdaptiveRateLimiter(10)
+        delay = limiter.on_rate_limited({'Retry-After': '3'})
+        
+        assert delay == 3.0
+        assert limiter.reserve() >= 2.9
+        assert limiter.status()["rate_limited_count"] == 1
+    
+    def test_invalid_params(self):
+        """Test invalid adaptive parameters are rejected."""
+        with pytest.raises(ValueError, match="safety_factor"):
+            AdaptiveRateLimiter(10, safety_factor=0)
+        with pytest.raises(ValueError, match="min_rate"):
+            AdaptiveRateLimiter(10, min_rate=-1)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
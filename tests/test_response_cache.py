@@ -0,0 +1,190 @@
+"""
+Test suite for the GET response cache.
+"""
+
+import pytest
+import multiprocessing
+import sqlite3
+import time
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from response_cache import ResponseCache, SQLiteResponseCache
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+    
+    def test_ttl_rules(self):
+        """Test the first matching pattern decides the TTL."""
+        cache = ResponseCache({
+            "/api/v2/devices/*/status": 15,
+            "/api/v2/security/threats": 5
+        }, default_ttl=0)
+        
+        assert cache.ttl_for("/api/v2/devices/AP-1/status") == 15
+        assert cache.ttl_for("/api/v2/security/threats") == 5
+        assert cache.ttl_for("/api/v2/other") == 0
+    
+    def test_invalid_config(self):
+        """Test invalid TTLs and sizes are rejected."""
+        with pytest.raises(ValueError, match="Invalid TTL"):
+            ResponseCache({"/api/*": -1})
+        
+        with pytest.raises(ValueError, match="max_entries"):
+            ResponseCache(max_entries=0)
+    
+    def test_hit_and_miss(self):
+        """Test fresh entries are hits and unknown keys are misses."""
+        cache = ResponseCache(default_ttl=60)
+        
+        assert cache.lookup("GET /a") is None
+        cache.store("GET /a", "/a", {"x": 1}, {})
+        entry = cache.lookup("GET /a")
+        
+        assert entry.data == {"x": 1}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+    
+    def test_stale_entry_revalidation(self):
+        """Test stale entries with validators are kept for revalidation."""
+        cache = ResponseCache(default_ttl=60)
+        cache.store("GET /a", "/a", {"x": 1}, {"ETag": '"v1"'})
+        cache._entries["GET /a"].expires_at = time.time() - 1
+        
+        entry = cache.lookup("GET /a")
+        assert entry is not None
+        assert not entry.is_fresh()
+        assert entry.validators() == {"If-None-Match": '"v1"'}
+        
+        cache.revalidated("GET /a", "/a", {})
+        assert cache.lookup("GET /a").is_fresh()
+        assert cache.stats()["revalidations"] == 1
+    
+    def test_stale_entry_without_validators(self):
+        """Test stale entries without validators are dropped."""
+        cache = ResponseCache(default_ttl=60)
+        cache.store("GET /a", "/a", {"x": 1}, {})
+        cache._entries["GET /a"].expires_at = time.time() - 1
+        
+        assert cache.lookup("GET /a") is None
+        assert len(cache) == 0
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ResponseCache(default_ttl=60, max_entries=2)
+        cache.store("a", "/a", 1, {})
+        cache.store("b", "/b", 2, {})
+        cache.lookup("a")
+        cache.store("c", "/c", 3, {})
+        
+        assert cache.lookup("b") is None
+        assert cache.lookup("a").data == 1
+        assert cache.stats()["evictions"] == 1
+    
+    def test_no_store(self):
+        """Test Cache-Control: no-store responses are not cached."""
+        cache = ResponseCache(default_ttl=60)
+        assert cache.store("a", "/a", 1, {"Cache-Control": "no-store"}) is None
+        assert len(cache) == 0
+
+def read_entry(path, key, results):
+    """Look up a cached entry from another process."""
+    cache = SQLiteResponseCache(path, default_ttl=60)
+    entry = cache.lookup(key)
+    results.put(entry.data if entry else None)
+    cache.close()
+
+class TestSQLiteResponseCache:
+    """Test cases for SQLiteResponseCache."""
+    
+    def expire(self, cache, key):
+        cache._conn.execute("UPDATE responses SET expires_at = 0 WHERE key = ?", (key,))
+    
+    def test_entries_survive_restart(self, tmp_path):
+        """Test a new instance serves and revalidates the stored entries."""
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteResponseCache(path, default_ttl=60)
+        cache.store("GET /a", "/a", {"devices": [1, 2]}, {"ETag": '"v1"'})
+        cache.close()
+        
+        cache = SQLiteResponseCache(path, default_ttl=60)
+        assert cache.lookup("GET /a").data == {"devices": [1, 2]}
+        
+        self.expire(cache, "GET /a")
+        entry = cache.lookup("GET /a")
+        assert entry.validators() == {"If-None-Match": '"v1"'}
+        assert cache.revalidated("GET /a", "/a", {"ETag": '"v2"'}).etag == '"v2"'
+        assert cache.lookup("GET /a").is_fresh()
+        assert cache.stats()["revalidations"] == 1
+        
+        cache.store("GET /b", "/b", 1, {})
+        self.expire(cache, "GET /b")
+        assert cache.lookup("GET /b") is None
+        assert len(cache) == 1
+        cache.close()
+    
+    def test_wal_mode_and_shared_readers(self, tmp_path):
+        """Test the database uses WAL and other processes read its entries."""
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteResponseCache(path, default_ttl=60)
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        cache.store("GET /a", "/a", {"x": 1}, {})
+        
+        results = multiprocessing.Queue()
+        readers = [
+            multiprocessing.Process(target=read_entry, args=(path, "GET /a", results))
+            for _ in range(3)
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join(10)
+        
+        assert [results.get(timeout=1) for _ in readers] == [{"x": 1}] * 3
+        cache.close()
+    
+    def test_size_bounded_eviction(self, tmp_path):
+        """Test least recently used entries are evicted to stay within max_bytes."""
+        cache = SQLiteResponseCache(
+            str(tmp_path / "cache.db"), default_ttl=60, max_bytes=250, touch_interval=0
+        )
+        for key in ("a", "b"):
+            cache.store(key, "/x", "x" * 98, {})
+            time.sleep(0.01)
+        cache.lookup("a")
+        cache.store("c", "/x", "x" * 98, {})
+        
+        assert cache.lookup("b") is None
+        assert cache.lookup("a").data == "x" * 98
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= 250
+        
+        assert cache.store("huge", "/x", "x" * 300, {}) is None
+        cache.close()
+    
+    def test_locked_database_is_bypassed(self, tmp_path):
+        """Test writes blocked by another process fail fast without raising."""
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteResponseCache(path, default_ttl=60, touch_interval=0)
+        cache.store("GET /a", "/a", {"x": 1}, {})
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        
+        started = time.monotonic()
+        assert cache.store("GET /b", "/b", 2, {}) is None
+        assert cache.lookup("GET /a").data == {"x": 1}
+        assert time.monotonic() - started < 1
+        assert cache.stats()["errors"] == 2
+        
+        other.execute("ROLLBACK")
+        other.close()
+        assert cache.store("GET /b", "/b", 2, {}) is not None
+        cache.close()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
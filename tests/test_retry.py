@@ -0,0 +1,88 @@
+"""
+Test suite for retry policies and retry budgets.
+"""
+
+import pytest
+import asyncio
+import random
+
+import aiohttp
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from retry import RetryPolicy, RetryBudget, NO_RETRY
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+    
+    def test_invalid_policy(self):
+        """Test invalid attempt counts and delays are rejected."""
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
+        
+        with pytest.raises(ValueError, match="non-negative"):
+            RetryPolicy(base_delay=-1)
+    
+    def test_backoff_full_jitter(self):
+        """Test backoff stays within the exponential ceiling."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        rng = random.Random(7)
+        
+        for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+            delays = [policy.backoff(attempt, rng) for _ in range(50)]
+            assert all(0 <= d <= ceiling for d in delays)
+    
+    def test_retryable_status(self):
+        """Test status-based retry decisions respect idempotency."""
+        policy = RetryPolicy()
+        
+        assert policy.is_retryable(503, None, idempotent=True)
+        assert not policy.is_retryable(503, None, idempotent=False)
+        assert not policy.is_retryable(404, None, idempotent=True)
+        # 429 means the server did not process the request
+        assert policy.is_retryable(429, None, idempotent=False)
+    
+    def test_retryable_exceptions(self):
+        """Test transport exceptions are retried only for safe requests."""
+        policy = RetryPolicy()
+        
+        assert policy.is_retryable(None, aiohttp.ClientConnectionError(), idempotent=True)
+        assert policy.is_retryable(None, asyncio.TimeoutError(), idempotent=True)
+        assert not policy.is_retryable(None, aiohttp.ClientConnectionError(), idempotent=False)
+        assert not policy.is_retryable(None, ValueError(), idempotent=True)
+        
+        unsafe_ok = RetryPolicy(retry_non_idempotent=True)
+        assert unsafe_ok.is_retryable(None, aiohttp.ClientConnectionError(), idempotent=False)
+    
+    def test_no_retry(self):
+        """Test the NO_RETRY policy allows a single attempt."""
+        assert NO_RETRY.max_attempts == 1
+
+class TestRetryBudget:
+    """Test cases for RetryBudget."""
+    
+    def test_budget_limits_retries(self):
+        """Test retries are rejected once the allowance is spent."""
+        budget = RetryBudget(ratio=0.1, min_per_second=0)
+        
+        for _ in range(20):
+            budget.record_request()
+        
+        allowed = sum(budget.try_spend() for _ in range(10))
+        assert allowed == 2
+        assert budget.stats()["rejected"] == 8
+    
+    def test_min_per_second_allowance(self):
+        """Test a low-traffic client starts with a small retry allowance."""
+        budget = RetryBudget(ratio=0, min_per_second=1)
+        assert budget.try_spend()
+    
+    def test_invalid_budget(self):
+        """Test negative parameters are rejected."""
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-1)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
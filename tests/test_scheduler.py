@@ -0,0 +1,123 @@
+"""
+Test suite for priority admission scheduling.
+"""
+
+import pytest
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scheduler import PriorityScheduler, CRITICAL, INTERACTIVE, BULK
+
+class ManualGate:
+    """Gate that grants one admission each time ``open()`` is called."""
+    
+    def __init__(self):
+        self.tokens = asyncio.Semaphore(0)
+        self.returned = 0
+    
+    async def admit(self):
+        await self.tokens.acquire()
+    
+    def give_back(self):
+        self.returned += 1
+    
+    def open(self, count=1):
+        for _ in range(count):
+            self.tokens.release()
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+class TestPriorityScheduler:
+    """Test cases for PriorityScheduler."""
+    
+    def test_weight_validation(self):
+        """Test weights must be positive."""
+        with pytest.raises(ValueError, match="weight for bulk"):
+            PriorityScheduler(asyncio.sleep, lambda: None, {BULK: 0})
+    
+    @pytest.mark.asyncio
+    async def test_invalid_priority(self):
+        """Test unknown priority classes are rejected."""
+        scheduler = PriorityScheduler(asyncio.sleep, lambda: None)
+        with pytest.raises(ValueError, match="Invalid priority"):
+            await scheduler.acquire("urgent")
+    
+    @pytest.mark.asyncio
+    async def test_critical_takes_next_admission(self):
+        """Test a critical request overtakes queued bulk work."""
+        gate = ManualGate()
+        scheduler = PriorityScheduler(gate.admit, gate.give_back)
+        order = []
+        
+        async def request(name, priority):
+            await scheduler.acquire(priority)
+            order.append(name)
+        
+        tasks = [asyncio.create_task(request(f"bulk-{i}", BULK)) for i in range(5)]
+        await settle()
+        tasks.append(asyncio.create_task(request("critical", CRITICAL)))
+        await settle()
+        
+        gate.open()
+        await settle()
+        assert order == ["critical"]
+        
+        gate.open(5)
+        await asyncio.gather(*tasks)
+        assert order[1:] == [f"bulk-{i}" for i in range(5)]
+        assert scheduler.stats()[CRITICAL]["admitted"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_weighted_share(self):
+        """Test interactive and bulk share admissions by weight without starvation."""
+        gate = ManualGate()
+        scheduler = PriorityScheduler(gate.admit, gate.give_back, {INTERACTIVE: 3, BULK: 1})
+        order = []
+        
+        async def request(priority):
+            await scheduler.acquire(priority)
+            order.append(priority)
+        
+        tasks = [asyncio.create_task(request(BULK)) for _ in range(8)]
+        tasks += [asyncio.create_task(request(INTERACTIVE)) for _ in range(8)]
+        await settle()
+        
+        gate.open(8)
+        await settle()
+        assert order.count(INTERACTIVE) == 6
+        assert order.count(BULK) == 2
+        
+        gate.open(8)
+        await asyncio.gather(*tasks)
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_waiters_are_skipped(self):
+        """Test an admission is not wasted on a cancelled waiter."""
+        gate = ManualGate()
+        scheduler = PriorityScheduler(gate.admit, gate.give_back)
+        
+        cancelled = asyncio.create_task(scheduler.acquire(BULK))
+        waiting = asyncio.create_task(scheduler.acquire(BULK))
+        await settle()
+        cancelled.cancel()
+        await settle()
+        
+        gate.open()
+        await asyncio.wait_for(waiting, 1)
+        assert gate.returned == 0
+        
+        lonely = asyncio.create_task(scheduler.acquire(BULK))
+        await settle()
+        lonely.cancel()
+        await settle()
+        gate.open()
+        await settle()
+        assert gate.returned == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
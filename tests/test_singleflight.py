@@ -0,0 +1,80 @@
+"""
+Test suite for single-flight request coalescing.
+"""
+
+import pytest
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from singleflight import SingleFlight
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test overlapping calls with the same key run the operation once."""
+        flight = SingleFlight()
+        calls = []
+        
+        async def operation():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 42}
+        
+        results = await asyncio.gather(*(flight.do("k", operation) for _ in range(5)))
+        
+        assert results == [{"value": 42}] * 5
+        assert len(calls) == 1
+        assert flight.stats() == {"started": 1, "coalesced": 4, "in_flight": 0}
+    
+    @pytest.mark.asyncio
+    async def test_exception_shared(self):
+        """Test every waiter receives the shared exception."""
+        flight = SingleFlight()
+        
+        async def operation():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+        
+        results = await asyncio.gather(
+            *(flight.do("k", operation) for _ in range(3)),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(r, RuntimeError) for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self):
+        """Test calls that do not overlap each start their own operation."""
+        flight = SingleFlight()
+        
+        async def operation():
+            return 1
+        
+        await flight.do("k", operation)
+        await flight.do("k", operation)
+        
+        assert flight.stats()["started"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_waiter_cancel_does_not_cancel_others(self):
+        """Test cancelling one waiter leaves the shared operation running."""
+        flight = SingleFlight()
+        
+        async def operation():
+            await asyncio.sleep(0.02)
+            return "done"
+        
+        first = asyncio.create_task(flight.do("k", operation))
+        second = asyncio.create_task(flight.do("k", operation))
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        assert await second == "done"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
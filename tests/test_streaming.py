@@ -0,0 +1,94 @@
+"""
+Test suite for incremental JSON array parsing.
+"""
+
+import pytest
+import json
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from streaming import JSONArrayStream
+
+def parse_in_chunks(document, path, size):
+    parser = JSONArrayStream(path)
+    items = []
+    for i in range(0, len(document), size):
+        items.extend(parser.feed(document[i:i + size]))
+    items.extend(parser.close())
+    return items
+
+class TestJSONArrayStream:
+    """Test cases for JSONArrayStream."""
+    
+    DOCUMENT = json.dumps({
+        "meta": {"items": ["decoy"], "note": "quote \" and [brackets] {braces}"},
+        "data": {
+            "count": 6,
+            "items": [{"id": "AP-1", "tags": ["a", "b"]}, "text ]", 12345, -1.5e3, True, None]
+        },
+        "next_cursor": "abc"
+    }).encode()
+    
+    EXPECTED = [{"id": "AP-1", "tags": ["a", "b"]}, "text ]", 12345, -1500.0, True, None]
+    
+    @pytest.mark.parametrize("size", [1, 2, 5, 64, 100000])
+    def test_chunk_boundaries(self, size):
+        """Test elements are identical however the document is split."""
+        assert parse_in_chunks(self.DOCUMENT, "data.items", size) == self.EXPECTED
+    
+    def test_top_level_array(self):
+        """Test an empty path selects a top-level array."""
+        assert parse_in_chunks(b'[{"a": 1}, [2], 3]', "", 3) == [{"a": 1}, [2], 3]
+    
+    def test_multibyte_characters_split(self):
+        """Test UTF-8 sequences split across chunks are decoded."""
+        document = json.dumps({"items": ["café", "日本"]}, ensure_ascii=False).encode()
+        assert parse_in_chunks(document, "items", 1) == ["café", "日本"]
+    
+    def test_items_released_incrementally(self):
+        """Test complete elements are returned before the document ends."""
+        parser = JSONArrayStream("devices")
+        assert parser.feed(b'{"devices": [{"id": 1}, {"id"') == [{"id": 1}]
+        assert parser.feed(b': 2}, 3') == [{"id": 2}]
+        assert parser.feed(b']}') == [3]
+        assert parser.close() == []
+        assert parser.items == 3
+    
+    def test_missing_array(self):
+        """Test a document without the array yields nothing."""
+        parser = JSONArrayStream("devices")
+        assert parser.feed(b'{"devices": null, "other": [1]}') == []
+        assert parser.close() == []
+        assert not parser.found
+    
+    def test_truncated_document(self):
+        """Test a document ending inside the array is an error."""
+        parser = JSONArrayStream("devices")
+        parser.feed(b'{"devices": [1, {"id": ')
+        with pytest.raises(ValueError, match="ended inside"):
+            parser.close()
+    
+    def test_truncated_literal(self):
+        """Test a literal cut off at the end is reported as truncation."""
+        parser = JSONArrayStream("devices")
+        assert parser.feed(b'{"devices": [1, tr') == [1]
+        with pytest.raises(ValueError, match="ended inside"):
+            parser.close()
+    
+    def test_malformed_element(self):
+        """Test an element that cannot be JSON is reported as malformed."""
+        parser = JSONArrayStream("devices")
+        parser.feed(b'{"devices": [1, {"id": oops}')
+        with pytest.raises(ValueError, match="Malformed"):
+            parser.close()
+    
+    def test_item_size_limit(self):
+        """Test an oversized element is rejected instead of buffered forever."""
+        parser = JSONArrayStream("devices", max_item_size=10)
+        with pytest.raises(ValueError, match="too large"):
+            parser.feed(b'{"devices": [{"name": "' + b"x" * 100)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
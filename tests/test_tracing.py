@@ -0,0 +1,99 @@
+"""
+Test suite for connection-phase tracing.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+import aiohttp
+from aiohttp import web
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tracing import RequestTracer
+from api_client import ArubaAPIClient
+
+@asynccontextmanager
+async def serve():
+    """Run a local HTTP server answering device status requests."""
+    app = web.Application()
+    async def handler(request):
+        return web.json_response({"ok": True})
+    
+    app.router.add_get("/api/v2/devices/{device_id}/status", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+class TestRequestTracer:
+    """Test cases for RequestTracer."""
+    
+    def test_capacity_validation(self):
+        """Test the ring buffer size must be positive."""
+        with pytest.raises(ValueError, match="capacity"):
+            RequestTracer(capacity=0)
+    
+    @pytest.mark.asyncio
+    async def test_records_connection_phases(self):
+        """Test the first request connects and the second reuses the connection."""
+        seen = []
+        tracer = RequestTracer(callback=seen.append)
+        
+        async with serve() as server, aiohttp.ClientSession(trace_configs=[tracer.trace_config()]) as session:
+            for _ in range(2):
+                async with session.get(
+                    f"{server}/api/v2/devices/AP-1/status?token=secret",
+                    trace_request_ctx={"endpoint": "/api/v2/devices/{id}/status"}
+                ) as response:
+                    await response.read()
+        
+        first, second = tracer.dump()
+        assert len(seen) == 2
+        assert first["status"] == 200
+        assert first["path"] == "/api/v2/devices/AP-1/status"
+        assert first["endpoint"] == "/api/v2/devices/{id}/status"
+        assert not first["connection_reused"]
+        assert first["connect"] is not None
+        assert first["ttfb"] is not None and first["ttfb"] <= first["total"]
+        assert second["connection_reused"]
+        assert second["connect"] is None
+        assert "secret" not in str(tracer.dump())
+        
+        summary = tracer.summary()
+        assert summary["requests"] == 2
+        assert summary["connection_reuse_ratio"] == 0.5
+    
+    @pytest.mark.asyncio
+    async def test_records_failures_and_ring_buffer(self):
+        """Test failed requests are recorded and old spans are evicted."""
+        tracer = RequestTracer(capacity=1, callback=lambda span: 1 / 0)
+        
+        async with serve() as server, aiohttp.ClientSession(trace_configs=[tracer.trace_config()]) as session:
+            async with session.get(f"{server}/api/v2/devices/AP-1/status") as response:
+                await response.read()
+            with pytest.raises(aiohttp.ClientError):
+                await session.get("http://127.0.0.1:1/unreachable")
+        
+        spans = tracer.dump(clear=True)
+        assert len(spans) == 1
+        assert spans[0]["path"] == "/unreachable"
+        assert spans[0]["error"] is not None
+        assert spans[0]["ttfb"] is None
+        assert tracer.dump() == []
+    
+    @pytest.mark.asyncio
+    async def test_client_installs_trace_config(self):
+        """Test the client session is created with the tracer's hooks."""
+        tracer = RequestTracer()
+        async with ArubaAPIClient("https://api.example.com", "valid_key_123", tracer=tracer) as client:
+            assert len(client.session.trace_configs) == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
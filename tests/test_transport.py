@@ -0,0 +1,151 @@
+"""
+Test suite for pluggable HTTP transports.
+"""
+
+import pytest
+import asyncio
+import json
+from contextlib import asynccontextmanager
+import aiohttp
+from aiohttp import web
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import transport
+from transport import HTTP2Transport
+from api_client import ArubaAPIClient, APIError
+from tracing import RequestTracer
+
+requires_httpx = pytest.mark.skipif(transport.httpx is None, reason="httpx is not installed")
+
+DEVICES = {"devices": [{"id": f"AP-{i}"} for i in range(50)]}
+
+@asynccontextmanager
+async def serve():
+    """Run a local HTTP server with an inventory, an echo and a slow endpoint."""
+    app = web.Application()
+    async def inventory(request):
+        return web.json_response(DEVICES, headers={"X-Auth": request.headers.get("Authorization", "")})
+    
+    async def echo(request):
+        return web.json_response(json.loads(await request.read()))
+    
+    async def slow(request):
+        await asyncio.sleep(1)
+        return web.json_response({})
+    
+    app.router.add_get("/api/v2/devices", inventory)
+    app.router.add_post("/api/v2/echo", echo)
+    app.router.add_get("/api/v2/slow", slow)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+class TestClientTransportOption:
+    """Test cases for the transport option of ArubaAPIClient."""
+    
+    def test_aiohttp_only_options_rejected(self):
+        """Test aiohttp-specific options cannot be combined with a custom transport."""
+        with pytest.raises(ValueError, match="aiohttp transport"):
+            ArubaAPIClient(
+                "https://api.example.com", "valid_key_123",
+                transport=HTTP2Transport, tracer=RequestTracer()
+            )
+    
+    @pytest.mark.asyncio
+    async def test_factory_receives_session_settings(self):
+        """Test the factory is called with headers, timeout and pool size."""
+        created = {}
+        
+        class Recorder:
+            def __init__(self, **kwargs):
+                created.update(kwargs)
+            
+            async def close(self):
+                created["closed"] = True
+        
+        async with ArubaAPIClient(
+            "https://api.example.com", "valid_key_123", timeout=5, max_connections=3, transport=Recorder
+        ) as client:
+            assert isinstance(client.session, Recorder)
+        
+        assert created["headers"]["Authorization"] == "Bearer valid_key_123"
+        assert created["timeout"] == 5
+        assert created["max_connections"] == 3
+        assert created["closed"]
+
+@requires_httpx
+class TestHTTP2Transport:
+    """Test cases for HTTP2Transport."""
+    
+    @pytest.mark.asyncio
+    async def test_request_and_stream(self):
+        """Test responses expose the aiohttp-style status, headers and body."""
+        async with serve() as server:
+            session = HTTP2Transport(headers={"Authorization": "Bearer t"})
+            try:
+                async with session.request("GET", f"{server}/api/v2/devices") as response:
+                    assert response.status == 200
+                    assert response.headers["X-Auth"] == "Bearer t"
+                    assert json.loads(await response.read()) == DEVICES
+                
+                async with session.request(
+                    "GET", f"{server}/api/v2/devices", timeout=aiohttp.ClientTimeout(sock_read=5)
+                ) as response:
+                    chunks = [chunk async for chunk in response.content.iter_chunked(16)]
+                    assert json.loads(b"".join(chunks)) == DEVICES
+                    assert response.content.total_bytes == len(b"".join(chunks))
+            finally:
+                await session.close()
+            assert session.closed
+    
+    @pytest.mark.asyncio
+    async def test_errors_are_mapped(self):
+        """Test httpx failures surface as the errors the client retries on."""
+        async with serve() as server:
+            session = HTTP2Transport(timeout=0.05)
+            try:
+                with pytest.raises(asyncio.TimeoutError):
+                    async with session.request("GET", f"{server}/api/v2/slow"):
+                        pass
+            finally:
+                await session.close()
+        
+        session = HTTP2Transport()
+        try:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                async with session.request("GET", server):
+                    pass
+        finally:
+            await session.close()
+    
+    @pytest.mark.asyncio
+    async def test_client_over_http2_transport(self):
+        """Test the client API works unchanged on the httpx transport."""
+        async with serve() as server:
+            async with ArubaAPIClient(
+                "https://api.example.com", "valid_key_123", requests_per_second=100,
+                transport=HTTP2Transport
+            ) as client:
+                # The local server speaks plain HTTP
+                client._construct_url = lambda endpoint: server + endpoint
+                
+                assert await client._make_request("GET", "/api/v2/devices") == DEVICES
+                assert await client._make_request("POST", "/api/v2/echo", {"a": 1}) == {"a": 1}
+                items = [item async for item in client.stream_items("/api/v2/devices", "devices")]
+                assert items == DEVICES["devices"]
+                
+                with pytest.raises(APIError) as exc_info:
+                    await client._make_request("GET", "/api/v2/missing")
+                assert exc_info.value.status_code == 404
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])